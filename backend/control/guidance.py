@@ -1,5 +1,6 @@
 """Guidance system for autonomous landing."""
 
+import math
 import numpy as np
 from dataclasses import dataclass
 from typing import Tuple, Optional
@@ -7,22 +8,194 @@ from typing import Tuple, Optional
 from physics.constants import (
     GRAVITY,
     ENGINE_THRUST_MAX,
+    INV_ENGINE_THRUST_MAX,
     ENGINE_THROTTLE_MIN,
     ROCKET_DRY_MASS,
     SUICIDE_BURN_MARGIN,
     TERMINAL_VELOCITY_TARGET,
 )
+from physics.engine_kernels import FASTMATH_FLAGS
+from physics.jit import njit, prange
+
+
+# Phase codes returned by the guidance kernel
+PHASE_ENTRY = 0
+PHASE_COAST = 1
+PHASE_LANDING_BURN = 2
+PHASE_NAMES = ("entry", "coast", "landing_burn")
+
+# Landing-burn target descent speed, v = min(2 * sqrt(h), 100), tabulated on a
+# 1 m altitude grid up to the entry-phase ceiling and linearly interpolated.
+_VTARGET_LUT = np.minimum(2.0 * np.sqrt(np.arange(0.0, 3001.0)), 100.0)
+
+# Horizontal deadband: when |vx| + |vz| + |dx| + |dz| is below this (m, m/s),
+# the steering command is a few hundredths of a degree, so it is skipped
+GIMBAL_DEADBAND = 0.01
 
 
 @dataclass
 class GuidanceCommand:
     """Output from guidance system."""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+); one is built per tick
+    __slots__ = ('throttle', 'gimbal_pitch', 'gimbal_yaw', 'phase')
+    
     throttle: float
     gimbal_pitch: float
     gimbal_yaw: float
     phase: str
 
 
+# The kernels below use inf ("can't stop") and NaN ("burn not latched") as
+# markers, so they compile with FASTMATH_FLAGS, which keeps nnan/ninf off
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _suicide_burn_altitude(velocity, mass):
+    """Altitude needed to stop from `velocity` at minimum throttle (see GuidanceSystem)."""
+    # Available thrust at minimum throttle (conservative)
+    thrust = ENGINE_THRUST_MAX * ENGINE_THROTTLE_MIN
+    
+    # Net deceleration (thrust - gravity)
+    decel = (thrust / mass) - GRAVITY
+    
+    if decel <= 0:
+        # Can't slow down - rocket too heavy!
+        return math.inf
+    
+    # Kinematic equation: v² = v₀² + 2as
+    # We want v = 0, so: s = v₀² / (2 * decel)
+    burn_distance = (velocity ** 2) / (2 * decel)
+    
+    # Add safety margin
+    return burn_distance * SUICIDE_BURN_MARGIN
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _guidance_step(px, py, pz, vx, vy, vz, fuel, target_x, target_z,
+                   burn_started, burn_alt):
+    """
+    Scalar guidance kernel.
+    
+    Returns:
+        (throttle, gimbal_pitch, gimbal_yaw, phase_code, burn_started, burn_alt)
+    """
+    altitude = py
+    mass = ROCKET_DRY_MASS + fuel
+    descent_speed = -vy if vy < 0 else 0.0
+    
+    # Calculate when to start landing burn
+    if not burn_started:
+        if altitude <= _suicide_burn_altitude(descent_speed, mass):
+            burn_started = True
+            burn_alt = altitude
+    
+    if altitude > 3000:
+        # Entry phase - no engine, use grid fins (not implemented yet)
+        return 0.0, 0.0, 0.0, PHASE_ENTRY, burn_started, burn_alt
+    
+    if not burn_started:
+        # Coasting phase - falling, waiting for burn
+        return 0.0, 0.0, 0.0, PHASE_COAST, burn_started, burn_alt
+    
+    # Landing burn phase: desired vertical deceleration profile
+    if altitude > 10:
+        # Target velocity profile: v = -k * sqrt(altitude), capped at 100 m/s
+        # This gives approximately constant deceleration
+        idx = int(altitude)
+        if idx < _VTARGET_LUT.shape[0] - 1:
+            lo = _VTARGET_LUT[idx]
+            target_descent_speed = lo + (altitude - idx) * (_VTARGET_LUT[idx + 1] - lo)
+        else:
+            target_descent_speed = 100.0
+    else:
+        # Final approach - very slow
+        target_descent_speed = TERMINAL_VELOCITY_TARGET
+    
+    # Velocity error
+    velocity_error = target_descent_speed - descent_speed
+    
+    # Compute required thrust using feedback control
+    # F = m * (g + desired_decel)
+    desired_decel = -velocity_error * 0.5  # P controller
+    required_thrust = mass * (GRAVITY + desired_decel)
+    
+    # Convert to throttle
+    throttle = min(max(required_thrust * INV_ENGINE_THRUST_MAX, 0.0), 1.0)
+    
+    # If we need thrust but it's below minimum, use minimum
+    if 0 < throttle < ENGINE_THROTTLE_MIN:
+        throttle = ENGINE_THROTTLE_MIN
+    
+    # Horizontal guidance - steer toward landing pad
+    gimbal_pitch = 0.0
+    gimbal_yaw = 0.0
+    dx = target_x - px
+    dz = target_z - pz
+    if (throttle > 0 and altitude > 5
+            and abs(vx) + abs(vz) + abs(dx) + abs(dz) >= GIMBAL_DEADBAND):
+        # Desired horizontal acceleration
+        # a = -k1 * horizontal_velocity - k2 * horizontal_offset
+        k1 = 0.3  # Velocity damping
+        k2 = 0.05  # Position correction
+        
+        accel_x = -k1 * vx + k2 * dx
+        accel_z = -k1 * vz + k2 * dz
+        
+        # Gimbal angles needed (small angle approximation)
+        inv_thrust = mass / (ENGINE_THRUST_MAX * throttle + 1)
+        gimbal_pitch = math.degrees(math.asin(max(-1.0, min(1.0, accel_x * inv_thrust))))
+        gimbal_yaw = math.degrees(math.asin(max(-1.0, min(1.0, accel_z * inv_thrust))))
+        
+        gimbal_pitch = max(-5.0, min(5.0, gimbal_pitch))
+        gimbal_yaw = max(-5.0, min(5.0, gimbal_yaw))
+    
+    return throttle, gimbal_pitch, gimbal_yaw, PHASE_LANDING_BURN, burn_started, burn_alt
+
+
+# Warm up (compile or load from cache) at import time
+_guidance_step(0.0, 100.0, 0.0, 0.0, -50.0, 0.0, 1000.0, 0.0, 0.0, False, math.nan)
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS, parallel=True)
+def _guidance_batch(states, burn_started, burn_alt, target_x, target_z, commands):
+    """Run the guidance kernel over a batch of rockets (one row each), in place."""
+    for i in prange(states.shape[0]):
+        s = states[i]
+        throttle, gimbal_pitch, gimbal_yaw, phase, started, alt = _guidance_step(
+            s[0], s[1], s[2], s[3], s[4], s[5], s[6],
+            target_x, target_z, burn_started[i], burn_alt[i]
+        )
+        commands[i, 0] = throttle
+        commands[i, 1] = gimbal_pitch
+        commands[i, 2] = gimbal_yaw
+        commands[i, 3] = phase
+        burn_started[i] = started
+        burn_alt[i] = alt
+
+
+def compute_commands_batch(states: np.ndarray, burn_started: np.ndarray,
+                           burn_alt: np.ndarray,
+                           target: Tuple[float, float] = (0.0, 0.0)) -> np.ndarray:
+    """
+    Compute guidance commands for many rockets in one compiled call.
+    
+    Used by SessionPool for all guided sessions of a tick, in place of one
+    GuidanceSystem.compute_command call per session.
+    
+    Args:
+        states: (N, 7) float64 array of [x, y, z, vx, vy, vz, fuel]
+        burn_started: (N,) bool array of landing-burn latches (updated in place)
+        burn_alt: (N,) float64 array of burn start altitudes, NaN if not
+            started (updated in place)
+        target: Landing pad (x, z) position
+        
+    Returns:
+        (N, 4) array of [throttle, gimbal_pitch, gimbal_yaw, phase_code]
+    """
+    commands = np.empty((states.shape[0], 4))
+    _guidance_batch(np.ascontiguousarray(states, dtype=np.float64), burn_started, burn_alt,
+                    float(target[0]), float(target[1]), commands)
+    return commands
+
+
 class GuidanceSystem:
     """
     Autonomous guidance for rocket landing.
@@ -39,6 +212,27 @@ class GuidanceSystem:
         self.landing_burn_started = False
         self.landing_burn_altitude = None
     
+    def get_burn_latch(self) -> Tuple[bool, float]:
+        """
+        Landing-burn latch in the layout of compute_commands_batch.
+        
+        Returns:
+            (burn_started, burn_altitude), altitude NaN if not started
+        """
+        burn_altitude = self.landing_burn_altitude
+        return self.landing_burn_started, math.nan if burn_altitude is None else burn_altitude
+    
+    def set_burn_latch(self, burn_started: bool, burn_altitude: float):
+        """
+        Store a landing-burn latch updated by the guidance kernel.
+        
+        Args:
+            burn_started: Whether the landing burn has started
+            burn_altitude: Burn start altitude (ignored if not started)
+        """
+        self.landing_burn_started = bool(burn_started)
+        self.landing_burn_altitude = float(burn_altitude) if burn_started else None
+    
     def compute_suicide_burn_altitude(self, velocity: float, mass: float) -> float:
         """
         Calculate altitude at which to start the landing burn (suicide burn).
@@ -46,22 +240,7 @@ class GuidanceSystem:
         This computes the minimum altitude needed to decelerate to zero
         velocity at ground level, assuming constant max thrust.
         """
-        # Available thrust at minimum throttle (conservative)
-        thrust = ENGINE_THRUST_MAX * ENGINE_THROTTLE_MIN
-        
-        # Net deceleration (thrust - gravity)
-        decel = (thrust / mass) - GRAVITY
-        
-        if decel <= 0:
-            # Can't slow down - rocket too heavy!
-            return float('inf')
-        
-        # Kinematic equation: v² = v₀² + 2as
-        # We want v = 0, so: s = v₀² / (2 * decel)
-        burn_distance = (velocity ** 2) / (2 * decel)
-        
-        # Add safety margin
-        return burn_distance * SUICIDE_BURN_MARGIN
+        return _suicide_burn_altitude(float(velocity), float(mass))
     
     def compute_command(self, position: np.ndarray, velocity: np.ndarray,
                         orientation: np.ndarray, fuel: float,
@@ -75,114 +254,24 @@ class GuidanceSystem:
             orientation: Current orientation quaternion
             fuel: Remaining fuel mass
             dt: Time step
-            
+        
         Returns:
             GuidanceCommand with throttle and gimbal settings
         """
-        altitude = position[1]
-        vertical_velocity = velocity[1]  # Negative when descending
-        horizontal_velocity = np.array([velocity[0], 0, velocity[2]])
-        horizontal_speed = np.linalg.norm(horizontal_velocity)
-        
-        mass = ROCKET_DRY_MASS + fuel
-        descent_speed = -vertical_velocity if vertical_velocity < 0 else 0
-        
-        # Calculate when to start landing burn
-        if not self.landing_burn_started:
-            burn_altitude = self.compute_suicide_burn_altitude(descent_speed, mass)
-            
-            if altitude <= burn_altitude:
-                self.landing_burn_started = True
-                self.landing_burn_altitude = altitude
-        
-        # Determine phase and compute commands
-        if altitude > 3000:
-            # Entry phase - no engine, use grid fins (not implemented yet)
-            return GuidanceCommand(
-                throttle=0.0,
-                gimbal_pitch=0.0,
-                gimbal_yaw=0.0,
-                phase="entry"
-            )
-        
-        elif not self.landing_burn_started:
-            # Coasting phase - falling, waiting for burn
-            return GuidanceCommand(
-                throttle=0.0,
-                gimbal_pitch=0.0,
-                gimbal_yaw=0.0,
-                phase="coast"
-            )
-        
-        else:
-            # Landing burn phase
-            return self._compute_landing_burn(
-                position, velocity, mass, altitude, descent_speed, horizontal_speed
-            )
-    
-    def _compute_landing_burn(self, position: np.ndarray, velocity: np.ndarray,
-                               mass: float, altitude: float,
-                               descent_speed: float, horizontal_speed: float) -> GuidanceCommand:
-        """Compute commands during landing burn."""
-        
-        # Desired vertical deceleration profile
-        if altitude > 10:
-            # Target velocity profile: v = -k * sqrt(altitude)
-            # This gives approximately constant deceleration
-            target_descent_speed = 2.0 * np.sqrt(altitude)
-            target_descent_speed = min(target_descent_speed, 100)  # Cap at 100 m/s
-        else:
-            # Final approach - very slow
-            target_descent_speed = TERMINAL_VELOCITY_TARGET
-        
-        # Velocity error
-        velocity_error = target_descent_speed - descent_speed
-        
-        # Compute required thrust using feedback control
-        # F = m * (g + desired_decel)
-        desired_decel = -velocity_error * 0.5  # P controller
-        required_thrust = mass * (GRAVITY + desired_decel)
-        
-        # Convert to throttle
-        throttle = required_thrust / ENGINE_THRUST_MAX
-        throttle = np.clip(throttle, 0.0, 1.0)
-        
-        # If we need thrust but it's below minimum, use minimum
-        if 0 < throttle < ENGINE_THROTTLE_MIN:
-            throttle = ENGINE_THROTTLE_MIN
-        
-        # Horizontal guidance - steer toward landing pad
-        horizontal_offset = self.target_position - position
-        horizontal_offset[1] = 0  # Only horizontal components
-        
-        # Compute desired gimbal to cancel horizontal velocity and move toward pad
-        if throttle > 0 and altitude > 5:
-            # Desired horizontal acceleration
-            # a = -k1 * horizontal_velocity - k2 * horizontal_offset
-            k1 = 0.3  # Velocity damping
-            k2 = 0.05  # Position correction
-            
-            desired_horizontal_accel = -k1 * velocity[[0, 2]] + k2 * horizontal_offset[[0, 2]]
-            
-            # Gimbal angles needed (small angle approximation)
-            gimbal_pitch = np.degrees(np.arcsin(np.clip(
-                desired_horizontal_accel[0] * mass / (ENGINE_THRUST_MAX * throttle + 1),
-                -1, 1
-            )))
-            gimbal_yaw = np.degrees(np.arcsin(np.clip(
-                desired_horizontal_accel[1] * mass / (ENGINE_THRUST_MAX * throttle + 1),
-                -1, 1
-            )))
-            
-            gimbal_pitch = np.clip(gimbal_pitch, -5, 5)
-            gimbal_yaw = np.clip(gimbal_yaw, -5, 5)
-        else:
-            gimbal_pitch = 0.0
-            gimbal_yaw = 0.0
+        burn_started, burn_altitude = self.get_burn_latch()
+        throttle, gimbal_pitch, gimbal_yaw, phase, burn_started, burn_altitude = _guidance_step(
+            float(position[0]), float(position[1]), float(position[2]),
+            float(velocity[0]), float(velocity[1]), float(velocity[2]),
+            float(fuel),
+            float(self.target_position[0]), float(self.target_position[2]),
+            burn_started,
+            burn_altitude,
+        )
+        self.set_burn_latch(burn_started, burn_altitude)
         
         return GuidanceCommand(
             throttle=throttle,
             gimbal_pitch=gimbal_pitch,
             gimbal_yaw=gimbal_yaw,
-            phase="landing_burn"
+            phase=PHASE_NAMES[phase]
         )
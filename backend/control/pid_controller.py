@@ -1,7 +1,36 @@
 """PID Controller implementation for rocket control loops."""
 
 from dataclasses import dataclass
-import numpy as np
+
+from physics.engine_kernels import FASTMATH_FLAGS
+from physics.jit import njit
+
+
+# FASTMATH_FLAGS keeps nnan/ninf off, so the output clamps stay defined for
+# a NaN or infinite error input
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _pid_step(kp, ki, kd, integral, prev_err, err, dt, out_min, out_max, int_max):
+    """
+    Scalar PID update kernel.
+    
+    Returns:
+        (output, new_integral, new_prev_err)
+    """
+    # Integral term with anti-windup
+    integral = min(max(integral + err * dt, -int_max), int_max)
+    
+    # Derivative term (on error)
+    if dt > 0:
+        derivative = (err - prev_err) / dt
+    else:
+        derivative = 0.0
+    
+    output = kp * err + ki * integral + kd * derivative
+    return min(max(output, out_min), out_max), integral, err
+
+
+# Warm up (compile or load from cache) at import time
+_pid_step(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, -1.0, 1.0, 1.0)
 
 
 @dataclass
@@ -43,27 +72,12 @@ class PIDController:
         """
         error = setpoint - measured
         
-        # Proportional term
-        p_term = self.kp * error
-        
-        # Integral term with anti-windup
-        self.integral += error * dt
-        self.integral = np.clip(self.integral, -self.integral_max, self.integral_max)
-        i_term = self.ki * self.integral
-        
-        # Derivative term (on error)
-        if dt > 0:
-            derivative = (error - self.previous_error) / dt
-        else:
-            derivative = 0.0
-        d_term = self.kd * derivative
-        
-        self.previous_error = error
-        
-        # Total output
-        output = p_term + i_term + d_term
-        
-        return np.clip(output, self.output_min, self.output_max)
+        output, self.integral, self.previous_error = _pid_step(
+            self.kp, self.ki, self.kd,
+            self.integral, self.previous_error, error, dt,
+            self.output_min, self.output_max, self.integral_max
+        )
+        return output
 
 
 class AttitudeController:
@@ -1,3 +1,4 @@
 from .session import GameSession
-from .scoring import calculate_score
+from .pool import SessionPool
+from .scoring import calculate_score, calculate_scores_batch
 
@@ -1,9 +1,15 @@
 """Flight data recorder for post-flight analysis."""
 
-from dataclasses import dataclass, field
+import logging
+import math
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any
 import numpy as np
 
+from physics.transformations import tilt_from_quaternion
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class FlightDataPoint:
@@ -25,6 +31,19 @@ class FlightDataPoint:
     acceleration: float = 0.0  # Vertical acceleration (m/s²)
 
 
+# Column layout of the recorder buffers (one array per FlightDataPoint field)
+DATA_POINT_FIELDS = tuple(f.name for f in fields(FlightDataPoint))
+NUMERIC_FIELDS = tuple(name for name in DATA_POINT_FIELDS if name != 'phase')
+
+# Initial number of samples allocated per column (grown by doubling)
+INITIAL_CAPACITY = 1024
+
+# Upper bound on samples kept per column. Once reached, the recording is
+# decimated 2:1 in place, so older parts of long flights end up at
+# progressively lower rates while memory stays bounded.
+MAX_CAPACITY = 8192
+
+
 @dataclass
 class FlightEvent:
     """Significant event during flight."""
@@ -47,21 +66,58 @@ class FlightRecorder:
         """
         self.sample_interval = sample_interval  # Target time interval (seconds)
         self.last_sample_time = 0.0  # Last time we recorded a sample
-        self.data_points: List[FlightDataPoint] = []
+        self._allocate(INITIAL_CAPACITY)
         self.events: List[FlightEvent] = []
         self.recording = False
+        # Cached to_dict() result, cleared whenever the recording changes
+        self._export = None
         
         # Track previous state for event detection
         self.prev_throttle = 0.0
         self.prev_phase = "descent"
         self.prev_legs_deployed = False
         
+    def _allocate(self, capacity: int):
+        """Allocate empty column buffers (Structure-of-Arrays layout)."""
+        self._capacity = capacity
+        self._n = 0
+        self._buf = {name: np.empty(capacity, dtype=np.float64) for name in NUMERIC_FIELDS}
+        self._phase = np.empty(capacity, dtype=object)
+        
+    def _grow(self):
+        """Double the capacity of every column buffer, keeping recorded samples."""
+        n = self._n
+        capacity = self._capacity * 2
+        for name, column in self._buf.items():
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:n] = column[:n]
+            self._buf[name] = grown
+        phase = np.empty(capacity, dtype=object)
+        phase[:n] = self._phase[:n]
+        self._phase = phase
+        self._capacity = capacity
+        
+    def _decimate(self):
+        """Keep every other recorded sample (first sample is always kept)."""
+        n = self._n
+        kept = (n + 1) // 2
+        for column in self._buf.values():
+            column[:kept] = column[:n:2]
+        self._phase[:kept] = self._phase[:n:2]
+        self._n = kept
+        
+    @property
+    def num_points(self) -> int:
+        """Number of recorded data points."""
+        return self._n
+        
     def start_recording(self):
         """Start recording flight data."""
-        print("[FlightRecorder] Starting recording...")
+        logger.info("Starting flight recording")
         self.recording = True
-        self.data_points = []
+        self._n = 0
         self.events = []
+        self._export = None
         self.last_sample_time = 0.0
         self.prev_throttle = 0.0
         self.prev_phase = "descent"
@@ -69,7 +125,8 @@ class FlightRecorder:
         
     def stop_recording(self):
         """Stop recording flight data."""
-        print(f"[FlightRecorder] Stopping recording. Total data points: {len(self.data_points)}, Events: {len(self.events)}")
+        if self.recording:
+            logger.info("Stopping flight recording. Data points: %d, events: %d", self._n, len(self.events))
         self.recording = False
         
     def record_frame(self, state, time: float, geometry=None):
@@ -77,75 +134,53 @@ class FlightRecorder:
         Record a frame of flight data.
         
         Args:
-            state: RocketState object
+            state: RocketState object (derived speed/tilt already refreshed by the engine)
             time: Current simulation time (seconds)
             geometry: RocketGeometry object (optional, for mass calculation)
         """
         if not self.recording:
             return
         
-        # Calculate time since last sample
-        time_since_last_sample = time - self.last_sample_time
-        
-        # Smart sampling: Always record if there's control input OR if interval has passed
-        has_control_input = (state.throttle > 0 or 
-                            abs(state.gimbal[0]) > 0.1 or 
-                            abs(state.gimbal[1]) > 0.1)
-        is_time_to_sample = time_since_last_sample >= self.sample_interval
-        
-        # Record if there's activity OR if it's time for a scheduled sample
-        if not (has_control_input or is_time_to_sample):
-            return
+        # Smart sampling: Always record if there's control input OR if interval has passed.
+        # The scheduled-sample test is a plain float compare, so it goes first and
+        # the control-input checks only run between scheduled samples.
+        if time - self.last_sample_time < self.sample_interval:
+            gimbal = state.gimbal
+            if not (state.throttle > 0 or abs(gimbal[0]) > 0.1 or abs(gimbal[1]) > 0.1):
+                return
         
         # Update last sample time
         self.last_sample_time = time
+        self._export = None
         
-        # Debug: Log first few recordings
-        if len(self.data_points) < 5:
-            print(f"[FlightRecorder] Recording frame at t={time:.2f}s, throttle={state.throttle:.2f}, alt={state.position[1]:.1f}m, fuel={state.fuel:.0f}kg")
-            
-        # Calculate derived values
-        horizontal_speed = float(np.sqrt(state.velocity[0]**2 + state.velocity[2]**2))
-        total_speed = float(np.linalg.norm(state.velocity))
-        
-        # Calculate tilt angle
-        # Assuming state has orientation quaternion
-        up_body = np.array([0.0, 1.0, 0.0])
-        # Simple quaternion rotation for up vector
-        q = state.orientation
-        w, x, y, z = q[0], q[1], q[2], q[3]
-        up_world = np.array([
-            2*(x*z + w*y),
-            1 - 2*(x*x + z*z),
-            2*(y*z - w*x)
-        ])
-        tilt_angle = float(np.degrees(np.arccos(np.clip(up_world[1], -1, 1))))
-        
-        # Calculate total mass
-        if geometry:
-            total_mass = float(geometry.get_mass(state.fuel))
-        else:
-            total_mass = 0.0  # Unknown if geometry not provided
+        # Calculate total mass (0.0 = unknown if geometry not provided)
+        total_mass = geometry.get_mass(state.fuel) if geometry else 0.0
         
-        # Record data point
-        data_point = FlightDataPoint(
-            time=time,
-            altitude=float(state.position[1]),
-            vertical_speed=float(state.velocity[1]),
-            horizontal_speed=horizontal_speed,
-            total_speed=total_speed,
-            position_x=float(state.position[0]),
-            position_z=float(state.position[2]),
-            fuel=float(state.fuel),
-            throttle=float(state.throttle),
-            gimbal_pitch=float(state.gimbal[0]),
-            gimbal_yaw=float(state.gimbal[1]),
-            tilt_angle=tilt_angle,
-            phase=state.phase,
-            mass=total_mass,
-            acceleration=float(state.acceleration[1])  # Vertical acceleration
-        )
-        self.data_points.append(data_point)
+        # Record data point (one write per column)
+        n = self._n
+        if n == self._capacity:
+            if self._capacity < MAX_CAPACITY:
+                self._grow()
+            else:
+                self._decimate()
+                n = self._n
+        buf = self._buf
+        buf['time'][n] = time
+        buf['altitude'][n] = state.position[1]
+        buf['vertical_speed'][n] = state.velocity[1]
+        buf['horizontal_speed'][n] = state.horizontal_speed
+        buf['total_speed'][n] = state.total_speed
+        buf['position_x'][n] = state.position[0]
+        buf['position_z'][n] = state.position[2]
+        buf['fuel'][n] = state.fuel
+        buf['throttle'][n] = state.throttle
+        buf['gimbal_pitch'][n] = state.gimbal[0]
+        buf['gimbal_yaw'][n] = state.gimbal[1]
+        buf['tilt_angle'][n] = state.tilt_angle
+        buf['mass'][n] = total_mass
+        buf['acceleration'][n] = state.acceleration[1]  # Vertical acceleration
+        self._phase[n] = state.phase
+        self._n = n + 1
         
         # Detect and record events
         self._detect_events(state, time)
@@ -168,7 +203,7 @@ class FlightRecorder:
                 time=time,
                 event_type='landing_burn',
                 description='Landing burn initiated',
-                data={'altitude': float(state.position[1]), 'speed': float(np.linalg.norm(state.velocity))}
+                data={'altitude': float(state.position[1]), 'speed': float(state.total_speed)}
             ))
             
         # Landing legs deployment
@@ -188,7 +223,8 @@ class FlightRecorder:
     def add_touchdown_event(self, state, time: float):
         """Add touchdown event with final statistics."""
         touchdown_speed = float(state.touchdown_velocity)
-        horizontal_distance = float(np.sqrt(state.position[0]**2 + state.position[2]**2))
+        horizontal_distance = math.sqrt(float(state.position[0])**2 + float(state.position[2])**2)
+        self._export = None
         
         self.events.append(FlightEvent(
             time=time,
@@ -206,49 +242,43 @@ class FlightRecorder:
     def _calculate_tilt(self, state) -> float:
         """Calculate tilt angle from state."""
         q = state.orientation
-        w, x, y, z = q[0], q[1], q[2], q[3]
-        up_world = np.array([
-            2*(x*z + w*y),
-            1 - 2*(x*x + z*z),
-            2*(y*z - w*x)
-        ])
-        return float(np.degrees(np.arccos(np.clip(up_world[1], -1, 1))))
+        return tilt_from_quaternion(float(q[0]), float(q[1]), float(q[2]), float(q[3]))
         
     def get_statistics(self) -> Dict[str, Any]:
         """Calculate flight statistics from recorded data."""
-        if not self.data_points:
+        n = self._n
+        if n == 0:
             return {}
             
-        # Calculate statistics
-        throttle_values = [dp.throttle for dp in self.data_points]
-        altitude_values = [dp.altitude for dp in self.data_points]
-        speed_values = [dp.total_speed for dp in self.data_points]
+        buf = self._buf
+        throttle = buf['throttle'][:n]
         
         # Fuel consumption
-        initial_fuel = self.data_points[0].fuel if self.data_points else 0
-        final_fuel = self.data_points[-1].fuel if self.data_points else 0
+        initial_fuel = float(buf['fuel'][0])
+        final_fuel = float(buf['fuel'][n - 1])
         fuel_used = initial_fuel - final_fuel
         
         # Engine usage
-        engine_on_frames = sum(1 for dp in self.data_points if dp.throttle > 0)
-        total_frames = len(self.data_points)
-        engine_usage_percent = (engine_on_frames / total_frames * 100) if total_frames > 0 else 0
+        engine_on = throttle > 0
+        engine_on_frames = int(np.count_nonzero(engine_on))
+        engine_usage_percent = engine_on_frames / n * 100
         
         # Average throttle when engine is on
-        throttle_when_on = [dp.throttle for dp in self.data_points if dp.throttle > 0]
-        avg_throttle = np.mean(throttle_when_on) if throttle_when_on else 0
+        avg_throttle = float(throttle.sum(where=engine_on) / engine_on_frames) if engine_on_frames else 0
         
         # Max values
-        max_speed = max(speed_values) if speed_values else 0
-        max_throttle = max(throttle_values) if throttle_values else 0
-        max_tilt = max(dp.tilt_angle for dp in self.data_points) if self.data_points else 0
+        max_speed = float(buf['total_speed'][:n].max())
+        max_throttle = float(throttle.max())
+        max_tilt = float(buf['tilt_angle'][:n].max())
         
         # Gimbal usage
-        gimbal_usage = sum(1 for dp in self.data_points if abs(dp.gimbal_pitch) > 0.1 or abs(dp.gimbal_yaw) > 0.1)
-        gimbal_usage_percent = (gimbal_usage / total_frames * 100) if total_frames > 0 else 0
+        gimbal_usage = int(np.count_nonzero(
+            (np.abs(buf['gimbal_pitch'][:n]) > 0.1) | (np.abs(buf['gimbal_yaw'][:n]) > 0.1)
+        ))
+        gimbal_usage_percent = gimbal_usage / n * 100
         
         return {
-            'total_time': self.data_points[-1].time if self.data_points else 0,
+            'total_time': float(buf['time'][n - 1]),
             'initial_fuel': initial_fuel,
             'final_fuel': final_fuel,
             'fuel_used': fuel_used,
@@ -259,33 +289,28 @@ class FlightRecorder:
             'max_speed': max_speed,
             'max_tilt_angle': max_tilt,
             'gimbal_usage_percent': gimbal_usage_percent,
-            'total_data_points': len(self.data_points),
+            'total_data_points': n,
             'events_count': len(self.events)
         }
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert flight recording to dictionary for JSON serialization."""
-        return {
-            'data_points': [
-                {
-                    'time': dp.time,
-                    'altitude': dp.altitude,
-                    'vertical_speed': dp.vertical_speed,
-                    'horizontal_speed': dp.horizontal_speed,
-                    'total_speed': dp.total_speed,
-                    'position_x': dp.position_x,
-                    'position_z': dp.position_z,
-                    'fuel': dp.fuel,
-                    'throttle': dp.throttle,
-                    'gimbal_pitch': dp.gimbal_pitch,
-                    'gimbal_yaw': dp.gimbal_yaw,
-                    'tilt_angle': dp.tilt_angle,
-                    'phase': dp.phase,
-                    'mass': dp.mass,
-                    'acceleration': dp.acceleration
-                }
-                for dp in self.data_points
-            ],
+        """
+        Convert flight recording to dictionary for JSON serialization.
+        
+        Data points are exported column-wise: 'data_points' maps each
+        FlightDataPoint field name to the list of its recorded values.
+        The result is cached until the recording changes, so repeated calls
+        after touchdown return the same (unmodified) dictionary.
+        """
+        if self._export is not None:
+            return self._export
+        
+        n = self._n
+        self._export = {
+            'data_points': {
+                name: self._phase[:n].tolist() if name == 'phase' else self._buf[name][:n].tolist()
+                for name in DATA_POINT_FIELDS
+            },
             'events': [
                 {
                     'time': event.time,
@@ -297,4 +322,4 @@ class FlightRecorder:
             ],
             'statistics': self.get_statistics()
         }
-
+        return self._export
@@ -0,0 +1,136 @@
+"""Batched stepping of all active game sessions."""
+
+from typing import List
+
+import numpy as np
+
+from physics.engine_kernels import STATE_SIZE, PARAM_SIZE, step_6dof_batch
+from control.guidance import GuidanceCommand, PHASE_NAMES, compute_commands_batch
+from game.session import GameSession
+
+
+class SessionPool:
+    """
+    Advances every active session with one compiled physics call per tick.
+    
+    Session states are packed into Structure-of-Arrays buffers (one row per
+    rocket), guidance commands for autonomous/assisted sessions are computed
+    in a single batched call, and the 6-DOF step runs over all rows in
+    parallel. Per-session bookkeeping (landing checks, recording, scoring)
+    stays on the session objects.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        self.capacity = 0
+        self.states = None
+        self.params = None
+        self.wind = None
+        self._ensure_capacity(capacity)
+    
+    def _ensure_capacity(self, n: int):
+        """Grow the SoA buffers (doubling) to hold at least n rows."""
+        if n <= self.capacity:
+            return
+        capacity = max(n, 2 * self.capacity)
+        self.states = np.zeros((capacity, STATE_SIZE))
+        self.params = np.zeros((capacity, PARAM_SIZE))
+        self.wind = np.zeros((capacity, 2))
+        self.capacity = capacity
+    
+    def step_all(self, sessions: List[GameSession], now: float = None) -> List[dict]:
+        """
+        Process one game tick for every session.
+        
+        Equivalent to calling session.tick() on each, with guidance and
+        6-DOF physics batched across sessions.
+        
+        Args:
+            sessions: Sessions to advance
+            now: Current time.monotonic() value for all sessions (read per
+                session if not given)
+        
+        Returns:
+            Game state dictionaries, in the same order as sessions
+        """
+        flying = [session for session in sessions if session.prepare_tick(now)]
+        
+        self._apply_controls(flying)
+        
+        # Engines on the simplified model step on their own
+        batched = []
+        for session in flying:
+            if session.physics.use_6dof:
+                batched.append(session)
+            else:
+                session.physics.step()
+        
+        if batched:
+            self._step_physics(batched)
+        
+        return [session.get_state() for session in sessions]
+    
+    def _apply_controls(self, sessions: List[GameSession]):
+        """Apply control inputs, running guidance for all guided sessions at once."""
+        guided = []
+        for session in sessions:
+            if session.guided:
+                guided.append(session)
+            else:
+                session.apply_control()
+        
+        if not guided:
+            return
+        
+        n = len(guided)
+        guidance_states = np.empty((n, 7))
+        burn_started = np.empty(n, dtype=np.bool_)
+        burn_alt = np.empty(n)
+        for i, session in enumerate(guided):
+            state = session.physics.state
+            guidance_states[i, 0:3] = state.position
+            guidance_states[i, 3:6] = state.velocity
+            guidance_states[i, 6] = state.fuel
+            burn_started[i], burn_alt[i] = session.get_guidance_latch()
+        
+        # All sessions land on the pad at the origin
+        commands = compute_commands_batch(guidance_states, burn_started, burn_alt)
+        
+        for i, session in enumerate(guided):
+            session.set_guidance_latch(burn_started[i], burn_alt[i])
+            throttle, gimbal_pitch, gimbal_yaw, phase = commands[i]
+            session.apply_control(GuidanceCommand(
+                throttle=float(throttle),
+                gimbal_pitch=float(gimbal_pitch),
+                gimbal_yaw=float(gimbal_yaw),
+                phase=PHASE_NAMES[int(phase)]
+            ))
+    
+    def _step_physics(self, sessions: List[GameSession]):
+        """Pack, advance and unpack the 6-DOF state of every session."""
+        n = len(sessions)
+        self._ensure_capacity(n)
+        states = self.states[:n]
+        params = self.params[:n]
+        wind = self.wind[:n]
+        
+        # Engines can use different time steps (dt_multiplier): order rows
+        # by dt so each step size is one contiguous batch call
+        sessions = sorted(sessions, key=lambda session: session.physics.dt)
+        for row, session in enumerate(sessions):
+            physics = session.physics
+            wind[row] = physics.sample_wind()
+            physics.pack_state(states[row])
+            params[row] = physics.kernel_params
+        
+        start = 0
+        while start < n:
+            dt = sessions[start].physics.dt
+            end = start + 1
+            while end < n and sessions[end].physics.dt == dt:
+                end += 1
+            step_6dof_batch(states[start:end], params[start:end], wind[start:end], dt)
+            start = end
+        
+        for row, session in enumerate(sessions):
+            session.physics.unpack_state(states[row])
+            session.physics.finish_step()
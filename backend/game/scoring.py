@@ -1,5 +1,7 @@
 """Scoring system for the rocket landing game."""
 
+from math import sqrt
+
 import numpy as np
 from physics.constants import (
     ROCKET_FUEL_MASS,
@@ -8,6 +10,12 @@ from physics.constants import (
 )
 
 
+# Velocity bonus (0-2000). Touchdown velocity is currently taken as the
+# landing limit itself, so the bonus is a constant folded at import.
+_TOUCHDOWN_VELOCITY = MAX_LANDING_VELOCITY_VERTICAL
+VELOCITY_SCORE = max(0, int(2000 * (1 - _TOUCHDOWN_VELOCITY / (MAX_LANDING_VELOCITY_VERTICAL * 2))))
+
+
 def calculate_score(state, elapsed_time: float) -> int:
     """
     Calculate the final score for a landing attempt.
@@ -30,7 +38,7 @@ def calculate_score(state, elapsed_time: float) -> int:
     score = 0
     
     # Landing accuracy bonus (0-3000)
-    horizontal_distance = np.sqrt(state.position[0]**2 + state.position[2]**2)
+    horizontal_distance = sqrt(state.position[0]**2 + state.position[2]**2)
     if horizontal_distance <= LANDING_PAD_RADIUS:
         # Perfect landing = 3000, edge of pad = 1500
         accuracy_score = int(3000 * (1 - horizontal_distance / LANDING_PAD_RADIUS))
@@ -38,11 +46,8 @@ def calculate_score(state, elapsed_time: float) -> int:
         accuracy_score = 0
     score += accuracy_score
     
-    # Velocity bonus (0-2000)
-    touchdown_velocity = MAX_LANDING_VELOCITY_VERTICAL
-    velocity_score = int(2000 * (1 - touchdown_velocity / (MAX_LANDING_VELOCITY_VERTICAL * 2)))
-    velocity_score = max(0, velocity_score)
-    score += velocity_score
+    # Velocity bonus (0-2000, precomputed)
+    score += VELOCITY_SCORE
     
     # Fuel efficiency bonus (0-2000)
     fuel_remaining_percent = state.fuel / ROCKET_FUEL_MASS
@@ -63,3 +68,47 @@ def calculate_score(state, elapsed_time: float) -> int:
     score += time_score
     
     return score
+
+
+def calculate_scores_batch(crashed: np.ndarray, landed: np.ndarray,
+                           position_x: np.ndarray, position_z: np.ndarray,
+                           fuel: np.ndarray, elapsed_time: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_score for many end states (e.g. Monte-Carlo sweeps).
+    
+    Args:
+        crashed: Crash flags
+        landed: Landed flags
+        position_x: Final x positions (m)
+        position_z: Final z positions (m)
+        fuel: Remaining fuel (kg)
+        elapsed_time: Flight times (s)
+        
+    Returns:
+        int32 array of scores, identical to calculate_score per element
+    """
+    position_x = np.asarray(position_x, dtype=np.float64)
+    position_z = np.asarray(position_z, dtype=np.float64)
+    elapsed_time = np.asarray(elapsed_time, dtype=np.float64)
+    scored = np.asarray(landed, dtype=bool) & ~np.asarray(crashed, dtype=bool)
+    
+    # Landing accuracy bonus (0-3000)
+    horizontal_distance = np.sqrt(position_x**2 + position_z**2)
+    accuracy_score = np.where(
+        horizontal_distance <= LANDING_PAD_RADIUS,
+        np.trunc(3000 * (1 - horizontal_distance / LANDING_PAD_RADIUS)),
+        0.0
+    )
+    
+    # Fuel efficiency bonus (0-2000)
+    fuel_score = np.trunc(2000 * (np.asarray(fuel, dtype=np.float64) / ROCKET_FUEL_MASS))
+    
+    # Time bonus (0-1500)
+    time_score = np.where(
+        elapsed_time < 30, 1500.0,
+        np.where(elapsed_time > 90, 0.0, np.trunc(1500 * (90 - elapsed_time) / 60))
+    )
+    
+    # Velocity (precomputed) and attitude (1500) bonuses are constant
+    score = accuracy_score + fuel_score + time_score + (VELOCITY_SCORE + 1500)
+    return np.where(scored, score, 0.0).astype(np.int32)
@@ -1,15 +1,31 @@
 """Game session management."""
 
 import asyncio
+import logging
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from enum import Enum
 
+import numpy as np
+import orjson
+
 from physics.engine import PhysicsEngine, RocketState
+from physics.geometry import get_shared_geometry
+from physics.aerodynamics import get_shared_aerodynamics
+from physics.wind import WindConfig
 from game.scoring import calculate_score
 from game.flight_recorder import FlightRecorder
 
+logger = logging.getLogger(__name__)
+
+# orjson options for broadcast frames (state dicts may hold NumPy scalars)
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Pre-encoded envelopes for per-tick frames: only the payload is serialized
+_STATE_PREFIX = b'{"type":"state","data":'
+_DELTA_PREFIX = b'{"type":"delta","data":'
+
 
 class GameMode(str, Enum):
     MANUAL = "manual"
@@ -34,12 +50,18 @@ class GameSession:
     control, and game state.
     """
     
+    __slots__ = (
+        'session_id', 'config', 'flight_recorder', 'physics', 'guidance',
+        'running', 'paused', 'start_time', 'end_time', 'score', 'finished',
+        'manual_throttle', 'manual_gimbal', 'guided', '_apply_input',
+        '_state_callback', '_cached_geometry_data', '_last_sent',
+    )
+    
     def __init__(self, session_id: str, config: GameConfig = None):
         self.session_id = session_id
         self.config = config or GameConfig()
         
         # Initialize wind configuration
-        from physics.wind import WindConfig
         # Clamp wind level to 0-9 (0 = disabled, 1-9 = Beaufort scale)
         clamped_wind_level = max(0, min(9, self.config.wind_level))
         wind_config = WindConfig(
@@ -49,31 +71,34 @@ class GameSession:
             seed=None  # Random seed for each run (different each time)
         )
         
-        # Initialize rocket configuration
-        from physics.geometry import RocketPresets, RocketConfig
+        # Initialize rocket geometry (shared read-only per preset)
         try:
-            rocket_config = RocketPresets.get_preset(self.config.rocket_preset)
+            geometry = get_shared_geometry(self.config.rocket_preset)
         except ValueError:
             # Fall back to default if invalid preset
-            rocket_config = RocketPresets.get_preset("falcon9_block5_landing")
+            geometry = get_shared_geometry("falcon9_block5_landing")
         
         # Initialize flight recorder
         self.flight_recorder = FlightRecorder(sample_interval=0.05)  # Record every 0.05 seconds (20 Hz)
         
         # Initialize subsystems
-        self.physics = PhysicsEngine(rocket_config=rocket_config, wind_config=wind_config, flight_recorder=self.flight_recorder, difficulty=self.config.difficulty)
+        self.physics = PhysicsEngine(wind_config=wind_config, flight_recorder=self.flight_recorder, difficulty=self.config.difficulty,
+                                     initial_altitude=self.config.initial_altitude, geometry=geometry,
+                                     aerodynamics=get_shared_aerodynamics())
         self.guidance = None  # Lazy load to avoid circular import
         
         # Game state
         self.running = False
         self.paused = False
+        # Wall-clock start/end (time.monotonic(); scores use simulated time)
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.score: int = 0
+        self.finished = False  # Landed/crashed and scored; no more physics until reset
         
         # Control inputs (for manual mode)
         self.manual_throttle: float = 0.0
-        self.manual_gimbal: tuple = (0.0, 0.0)
+        self.manual_gimbal = np.zeros(2)  # Updated in place by set_input
         
         # State broadcast callback
         self._state_callback: Optional[Callable] = None
@@ -81,8 +106,14 @@ class GameSession:
         # Cache static geometry data to avoid recalculating every frame
         self._cached_geometry_data = None
         
-        # Reset to initial conditions
-        self.reset()
+        # Last state sent to the client (base for delta updates)
+        self._last_sent: Optional[dict] = None
+        
+        # Control handler for the current mode (rebound by set_mode)
+        self.set_mode(self.config.mode)
+        
+        # Initial game state (physics was just built at the initial altitude)
+        self._reset_game_state()
     
     def _get_guidance(self):
         """Lazy load guidance system to avoid circular imports."""
@@ -91,6 +122,14 @@ class GameSession:
             self.guidance = GuidanceSystem()
         return self.guidance
     
+    def get_guidance_latch(self) -> Tuple[bool, float]:
+        """Landing-burn latch of the guidance system (see GuidanceSystem.get_burn_latch)."""
+        return self._get_guidance().get_burn_latch()
+    
+    def set_guidance_latch(self, burn_started: bool, burn_altitude: float):
+        """Store a batched guidance latch (see GuidanceSystem.set_burn_latch)."""
+        self._get_guidance().set_burn_latch(burn_started, burn_altitude)
+    
     def reset(self):
         """Reset game to initial state."""
         # Reset physics (velocity will be calculated from terminal velocity)
@@ -100,20 +139,31 @@ class GameSession:
         if self.guidance:
             self.guidance.reset()
         
+        self._reset_game_state()
+    
+    def _reset_game_state(self):
+        """Reset flags, score and inputs (everything but physics and guidance)."""
         self.running = False
         self.paused = False
         self.start_time = None
         self.end_time = None
         self.score = 0
+        self.finished = False
         self.manual_throttle = 0.0
-        self.manual_gimbal = (0.0, 0.0)
+        self.manual_gimbal[:] = 0.0
+        self._last_sent = None
     
-    def start(self):
-        """Start the game."""
+    def start(self, now: float = None):
+        """
+        Start the game.
+        
+        Args:
+            now: Current time.monotonic() value (read here if not given)
+        """
         if not self.running:
             self.running = True
             self.paused = False
-            self.start_time = time.time()
+            self.start_time = time.monotonic() if now is None else now
             self.flight_recorder.start_recording()
     
     def pause(self):
@@ -129,69 +179,108 @@ class GameSession:
         if throttle is not None:
             self.manual_throttle = throttle
         if gimbal is not None:
-            self.manual_gimbal = gimbal
+            self.manual_gimbal[0] = gimbal[0]
+            self.manual_gimbal[1] = gimbal[1]
     
-    def tick(self) -> dict:
+    def tick(self, now: float = None) -> dict:
         """
         Process one game tick.
         
+        Args:
+            now: Current time.monotonic() value, shared by all sessions in a
+                game loop iteration (read here if not given)
+        
         Returns:
             Current game state as dictionary
         """
+        if self.prepare_tick(now):
+            self.apply_control()
+            self.physics.step()
+        
+        return self.get_state()
+    
+    def prepare_tick(self, now: float = None) -> bool:
+        """
+        Check whether the physics should advance this tick.
+        
+        Records the end time and score the first time the game is found over.
+        
+        Args:
+            now: Current time.monotonic() value (read here if not given)
+        
+        Returns:
+            True if the session is running and the rocket is still flying
+        """
         if not self.running or self.paused:
-            return self.get_state()
+            return False
         
         state = self.physics.state
         
         # Check if game is over
         if state.landed or state.crashed:
             if self.end_time is None:
-                self.end_time = time.time()
+                self.end_time = time.monotonic() if now is None else now
                 self.score = calculate_score(state, self.physics.time)
-            return self.get_state()
-        
-        # Apply control based on game mode
-        if self.config.mode == GameMode.MANUAL:
-            # Use manual inputs directly
-            self.physics.set_input(
-                throttle=self.manual_throttle,
-                gimbal=self.manual_gimbal
-            )
-        
-        elif self.config.mode == GameMode.AUTONOMOUS:
-            # Use guidance system
-            guidance = self._get_guidance()
-            command = guidance.compute_command(
-                position=state.position,
-                velocity=state.velocity,
-                orientation=state.orientation,
-                fuel=state.fuel,
-                dt=self.physics.dt
-            )
-            self.physics.set_input(
-                throttle=command.throttle,
-                gimbal=(command.gimbal_pitch, command.gimbal_yaw)
-            )
-        
-        elif self.config.mode == GameMode.ASSISTED:
-            # Manual throttle, auto attitude
-            guidance = self._get_guidance()
-            command = guidance.compute_command(
-                position=state.position,
-                velocity=state.velocity,
-                orientation=state.orientation,
-                fuel=state.fuel,
-                dt=self.physics.dt
-            )
-            self.physics.set_input(
-                throttle=self.manual_throttle,
-                gimbal=(command.gimbal_pitch, command.gimbal_yaw)
-            )
-        
-        # Step physics
-        self.physics.step()
+                self.finished = True
+            return False
         
-        return self.get_state()
+        return True
+    
+    def set_mode(self, mode: GameMode):
+        """Set the game mode and bind the matching control handler."""
+        self.config.mode = mode
+        self.guided = mode != GameMode.MANUAL
+        self._apply_input = {
+            GameMode.MANUAL: self._apply_manual,
+            GameMode.AUTONOMOUS: self._apply_autonomous,
+            GameMode.ASSISTED: self._apply_assisted,
+        }[mode]
+    
+    def apply_control(self, command=None):
+        """
+        Apply control inputs for this tick based on game mode.
+        
+        Args:
+            command: Precomputed GuidanceCommand (e.g. from a batched guidance
+                call); computed here when None and the mode needs guidance
+        """
+        self._apply_input(command)
+    
+    def _compute_guidance(self):
+        """Run the guidance system on the current rocket state."""
+        state = self.physics.state
+        return self._get_guidance().compute_command(
+            position=state.position,
+            velocity=state.velocity,
+            orientation=state.orientation,
+            fuel=state.fuel,
+            dt=self.physics.dt
+        )
+    
+    def _apply_manual(self, command=None):
+        """Use manual inputs directly."""
+        self.physics.set_input(
+            throttle=self.manual_throttle,
+            gimbal=self.manual_gimbal
+        )
+    
+    def _apply_autonomous(self, command=None):
+        """Use guidance system for throttle and attitude."""
+        if command is None:
+            command = self._compute_guidance()
+        self.physics.set_input(
+            throttle=command.throttle,
+            gimbal=(command.gimbal_pitch, command.gimbal_yaw)
+        )
+    
+    def _apply_assisted(self, command=None):
+        """Manual throttle, auto attitude."""
+        if command is None:
+            command = self._compute_guidance()
+        self.physics.set_input(
+            throttle=self.manual_throttle,
+            gimbal=(command.gimbal_pitch, command.gimbal_yaw)
+        )
     
     def get_state(self) -> dict:
         """Get current game state as dictionary."""
@@ -209,14 +298,13 @@ class GameSession:
                 "dry_mass": geometry.config.dry_mass,
             }
         
+        # Use cached geometry data instead of recalculating
         rocket_state = self.physics.state.to_dict(
             geometry=self.physics.geometry,
-            aerodynamics_model=self.physics.aerodynamics
+            aerodynamics_model=self.physics.aerodynamics,
+            geometry_data=self._cached_geometry_data
         )
         
-        # Use cached geometry data instead of recalculating
-        rocket_state["geometry"] = self._cached_geometry_data
-        
         state = {
             "session_id": self.session_id,
             "mode": self.config.mode.value,
@@ -232,9 +320,63 @@ class GameSession:
         if is_game_over:
             self.flight_recorder.stop_recording()
             flight_data = self.flight_recorder.to_dict()
-            # Debug: Print data points count
-            print(f"[FlightRecorder] Game over. Data points: {len(flight_data.get('data_points', []))}")
-            print(f"[FlightRecorder] Events: {len(flight_data.get('events', []))}")
+            logger.debug("Game over. Data points: %d, events: %d",
+                         self.flight_recorder.num_points, len(flight_data['events']))
             state["flight_review"] = flight_data
         
         return state
+    
+    def encode_state_message(self, msg_type: str, state: dict, **extra) -> bytes:
+        """
+        Serialize a full state message and make it the base for later deltas.
+        
+        Args:
+            msg_type: Message type ('state', 'connected', 'started', 'reset')
+            state: State dictionary from get_state()
+            **extra: Additional top-level message fields
+            
+        Returns:
+            JSON-encoded message bytes
+        """
+        self._last_sent = state
+        if msg_type == "state" and not extra:
+            return _STATE_PREFIX + orjson.dumps(state, option=ORJSON_OPTIONS) + b'}'
+        return orjson.dumps({"type": msg_type, **extra, "data": state}, option=ORJSON_OPTIONS)
+    
+    def encode_state_update(self, state: dict) -> Optional[bytes]:
+        """
+        Serialize a per-tick update against the last state sent.
+        
+        Only changed top-level and rocket fields are sent as a 'delta'
+        message. A full 'state' message is sent when there is no base yet
+        or a field was removed; None is returned when nothing changed.
+        """
+        last = self._last_sent
+        if last is None or not last.keys() <= state.keys():
+            return self.encode_state_message("state", state)
+        
+        last_rocket = last["rocket"]
+        rocket = state["rocket"]
+        if not last_rocket.keys() <= rocket.keys():
+            return self.encode_state_message("state", state)
+        
+        diff = {
+            key: value for key, value in state.items()
+            if key != "rocket" and (key not in last or _changed(last[key], value))
+        }
+        rocket_diff = {
+            key: value for key, value in rocket.items()
+            if key not in last_rocket or _changed(last_rocket[key], value)
+        }
+        if rocket_diff:
+            diff["rocket"] = rocket_diff
+        if not diff:
+            return None
+        
+        self._last_sent = state
+        return _DELTA_PREFIX + orjson.dumps(diff, option=ORJSON_OPTIONS) + b'}'
+
+
+def _changed(old, new) -> bool:
+    """Field comparison for deltas (identity first; cached sub-dicts are reused)."""
+    return old is not new and old != new
@@ -4,16 +4,26 @@ FastAPI application with WebSocket support for real-time game simulation.
 """
 
 import asyncio
+import time
 import uuid
 import logging
-from typing import Dict
+from typing import Dict, Set
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from game.session import GameSession, GameConfig, GameMode
+from game.pool import SessionPool
+from physics.engine import PhysicsEngine
+from physics.geometry import get_shared_geometry
+from physics.aerodynamics import get_shared_aerodynamics
+from physics.wind import WindConfig, WindModel
+
+# Game mode lookup by client-facing name ("manual", "autonomous", "assisted")
+MODE_MAP = {mode.value: mode for mode in GameMode}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,8 +34,20 @@ logger = logging.getLogger(__name__)
 sessions: Dict[str, GameSession] = {}
 # Store WebSocket connections
 connections: Dict[str, WebSocket] = {}
+# Outgoing state frames per connection (at most one pending frame each)
+send_queues: Dict[str, asyncio.Queue] = {}
+# Background sender task per connection
+sender_tasks: Dict[str, asyncio.Task] = {}
+# Sessions the game loop steps: running, not paused and connected.
+# Maintained on state changes (see update_live) instead of scanned per tick.
+live_sessions: Set[str] = set()
 # Game loop task
 game_loop_task = None
+# Game loop rate, and how often finished (landed/crashed) sessions are refreshed
+TICK_RATE = 30
+HEARTBEAT_TICKS = TICK_RATE  # 1 Hz
+# Batched physics/guidance stepper shared by all sessions
+session_pool = SessionPool()
 
 
 class CreateGameRequest(BaseModel):
@@ -41,35 +63,113 @@ class GameInputRequest(BaseModel):
     gimbal: list = None
 
 
+def enqueue_frame(queue: asyncio.Queue, message: bytes):
+    """Queue a self-contained frame, replacing any frame not yet sent."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+def enqueue_reply(queue: asyncio.Queue, replies: asyncio.Queue, message: bytes):
+    """
+    Queue a control reply behind any state frame not yet sent.
+    
+    The pending frame moves to the reply queue ahead of the reply, and a
+    None wake-up takes its slot so the sender drains the replies.
+    """
+    if queue.full():
+        pending = queue.get_nowait()
+        if pending is not None:
+            replies.put_nowait(pending)
+    replies.put_nowait(message)
+    queue.put_nowait(None)
+
+
+async def sender(websocket: WebSocket, queue: asyncio.Queue, replies: asyncio.Queue):
+    """
+    Send queued frames to one client, so slow clients never stall the game loop.
+    
+    This task is the only writer on the socket: state frames come from
+    `queue`, control replies (and the frames queued before them) from
+    `replies`, which is drained first.
+    """
+    while True:
+        message = await queue.get()
+        try:
+            while not replies.empty():
+                await websocket.send_bytes(replies.get_nowait())
+            if message is not None:
+                await websocket.send_bytes(message)
+        except Exception:
+            # Connection closed, will be cleaned up by the endpoint
+            return
+
+
+def stop_sender(session_id: str):
+    """Cancel a connection's sender task and drop its queue."""
+    task = sender_tasks.pop(session_id, None)
+    if task:
+        task.cancel()
+    send_queues.pop(session_id, None)
+    live_sessions.discard(session_id)
+
+
+def update_live(session_id: str):
+    """Re-evaluate whether the game loop should step a session."""
+    session = sessions.get(session_id)
+    if session and session.running and not session.paused and session_id in send_queues:
+        live_sessions.add(session_id)
+    else:
+        live_sessions.discard(session_id)
+
+
+async def receive_message(websocket: WebSocket) -> dict:
+    """Receive one client message (JSON in a binary or text frame)."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    data = message.get("bytes")
+    return orjson.loads(data if data is not None else message["text"])
+
+
 async def game_loop():
-    """Main game loop running at 30Hz."""
+    """Main game loop running at 30Hz (finished sessions at 1 Hz)."""
+    tick_count = 0
     while True:
-        # Only process sessions that are actually running
-        active_sessions = [
-            (sid, session) for sid, session in sessions.items()
-            if session.running and not session.paused and sid in connections
-        ]
-        
         # Skip sleep if no active sessions (reduces CPU when idle)
-        if not active_sessions:
+        if not live_sessions:
             await asyncio.sleep(0.1)  # Check every 100ms when idle
             continue
         
-        for session_id, session in active_sessions:
-            state = session.tick()
+        tick_count += 1
+        heartbeat = tick_count % HEARTBEAT_TICKS == 0
+        
+        # Only process sessions that are actually running; finished ones
+        # have nothing left to simulate and only get a periodic refresh
+        active_sessions = [
+            (sid, sessions[sid]) for sid in live_sessions
+            if heartbeat or not sessions[sid].finished
+        ]
+        
+        # Advance all active sessions in one batched step (one clock read per tick)
+        now = time.monotonic()
+        states = session_pool.step_all([session for _, session in active_sessions], now)
+        
+        for (session_id, session), state in zip(active_sessions, states):
+            queue = send_queues[session_id]
+            if queue.full():
+                # Client is behind: the unsent frame is replaced, so send a
+                # full state rather than a delta against a frame it never got
+                enqueue_frame(queue, session.encode_state_message("state", state))
+                continue
             
-            # Broadcast state to connected client
-            try:
-                await connections[session_id].send_json({
-                    "type": "state",
-                    "data": state
-                })
-            except Exception:
-                # Connection closed, will be cleaned up
-                pass
+            # Broadcast changed fields to connected client (nothing if unchanged)
+            message = session.encode_state_update(state)
+            if message is not None:
+                queue.put_nowait(message)
         
         # 30 Hz tick rate (balanced performance and responsiveness)
-        await asyncio.sleep(1/30)
+        await asyncio.sleep(1 / TICK_RATE)
 
 
 @asynccontextmanager
@@ -112,19 +212,13 @@ async def create_game(request: CreateGameRequest):
     """Create a new game session."""
     session_id = str(uuid.uuid4())[:8]
     
-    mode_map = {
-        "manual": GameMode.MANUAL,
-        "autonomous": GameMode.AUTONOMOUS,
-        "assisted": GameMode.ASSISTED,
-    }
-    
     # Validate wind level
     wind_level = request.wind_level
     if wind_level < 0 or wind_level > 9:
         wind_level = 0  # Default to no wind if invalid
     
     config = GameConfig(
-        mode=mode_map.get(request.mode, GameMode.MANUAL),
+        mode=MODE_MAP.get(request.mode, GameMode.MANUAL),
         initial_altitude=request.initial_altitude,
         # initial_velocity removed - calculated from terminal velocity
         wind_level=wind_level,
@@ -162,6 +256,7 @@ async def start_game(session_id: str):
         return {"error": "Session not found"}
     
     sessions[session_id].start()
+    update_live(session_id)
     return {"status": "started"}
 
 
@@ -172,6 +267,7 @@ async def pause_game(session_id: str):
         return {"error": "Session not found"}
     
     sessions[session_id].pause()
+    update_live(session_id)
     return {"status": "paused"}
 
 
@@ -182,6 +278,7 @@ async def resume_game(session_id: str):
         return {"error": "Session not found"}
     
     sessions[session_id].resume()
+    update_live(session_id)
     return {"status": "resumed"}
 
 
@@ -192,6 +289,7 @@ async def reset_game(session_id: str):
         return {"error": "Session not found"}
     
     sessions[session_id].reset()
+    update_live(session_id)
     return {"status": "reset"}
 
 
@@ -224,19 +322,25 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     
     connections[session_id] = websocket
     
+    # State frames go through a one-slot queue and control replies through
+    # an unbounded one, both drained by a single sender task
+    stop_sender(session_id)
+    queue = asyncio.Queue(maxsize=1)
+    replies = asyncio.Queue()
+    send_queues[session_id] = queue
+    sender_tasks[session_id] = asyncio.create_task(sender(websocket, queue, replies))
+    update_live(session_id)
+    
     try:
         # Send initial state
         logger.info(f"Sending initial state to session: {session_id}")
-        await websocket.send_json({
-            "type": "connected",
-            "session_id": session_id,
-            "data": sessions[session_id].get_state()
-        })
-        logger.info(f"Initial state sent to session: {session_id}")
+        session = sessions[session_id]
+        enqueue_frame(queue, session.encode_state_message("connected", session.get_state(), session_id=session_id))
+        logger.info(f"Initial state queued for session: {session_id}")
         
         while True:
             # Receive messages from client
-            data = await websocket.receive_json()
+            data = await receive_message(websocket)
             
             if data["type"] == "input":
                 # Handle control input
@@ -247,26 +351,26 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 sessions[session_id].set_input(throttle=throttle, gimbal=gimbal)
             
             elif data["type"] == "start":
-                sessions[session_id].start()
-                await websocket.send_json({
-                    "type": "started",
-                    "data": sessions[session_id].get_state()
-                })
+                session = sessions[session_id]
+                session.start()
+                update_live(session_id)
+                enqueue_frame(queue, session.encode_state_message("started", session.get_state()))
             
             elif data["type"] == "pause":
                 sessions[session_id].pause()
-                await websocket.send_json({"type": "paused"})
+                update_live(session_id)
+                enqueue_reply(queue, replies, orjson.dumps({"type": "paused"}))
             
             elif data["type"] == "resume":
                 sessions[session_id].resume()
-                await websocket.send_json({"type": "resumed"})
+                update_live(session_id)
+                enqueue_reply(queue, replies, orjson.dumps({"type": "resumed"}))
             
             elif data["type"] == "reset":
-                sessions[session_id].reset()
-                await websocket.send_json({
-                    "type": "reset",
-                    "data": sessions[session_id].get_state()
-                })
+                session = sessions[session_id]
+                session.reset()
+                update_live(session_id)
+                enqueue_frame(queue, session.encode_state_message("reset", session.get_state()))
             
             elif data["type"] == "config":
                 # Update game configuration
@@ -275,12 +379,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 rocket_preset = data.get("rocket_preset")
                 difficulty = data.get("difficulty", "medium")
                 
-                mode_map = {
-                    "manual": GameMode.MANUAL,
-                    "autonomous": GameMode.AUTONOMOUS,
-                    "assisted": GameMode.ASSISTED,
-                }
-                sessions[session_id].config.mode = mode_map.get(mode, GameMode.MANUAL)
+                sessions[session_id].set_mode(MODE_MAP.get(mode, GameMode.MANUAL))
                 sessions[session_id].config.difficulty = difficulty
                 
                 if wind_level is not None:
@@ -288,7 +387,6 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     wind_level = max(0, min(9, int(wind_level)))
                     sessions[session_id].config.wind_level = wind_level
                     # Reinitialize wind model with new config
-                    from physics.wind import WindConfig, WindModel
                     wind_config = WindConfig(
                         enabled=(wind_level > 0),
                         wind_level=wind_level if wind_level > 0 else 1,  # Use 1 as placeholder if disabled
@@ -299,13 +397,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 
                 if rocket_preset is not None:
                     # Update rocket configuration
-                    from physics.geometry import RocketPresets
                     try:
-                        rocket_config = RocketPresets.get_preset(rocket_preset)
+                        geometry = get_shared_geometry(rocket_preset)
                         sessions[session_id].config.rocket_preset = rocket_preset
                         # Reinitialize physics engine with new rocket
-                        from physics.wind import WindConfig, WindModel
-                        from physics.engine import PhysicsEngine
                         wind_config = WindConfig(
                             enabled=(sessions[session_id].config.wind_level > 0),
                             wind_level=sessions[session_id].config.wind_level if sessions[session_id].config.wind_level > 0 else 1,
@@ -314,31 +409,31 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         )
                         # IMPORTANT: Pass flight_recorder and difficulty to new physics engine!
                         sessions[session_id].physics = PhysicsEngine(
-                            rocket_config=rocket_config, 
+                            geometry=geometry,
+                            aerodynamics=get_shared_aerodynamics(),
                             wind_config=wind_config,
                             flight_recorder=sessions[session_id].flight_recorder,
-                            difficulty=sessions[session_id].config.difficulty
+                            difficulty=sessions[session_id].config.difficulty,
+                            # Start at the configured altitude (velocity from terminal velocity)
+                            initial_altitude=sessions[session_id].config.initial_altitude
                         )
                         # Clear cached geometry data since rocket changed
                         sessions[session_id]._cached_geometry_data = None
-                        # Reset physics to apply new rocket (velocity will be calculated from terminal velocity)
-                        sessions[session_id].physics.reset(
-                            altitude=sessions[session_id].config.initial_altitude
-                        )
                     except ValueError:
                         pass  # Invalid preset, ignore
                 
-                await websocket.send_json({
+                enqueue_reply(queue, replies, orjson.dumps({
                     "type": "config_updated",
                     "mode": mode,
                     "wind_level": sessions[session_id].config.wind_level,
                     "rocket_preset": sessions[session_id].config.rocket_preset,
                     "difficulty": sessions[session_id].config.difficulty
-                })
+                }))
     
     except WebSocketDisconnect:
         # Clean up on disconnect
         logger.info(f"WebSocket disconnected for session: {session_id}")
+        stop_sender(session_id)
         if session_id in connections:
             del connections[session_id]
         # Clean up session after disconnect to free memory
@@ -347,6 +442,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             del sessions[session_id]
     except Exception as e:
         logger.error(f"WebSocket error for session {session_id}: {e}", exc_info=True)
+        stop_sender(session_id)
         if session_id in connections:
             del connections[session_id]
         # Clean up session on error
@@ -357,5 +453,16 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # httptools comes with uvicorn[standard]; loop="auto" picks uvloop where
+    # it is installed (not on Windows, see requirements.txt). Binary frames
+    # are already compact, so per-message deflate only costs CPU
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False,
+    )
 
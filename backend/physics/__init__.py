@@ -1,15 +1,18 @@
 from .engine import PhysicsEngine
+from .batch_engine import BatchPhysicsEngine
 from .atmosphere import Atmosphere
-from .geometry import RocketGeometry, RocketConfig, RocketPresets, create_rocket_from_preset
+from .geometry import RocketGeometry, RocketConfig, RocketPresets, create_rocket_from_preset, get_shared_geometry
 from .rigid_body import RigidBodyDynamics, RigidBodyState
 from .transformations import (
     quaternion_to_rotation_matrix,
     body_to_world,
     world_to_body,
     quaternion_multiply,
+    quaternion_multiply_batch,
+    quaternion_multiply_soa,
     quaternion_normalize,
     integrate_quaternion,
 )
 from .wind import WindModel, WindConfig
-from .aerodynamics import DragModel, AerodynamicsModel
+from .aerodynamics import DragModel, AerodynamicsModel, RocketEnsembleState, get_shared_aerodynamics
 from .torques import TorqueCalculator
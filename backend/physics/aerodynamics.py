@@ -6,31 +6,270 @@ Implements Mach number effects, angle of attack, and compressibility corrections
 
 import numpy as np
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
-from .atmosphere import Atmosphere
+from .atmosphere import Atmosphere, speed_of_sound
 from .constants import (
     DRAG_COEFFICIENT_AXIAL,
     DRAG_COEFFICIENT_NORMAL,
 )
+from .jit import njit
+
+
+# The scalar kernels below have explicit float64 signatures: they are
+# compiled (or loaded from the disk cache) at import, take C doubles (ints and
+# NumPy scalars are converted at the call), and never re-specialize per type.
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=True)
+def _mach(velocity_magnitude, speed_of_sound):
+    """Mach number (0 if the speed of sound is not positive)."""
+    if speed_of_sound <= 0:
+        return 0.0
+    return velocity_magnitude / speed_of_sound
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=True)
+def _mach_at_altitude(velocity_magnitude, altitude):
+    """
+    Mach number in the standard atmosphere, as one compiled call.
+    
+    Inlines the compiled ISA speed of sound from atmosphere.py; only valid
+    for DragModels built on the default Atmosphere.
+    """
+    return _mach(velocity_magnitude, speed_of_sound(altitude))
+
+
+@njit("float64(float64)", cache=True, fastmath=True)
+def _axial_cd(mach_number):
+    """Piecewise axial drag coefficient (see DragModel.get_axial_drag_coefficient)."""
+    M = abs(mach_number)
+    
+    if M < 0.8:
+        # Subsonic: gradual increase
+        return 0.5 + 0.3 * M * M
+    elif M < 1.2:
+        # Transonic: sharp increase (wave drag)
+        return 0.692 + 0.5 * (M - 0.8)
+    else:
+        # Supersonic: decreases ~1/M
+        return 0.892 / M
+
+
+@njit("float64(float64, float64, float64)", cache=True, fastmath=True)
+def _normal_cd_alpha_part(angle_of_attack, cd_base, alpha_coefficient):
+    """Angle-of-attack part Cd_normal_0 * (1 + k*α²) of the normal drag coefficient."""
+    alpha = abs(angle_of_attack)
+    
+    # Angle of attack effect: increases with α²
+    return cd_base * (1.0 + alpha_coefficient * alpha * alpha)
+
+
+@njit("float64(float64, float64, float64)", cache=True, fastmath=True)
+def _normal_cd_precomputed(cd_alpha_part, mach_number, mach_coefficient):
+    """Normal drag coefficient from its precomputed angle-of-attack part."""
+    # Mach number correction
+    return cd_alpha_part * (1.0 + mach_coefficient * abs(mach_number))
+
+
+@njit("float64(float64, float64, float64, float64, float64)", cache=True, fastmath=True)
+def _normal_cd(angle_of_attack, mach_number, cd_base, alpha_coefficient, mach_coefficient):
+    """Normal drag coefficient (see DragModel.get_normal_drag_coefficient)."""
+    return _normal_cd_precomputed(
+        _normal_cd_alpha_part(angle_of_attack, cd_base, alpha_coefficient),
+        mach_number, mach_coefficient
+    )
+
+
+# Default normal drag model constants (base Cd, α² factor, Mach factor)
+NORMAL_CD_ALPHA_COEFFICIENT = 0.15
+NORMAL_CD_MACH_COEFFICIENT = 0.1
+
+
+@lru_cache(maxsize=None)
+def make_normal_cd_kernel(cd_base: float, alpha_coefficient: float, mach_coefficient: float):
+    """
+    Compile a normal drag coefficient kernel with its constants baked in.
+    
+    The constants are closure values, which Numba freezes as literals, so
+    they are folded into the compiled expression. Each distinct set is
+    compiled (and disk-cached) once.
+    
+    Args:
+        cd_base: Base normal drag coefficient
+        alpha_coefficient: Angle-of-attack factor k in (1 + k*α²)
+        mach_coefficient: Mach factor in (1 + c*M)
+    
+    Returns:
+        Compiled function (angle_of_attack, mach_number) -> normal Cd
+    """
+    @njit("float64(float64, float64)", cache=True, fastmath=True)
+    def normal_cd(angle_of_attack, mach_number):
+        return _normal_cd(angle_of_attack, mach_number, cd_base, alpha_coefficient, mach_coefficient)
+    
+    return normal_cd
+
+
+@njit("UniTuple(float64, 3)(float64, float64, float64)", cache=True, fastmath=True)
+def _aoa(u, v, w):
+    """
+    Angle of attack, sideslip and speed from body-frame velocity components.
+    
+    See AerodynamicsModel.calculate_angle_of_attack; the speed is returned
+    too so callers don't need a second sqrt.
+    
+    Returns:
+        Tuple of (alpha, beta, velocity_magnitude)
+    """
+    velocity_mag = math.sqrt(u*u + v*v + w*w)
+    
+    # If velocity is very small, no angle of attack
+    if velocity_mag < 0.1:
+        return 0.0, 0.0, velocity_mag
+    
+    # atan2 is scale-invariant, so the raw components are used directly;
+    # the forward threshold (|u/|v|| > 1e-3) is scaled instead
+    forward_floor = 1e-3 * velocity_mag
+    
+    # Standard case: velocity has forward component
+    if abs(u) > forward_floor:
+        return math.atan2(w, u), math.atan2(v, u), velocity_mag
+    
+    # No forward component: rocket moving purely vertically/sideways.
+    # Only the dominant axis gets an angle (small forward component for
+    # calculation); the other stays 0 for stability
+    abs_v = abs(v)
+    abs_w = abs(w)
+    if abs_w > abs_v:
+        # Moving primarily vertically: pitch angle of attack, no sideslip
+        return math.atan2(w, forward_floor), 0.0, velocity_mag
+    if abs_v > abs_w:
+        # Moving primarily sideways: sideslip, no pitch angle of attack
+        return 0.0, math.atan2(v, forward_floor), velocity_mag
+    return 0.0, 0.0, velocity_mag
+
+
+@njit("UniTuple(float64, 3)(float64, float64, float64, float64, float64)", cache=True, fastmath=True)
+def _aero_forces(u, v, w, density, cross_sectional_area):
+    """
+    Body-frame aerodynamic force (see AerodynamicsModel.compute_aerodynamic_forces).
+    
+    Returns:
+        Tuple of (F_axial, F_side, F_normal) in N
+    """
+    velocity_mag = math.sqrt(u*u + v*v + w*w)
+    
+    # Below 0.1 m/s there is no drag
+    if velocity_mag < 0.1:
+        return 0.0, 0.0, 0.0
+    
+    # Dynamic pressure times area, and the two drag magnitudes
+    # (constant Cd: 0.5 axial, 1.8 normal)
+    q_area = 0.5 * density * velocity_mag * velocity_mag * cross_sectional_area
+    axial_drag = q_area * 0.5
+    normal_drag = q_area * 1.8
+    
+    # Drag opposes each velocity component; components under 1 cm/s get none
+    F_axial = 0.0
+    F_side = 0.0
+    F_normal = 0.0
+    if abs(u) > 0.01:
+        F_axial = -math.copysign(axial_drag, u)
+    if abs(v) > 0.01:
+        F_side = -math.copysign(normal_drag, v)
+    if abs(w) > 0.01:
+        F_normal = -math.copysign(normal_drag, w)
+    return F_axial, F_side, F_normal
+
+
+# Fixed-point iteration cap for terminal velocity. Subsonic cases converge in
+# a few steps; in the supersonic axial branch Cd ~ 1/M only halves the error
+# per step, so reaching the tolerance there takes up to ~20.
+TERMINAL_VELOCITY_ITERATIONS = 30
+TERMINAL_VELOCITY_TOLERANCE = 1e-4
+
+_TERMINAL_VELOCITY_SIGNATURE = (
+    "float64(float64, float64, float64, float64, boolean, float64, UniTuple(float64, 3))"
+)
+
+
+@njit(_TERMINAL_VELOCITY_SIGNATURE, cache=True, fastmath=True)
+def _terminal_velocity(weight_term, drag_area, speed_of_sound, cd_estimate, axial, angle_of_attack,
+                       normal_constants):
+    """
+    Terminal velocity by fixed-point iteration on the Mach-dependent Cd.
+    
+    Iterates v = sqrt(2mg / (ρ A Cd(v / a))) from the cd_estimate guess until
+    the relative change is below TERMINAL_VELOCITY_TOLERANCE, for at most
+    TERMINAL_VELOCITY_ITERATIONS refinements.
+    
+    Args:
+        weight_term: 2 * m * g
+        drag_area: ρ * A
+        speed_of_sound: Speed of sound at altitude (m/s)
+        cd_estimate: Initial drag coefficient guess
+        axial: Axial (True) or normal (False) drag coefficient model
+        angle_of_attack: Angle of attack in radians (normal model only)
+        normal_constants: (cd_base, alpha_coefficient, mach_coefficient) of
+            the normal drag model
+    
+    Returns:
+        Terminal velocity magnitude (m/s)
+    """
+    # The angle of attack is fixed, so the normal Cd's α part is too
+    cd_alpha_part = _normal_cd_alpha_part(angle_of_attack, normal_constants[0], normal_constants[1])
+    
+    v_term = math.sqrt(weight_term / (drag_area * cd_estimate))
+    for _ in range(TERMINAL_VELOCITY_ITERATIONS):
+        mach = _mach(v_term, speed_of_sound)
+        if axial:
+            cd = _axial_cd(mach)
+        else:
+            cd = _normal_cd_precomputed(cd_alpha_part, mach, normal_constants[2])
+        v_new = math.sqrt(weight_term / (drag_area * cd))
+        if abs(v_new - v_term) < TERMINAL_VELOCITY_TOLERANCE * v_term:
+            return v_new
+        v_term = v_new
+    return v_term
 
 
 class DragModel:
     """
     Velocity-dependent drag coefficient model.
     
-    Accounts for Mach number effects and compressibility.
+    Accounts for Mach number effects and compressibility. The scalar
+    getters also accept NumPy arrays and then use the branch-free *_batch
+    forms, evaluating a whole set of Mach numbers in one pass.
     """
     
-    def __init__(self, atmosphere: Optional[Atmosphere] = None):
+    def __init__(
+        self,
+        atmosphere: Optional[Atmosphere] = None,
+        normal_cd_base: float = DRAG_COEFFICIENT_NORMAL,
+        alpha_coefficient: float = NORMAL_CD_ALPHA_COEFFICIENT,
+        mach_coefficient: float = NORMAL_CD_MACH_COEFFICIENT
+    ):
         """
         Initialize drag model.
         
         Args:
             atmosphere: Atmosphere model for speed of sound calculations.
                        If None, creates a new instance.
+            normal_cd_base: Base normal drag coefficient
+            alpha_coefficient: Angle-of-attack factor of the normal drag
+            mach_coefficient: Mach factor of the normal drag
         """
         self.atmosphere = atmosphere or Atmosphere()
+        # Only the standard atmosphere can use the fused compiled Mach lookup;
+        # any other model is queried through its own get_speed_of_sound
+        self._standard_atmosphere = type(self.atmosphere) is Atmosphere
+        
+        # Normal drag constants are fixed for the model's lifetime, so the
+        # scalar kernel is specialized on them
+        self.normal_constants = (float(normal_cd_base), float(alpha_coefficient), float(mach_coefficient))
+        self._normal_cd = make_normal_cd_kernel(*self.normal_constants)
     
     def get_mach_number(self, velocity_magnitude: float, altitude: float) -> float:
         """
@@ -41,14 +280,15 @@ class DragModel:
         Args:
             velocity_magnitude: Airspeed magnitude (m/s)
             altitude: Altitude above sea level (meters)
-            
+        
         Returns:
             Mach number (dimensionless)
         """
-        speed_of_sound = self.atmosphere.get_speed_of_sound(altitude)
-        if speed_of_sound <= 0:
-            return 0.0
-        return velocity_magnitude / speed_of_sound
+        if isinstance(velocity_magnitude, np.ndarray):
+            return self.get_mach_number_batch(velocity_magnitude, altitude)
+        if self._standard_atmosphere:
+            return _mach_at_altitude(velocity_magnitude, altitude)
+        return _mach(velocity_magnitude, self.atmosphere.get_speed_of_sound(altitude))
     
     def get_axial_drag_coefficient(self, mach_number: float) -> float:
         """
@@ -61,52 +301,72 @@ class DragModel:
         
         Args:
             mach_number: Mach number
-            
+        
         Returns:
             Axial drag coefficient
         """
-        M = abs(mach_number)
-        
-        if M < 0.8:
-            # Subsonic: gradual increase
-            return 0.5 + 0.3 * M * M
-        elif M < 1.2:
-            # Transonic: sharp increase (wave drag)
-            return 0.692 + 0.5 * (M - 0.8)
-        else:
-            # Supersonic: decreases ~1/M
-            return 0.892 / M
+        if isinstance(mach_number, np.ndarray):
+            return self.get_axial_drag_coefficient_batch(mach_number)
+        return _axial_cd(mach_number)
     
     def get_normal_drag_coefficient(self, angle_of_attack: float, mach_number: float) -> float:
         """
         Get normal drag coefficient as function of angle of attack and Mach number.
         
-        Cd_normal(α, M) = Cd_normal_0 * (1 + k * α²) * (1 + 0.1*M)
+        Cd_normal(α, M) = Cd_normal_0 * (1 + k * α²) * (1 + c*M)
         
         Where:
         - Cd_normal_0 = base normal drag (~1.8)
         - k = angle-of-attack factor (~0.15)
+        - c = Mach factor (~0.1)
         
         Args:
             angle_of_attack: Angle of attack in radians
             mach_number: Mach number
-            
+        
         Returns:
             Normal drag coefficient
         """
-        alpha = abs(angle_of_attack)
-        M = abs(mach_number)
+        if isinstance(angle_of_attack, np.ndarray) or isinstance(mach_number, np.ndarray):
+            return self.get_normal_drag_coefficient_batch(angle_of_attack, mach_number)
+        return self._normal_cd(angle_of_attack, mach_number)
+    
+    def get_normal_drag_alpha_part(self, angle_of_attack: float) -> float:
+        """
+        Get the angle-of-attack part Cd_normal_0 * (1 + k * α²) of the normal
+        drag coefficient.
         
-        # Base normal drag coefficient
-        Cd_base = DRAG_COEFFICIENT_NORMAL
+        For loops at a fixed angle of attack: compute it once and pass it to
+        get_normal_drag_coefficient_precomputed for each Mach number.
+        
+        Args:
+            angle_of_attack: Angle of attack in radians (scalar or array)
         
-        # Angle of attack effect: increases with α²
-        alpha_factor = 1.0 + 0.15 * alpha * alpha
+        Returns:
+            Angle-of-attack part of the normal drag coefficient
+        """
+        cd_base, alpha_coefficient, _ = self.normal_constants
+        if isinstance(angle_of_attack, np.ndarray):
+            alpha = np.abs(angle_of_attack)
+            return cd_base * (1.0 + alpha_coefficient * alpha * alpha)
+        return _normal_cd_alpha_part(angle_of_attack, cd_base, alpha_coefficient)
+    
+    def get_normal_drag_coefficient_precomputed(self, cd_alpha_part: float, mach_number: float) -> float:
+        """
+        Get normal drag coefficient from its precomputed angle-of-attack part.
         
-        # Mach number correction
-        mach_factor = 1.0 + 0.1 * M
+        Args:
+            cd_alpha_part: Result of get_normal_drag_alpha_part
+            mach_number: Mach number (scalar or array, broadcast against
+                cd_alpha_part)
         
-        return Cd_base * alpha_factor * mach_factor
+        Returns:
+            Normal drag coefficient, same as get_normal_drag_coefficient
+        """
+        mach_coefficient = self.normal_constants[2]
+        if isinstance(cd_alpha_part, np.ndarray) or isinstance(mach_number, np.ndarray):
+            return cd_alpha_part * (1.0 + mach_coefficient * np.abs(mach_number))
+        return _normal_cd_precomputed(cd_alpha_part, mach_number, mach_coefficient)
     
     def get_drag_coefficient_axial(self, velocity_magnitude: float, altitude: float) -> float:
         """
@@ -117,12 +377,15 @@ class DragModel:
         Args:
             velocity_magnitude: Airspeed magnitude (m/s)
             altitude: Altitude above sea level (meters)
-            
+        
         Returns:
             Axial drag coefficient
         """
-        mach = self.get_mach_number(velocity_magnitude, altitude)
-        return self.get_axial_drag_coefficient(mach)
+        if isinstance(velocity_magnitude, np.ndarray):
+            return self.get_axial_drag_coefficient_batch(
+                self.get_mach_number_batch(velocity_magnitude, altitude)
+            )
+        return _axial_cd(self.get_mach_number(velocity_magnitude, altitude))
     
     def get_drag_coefficient_normal(
         self,
@@ -139,12 +402,111 @@ class DragModel:
             angle_of_attack: Angle of attack in radians
             velocity_magnitude: Airspeed magnitude (m/s)
             altitude: Altitude above sea level (meters)
-            
+        
         Returns:
             Normal drag coefficient
         """
-        mach = self.get_mach_number(velocity_magnitude, altitude)
-        return self.get_normal_drag_coefficient(angle_of_attack, mach)
+        if isinstance(velocity_magnitude, np.ndarray) or isinstance(angle_of_attack, np.ndarray):
+            mach = self.get_mach_number(velocity_magnitude, altitude)
+            return self.get_normal_drag_coefficient_batch(angle_of_attack, mach)
+        return self._normal_cd(angle_of_attack, self.get_mach_number(velocity_magnitude, altitude))
+    
+    # Batch forms: same models evaluated over whole arrays (many rockets,
+    # trajectory replays, altitude profiles) in a few NumPy calls
+    
+    def get_mach_number_batch(self, velocity_magnitude: np.ndarray, altitude: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_mach_number.
+        
+        Args:
+            velocity_magnitude: Airspeed magnitudes (m/s)
+            altitude: Altitudes above sea level (meters), broadcast against velocity
+        
+        Returns:
+            Mach numbers (dimensionless)
+        """
+        velocity_magnitude = np.asarray(velocity_magnitude, dtype=np.float64)
+        speed_of_sound = self.atmosphere.get_speed_of_sound_array(altitude)
+        velocity_magnitude, speed_of_sound = np.broadcast_arrays(velocity_magnitude, speed_of_sound)
+        return np.divide(velocity_magnitude, speed_of_sound,
+                         out=np.zeros(velocity_magnitude.shape), where=speed_of_sound > 0)
+    
+    def get_axial_drag_coefficient_batch(self, mach_number: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_axial_drag_coefficient (same piecewise model).
+        
+        Args:
+            mach_number: Mach numbers
+        
+        Returns:
+            Axial drag coefficients
+        """
+        M = np.abs(np.asarray(mach_number, dtype=np.float64))
+        subsonic = 0.5 + 0.3 * M * M
+        transonic = 0.692 + 0.5 * (M - 0.8)
+        # Clamped divisor: only used where M >= 1.2, avoids 1/0 warnings elsewhere
+        supersonic = 0.892 / np.maximum(M, 1.2)
+        return np.where(M < 0.8, subsonic, np.where(M < 1.2, transonic, supersonic))
+    
+    def get_normal_drag_coefficient_batch(self, angle_of_attack: np.ndarray,
+                                          mach_number: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_normal_drag_coefficient.
+        
+        Args:
+            angle_of_attack: Angles of attack in radians
+            mach_number: Mach numbers (broadcast against angle_of_attack)
+        
+        Returns:
+            Normal drag coefficients
+        """
+        cd_alpha_part = self.get_normal_drag_alpha_part(np.asarray(angle_of_attack, dtype=np.float64))
+        return self.get_normal_drag_coefficient_precomputed(
+            cd_alpha_part, np.asarray(mach_number, dtype=np.float64)
+        )
+
+
+@dataclass
+class RocketEnsembleState:
+    """
+    Aerodynamic inputs for N rockets in Structure-of-Arrays layout.
+    
+    One contiguous 1-D array per field (rather than N objects each holding
+    a 3-vector), so whole ensembles - Monte-Carlo dispersions, trajectory
+    replays - are processed by the batch methods in a few array operations.
+    """
+    # Body-frame relative velocity components (m/s)
+    u: np.ndarray
+    v: np.ndarray
+    w: np.ndarray
+    
+    # Altitude above sea level (meters)
+    altitude: np.ndarray
+    
+    # Cross-sectional area (m²), per rocket or one shared value
+    area: np.ndarray
+    
+    @classmethod
+    def from_vectors(cls, velocity_body: np.ndarray, altitude: np.ndarray, area) -> "RocketEnsembleState":
+        """
+        Repack per-rocket body velocity vectors (N x 3) into SoA form.
+        
+        Args:
+            velocity_body: Body-frame velocities, one row per rocket (m/s)
+            altitude: Altitudes (meters)
+            area: Cross-sectional areas (m²), array or scalar
+        
+        Returns:
+            RocketEnsembleState with contiguous per-component arrays
+        """
+        velocity_body = np.asarray(velocity_body, dtype=np.float64)
+        return cls(
+            u=np.ascontiguousarray(velocity_body[:, 0]),
+            v=np.ascontiguousarray(velocity_body[:, 1]),
+            w=np.ascontiguousarray(velocity_body[:, 2]),
+            altitude=np.asarray(altitude, dtype=np.float64),
+            area=np.asarray(area, dtype=np.float64),
+        )
 
 
 class AerodynamicsModel:
@@ -179,59 +541,61 @@ class AerodynamicsModel:
         
         Args:
             velocity_body: Velocity vector in body frame [u, v, w] (m/s)
-            
+        
         Returns:
             Tuple of (angle_of_attack, sideslip_angle) in radians
         """
-        u, v, w = velocity_body
-        velocity_mag = math.sqrt(u*u + v*v + w*w)
-        
-        # If velocity is very small, no angle of attack
-        if velocity_mag < 0.1:
-            return 0.0, 0.0
-        
-        # Normalize velocity components
-        u_norm = u / velocity_mag
-        v_norm = v / velocity_mag
-        w_norm = w / velocity_mag
-        
-        # Angle of attack (pitch) - angle between velocity and x-axis (forward)
-        # Use the projection onto x-z plane
-        if abs(u_norm) > 1e-3:
-            # Standard case: velocity has forward component
-            alpha = math.atan2(w_norm, u_norm)
-        else:
-            # No forward component: rocket moving purely vertically/sideways
-            # Angle of attack is based on vertical component relative to forward
-            # If moving purely vertically (w dominant), alpha ≈ ±90°
-            # But we want to treat this as minimal angle of attack for stability
-            if abs(w_norm) > abs(v_norm):
-                # Moving primarily vertically
-                alpha = math.atan2(w_norm, 1e-3)  # Small forward component for calculation
-            else:
-                # Moving primarily sideways
-                alpha = 0.0  # No pitch angle of attack
-        
-        # Sideslip angle (yaw) - angle between velocity and x-axis in x-y plane
-        if abs(u_norm) > 1e-3:
-            # Standard case
-            beta = math.atan2(v_norm, u_norm)
-        else:
-            # No forward component: sideslip based on lateral component
-            if abs(v_norm) > abs(w_norm):
-                # Moving primarily sideways
-                beta = math.atan2(v_norm, 1e-3)  # Small forward component
-            else:
-                # Moving primarily vertically
-                beta = 0.0  # No sideslip
-        
+        alpha, beta, _ = _aoa(float(velocity_body[0]), float(velocity_body[1]), float(velocity_body[2]))
         return alpha, beta
     
+    def calculate_angle_of_attack_batch(
+        self,
+        U: np.ndarray,
+        V: np.ndarray,
+        W: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_angle_of_attack over body-frame velocity components.
+        
+        Args:
+            U: Body-frame axial velocities (m/s)
+            V: Body-frame side velocities (m/s)
+            W: Body-frame normal velocities (m/s)
+        
+        Returns:
+            Tuple of (angle_of_attack, sideslip_angle) arrays in radians
+        """
+        U = np.asarray(U, dtype=np.float64)
+        V = np.asarray(V, dtype=np.float64)
+        W = np.asarray(W, dtype=np.float64)
+        velocity_mag = np.sqrt(U*U + V*V + W*W)
+        
+        # Same regimes as the scalar kernel: forward flight uses the raw
+        # components; otherwise only the dominant lateral axis gets an angle
+        # (against the scaled forward threshold); below 0.1 m/s both are 0
+        forward_floor = 1e-3 * velocity_mag
+        forward = np.abs(U) > forward_floor
+        abs_v = np.abs(V)
+        abs_w = np.abs(W)
+        alpha = np.where(
+            forward, np.arctan2(W, U),
+            np.where(abs_w > abs_v, np.arctan2(W, forward_floor), 0.0)
+        )
+        beta = np.where(
+            forward, np.arctan2(V, U),
+            np.where(abs_v > abs_w, np.arctan2(V, forward_floor), 0.0)
+        )
+        
+        still = velocity_mag < 0.1
+        return np.where(still, 0.0, alpha), np.where(still, 0.0, beta)
+    
     def compute_aerodynamic_forces(
         self,
         velocity_body: np.ndarray,
         altitude: float,
-        cross_sectional_area: float
+        cross_sectional_area: float,
+        out: Optional[np.ndarray] = None,
+        density: Optional[float] = None
     ) -> np.ndarray:
         """
         Compute aerodynamic forces in body frame.
@@ -242,41 +606,106 @@ class AerodynamicsModel:
         - F_side: Side force (y-direction)
         - F_normal: Normal force (z-direction)
         
+        Also accepts an ensemble: velocity_body of shape (N, 3) with altitude
+        (and optionally density / cross_sectional_area) of shape (N,), which
+        is evaluated with compute_aerodynamic_forces_batch.
+        
         Args:
-            velocity_body: Relative velocity in body frame [u, v, w] (m/s)
+            velocity_body: Relative velocity in body frame [u, v, w] (m/s),
+                or one row per rocket
             altitude: Altitude above sea level (meters)
             cross_sectional_area: Cross-sectional area (m²)
-            
+            out: Optional preallocated 3-vector (or N x 3 array) to write the
+                result into (avoids allocating a new array per call)
+            density: Air density at altitude (kg/m³) if the caller already
+                has it for this time step; looked up when None
+        
         Returns:
-            Aerodynamic force vector in body frame [Fx, Fy, Fz] (N)
+            Aerodynamic force vector in body frame [Fx, Fy, Fz] (N), or an
+            N x 3 array for an ensemble; `out` when given
         """
-        velocity_mag = np.linalg.norm(velocity_body)
+        if isinstance(velocity_body, np.ndarray) and velocity_body.ndim == 2:
+            forces = self.compute_aerodynamic_forces_batch(
+                velocity_body[:, 0], velocity_body[:, 1], velocity_body[:, 2],
+                altitude, cross_sectional_area, density=density
+            )
+            return np.stack(forces, axis=-1, out=out)
+        
+        # Single compiled call; only the density lookup (if any) stays in Python
+        if density is None:
+            density = self.drag_model.atmosphere.get_density(altitude)
+        u, v, w = velocity_body
+        F_axial, F_side, F_normal = _aero_forces(u, v, w, density, cross_sectional_area)
         
-        if velocity_mag < 0.1:
-            return np.zeros(3)
+        if out is None:
+            out = np.empty(3)
         
-        # Get air density
-        density = self.drag_model.atmosphere.get_density(altitude)
+        out[0] = F_axial
+        out[1] = F_side
+        out[2] = F_normal
+        return out
+    
+    def compute_aerodynamic_forces_batch(
+        self,
+        U: np.ndarray,
+        V: np.ndarray,
+        W: np.ndarray,
+        altitudes: np.ndarray,
+        areas,
+        density: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized compute_aerodynamic_forces over many rockets or time steps.
         
-        # Dynamic pressure: q = 0.5 * ρ * v²
-        q = 0.5 * density * velocity_mag * velocity_mag
+        Structure-of-Arrays layout: one 1-D array per velocity component.
         
-        # SIMPLIFIED: Use constant drag coefficients instead of Mach-dependent
-        # This saves significant CPU by skipping angle-of-attack and Mach calculations
-        Cd_axial = 0.5  # Simplified constant drag coefficient
-        Cd_normal = 1.8  # Simplified constant normal drag
+        Args:
+            U: Body-frame axial velocities (m/s)
+            V: Body-frame side velocities (m/s)
+            W: Body-frame normal velocities (m/s)
+            altitudes: Altitudes above sea level (meters)
+            areas: Cross-sectional areas (m²), array or scalar
+            density: Air densities (kg/m³) if already known; looked up
+                from altitudes when None
         
-        # SIMPLIFIED: Apply drag opposite to velocity in each component
-        # This is much faster than complex angle-of-attack calculations
-        u, v, w = velocity_body
+        Returns:
+            Tuple of (F_axial, F_side, F_normal) arrays in N
+        """
+        U = np.asarray(U, dtype=np.float64)
+        V = np.asarray(V, dtype=np.float64)
+        W = np.asarray(W, dtype=np.float64)
+        velocity_mag = np.sqrt(U*U + V*V + W*W)
+        if density is None:
+            density = self.drag_model.atmosphere.get_density_array(altitudes)
+        
+        # Drag magnitudes (constant Cd: 0.5 axial, 1.8 normal), zero below 0.1 m/s
+        q_area = np.where(velocity_mag < 0.1, 0.0, 0.5 * density * velocity_mag * velocity_mag * areas)
+        axial_drag = q_area * 0.5
+        normal_drag = q_area * 1.8
+        
+        # Drag opposes each velocity component; components under 1 cm/s get none
+        F_axial = np.where(np.abs(U) > 0.01, -np.copysign(axial_drag, U), 0.0)
+        F_side = np.where(np.abs(V) > 0.01, -np.copysign(normal_drag, V), 0.0)
+        F_normal = np.where(np.abs(W) > 0.01, -np.copysign(normal_drag, W), 0.0)
+        return F_axial, F_side, F_normal
+    
+    def compute_forces_ensemble(self, ensemble: RocketEnsembleState) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute body-frame aerodynamic forces for a whole ensemble.
         
-        # Apply drag force proportional to velocity squared in each direction
-        # F_drag = -0.5 * ρ * v² * A * Cd * sign(v)
-        F_axial = -q * cross_sectional_area * Cd_axial * np.sign(u) if abs(u) > 0.01 else 0.0
-        F_side = -q * cross_sectional_area * Cd_normal * np.sign(v) if abs(v) > 0.01 else 0.0
-        F_normal = -q * cross_sectional_area * Cd_normal * np.sign(w) if abs(w) > 0.01 else 0.0
+        Preferred API for any workload with more than one rocket; the
+        per-rocket compute_aerodynamic_forces remains for the single-vehicle
+        integration loop.
         
-        return np.array([F_axial, F_side, F_normal])
+        Args:
+            ensemble: Rocket inputs in SoA layout
+        
+        Returns:
+            Tuple of (F_axial, F_side, F_normal) arrays in N
+        """
+        return self.compute_aerodynamic_forces_batch(
+            ensemble.u, ensemble.v, ensemble.w, ensemble.altitude, ensemble.area
+        )
     
     def calculate_terminal_velocity(
         self,
@@ -300,46 +729,37 @@ class AerodynamicsModel:
             altitude: Altitude above sea level (meters)
             orientation: "axial" or "normal" (affects drag coefficient)
             angle_of_attack: Angle of attack in radians (for normal orientation)
-            
+        
         Returns:
             Terminal velocity magnitude (m/s)
         """
         from .constants import GRAVITY
         
-        # Get air density
-        density = self.drag_model.atmosphere.get_density(altitude)
+        # Air density and speed of sound (for the Mach correction) in one query
+        density, speed_of_sound = self.drag_model.atmosphere.get_density_and_speed_of_sound(altitude)
         
         if density <= 0 or cross_sectional_area <= 0:
             return float('inf')  # No drag in vacuum
         
-        # Estimate drag coefficient based on orientation
-        # For terminal velocity, we need an iterative solution since Cd depends on velocity
-        # Use an iterative approach or simplified estimate
-        
         # Initial guess: assume subsonic (M < 0.8)
-        # Start with a reasonable Cd estimate
         if orientation == "axial":
             # Axial: lower drag, higher terminal velocity
             cd_estimate = 0.6  # Average for subsonic axial flow
         else:
             # Normal: higher drag, lower terminal velocity
-            cd_estimate = DRAG_COEFFICIENT_NORMAL * (1.0 + 0.15 * angle_of_attack * angle_of_attack)
-        
-        # Calculate terminal velocity with initial estimate
-        v_term = math.sqrt(2 * mass * GRAVITY / (density * cross_sectional_area * cd_estimate))
-        
-        # Refine using Mach number correction (iterative)
-        # For most cases, one iteration is sufficient
-        mach = self.drag_model.get_mach_number(v_term, altitude)
-        if orientation == "axial":
-            cd_refined = self.drag_model.get_axial_drag_coefficient(mach)
-        else:
-            cd_refined = self.drag_model.get_normal_drag_coefficient(angle_of_attack, mach)
-        
-        # Recalculate with refined Cd
-        v_term_refined = math.sqrt(2 * mass * GRAVITY / (density * cross_sectional_area * cd_refined))
-        
-        return v_term_refined
+            cd_base, alpha_coefficient, _ = self.drag_model.normal_constants
+            cd_estimate = cd_base * (1.0 + alpha_coefficient * angle_of_attack * angle_of_attack)
+        
+        # Refine with the Mach number correction until converged (Cd depends on velocity)
+        return _terminal_velocity(
+            2 * mass * GRAVITY,
+            density * cross_sectional_area,
+            speed_of_sound,
+            cd_estimate,
+            orientation == "axial",
+            angle_of_attack,
+            self.drag_model.normal_constants
+        )
     
     def calculate_terminal_velocity_range(
         self,
@@ -354,16 +774,102 @@ class AerodynamicsModel:
             mass: Total mass (kg)
             cross_sectional_area: Cross-sectional area (m²)
             altitude: Altitude above sea level (meters)
-            
+        
         Returns:
             Tuple of (terminal_velocity_axial, terminal_velocity_normal) in m/s
         """
-        v_term_axial = self.calculate_terminal_velocity(
-            mass, cross_sectional_area, altitude, orientation="axial"
+        from .constants import GRAVITY
+        
+        # Both orientations share one atmosphere query (same values as two
+        # calculate_terminal_velocity calls)
+        density, speed_of_sound = self.drag_model.atmosphere.get_density_and_speed_of_sound(altitude)
+        
+        if density <= 0 or cross_sectional_area <= 0:
+            return (float('inf'), float('inf'))  # No drag in vacuum
+        
+        weight_term = 2 * mass * GRAVITY
+        drag_area = density * cross_sectional_area
+        normal_constants = self.drag_model.normal_constants
+        
+        # Axial from the subsonic average guess, normal at zero angle of attack
+        v_term_axial = _terminal_velocity(
+            weight_term, drag_area, speed_of_sound, 0.6, True, 0.0, normal_constants
         )
-        v_term_normal = self.calculate_terminal_velocity(
-            mass, cross_sectional_area, altitude, orientation="normal", angle_of_attack=0.0
+        v_term_normal = _terminal_velocity(
+            weight_term, drag_area, speed_of_sound, normal_constants[0], False, 0.0, normal_constants
         )
         
         return (v_term_axial, v_term_normal)
+    
+    def calculate_terminal_velocity_profile(
+        self,
+        mass: float,
+        cross_sectional_area: float,
+        altitudes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_terminal_velocity_range over an altitude profile.
+        
+        Same fixed-point iteration as calculate_terminal_velocity, with
+        every step evaluated over the whole array.
+        
+        Args:
+            mass: Total mass (kg)
+            cross_sectional_area: Cross-sectional area (m²)
+            altitudes: Altitudes above sea level (meters)
+        
+        Returns:
+            Tuple of (terminal_velocity_axial, terminal_velocity_normal)
+            arrays in m/s (inf where there is no drag)
+        """
+        from .constants import GRAVITY
+        
+        atmosphere = self.drag_model.atmosphere
+        density = atmosphere.get_density_array(altitudes)
+        speed_of_sound = atmosphere.get_speed_of_sound_array(altitudes)
+        
+        if cross_sectional_area <= 0:
+            infinite = np.full(density.shape, np.inf)
+            return infinite, infinite.copy()
+        
+        weight_term = 2 * mass * GRAVITY
+        drag_area = density * cross_sectional_area
+        has_drag = density > 0
+        # Avoid 1/0 in vacuum entries; they are replaced by inf at the end
+        drag_area = np.where(has_drag, drag_area, 1.0)
+        
+        # Initial estimates (axial: subsonic average, normal: zero angle of attack)
+        v_axial = np.sqrt(weight_term / (drag_area * 0.6))
+        v_normal = np.sqrt(weight_term / (drag_area * self.drag_model.normal_constants[0]))
+        
+        # Refine using Mach number correction; each entry stops updating once
+        # converged, as in calculate_terminal_velocity
+        axial_active = np.ones(v_axial.shape, dtype=bool)
+        normal_active = axial_active.copy()
+        cd_normal_alpha_part = self.drag_model.get_normal_drag_alpha_part(0.0)
+        for _ in range(TERMINAL_VELOCITY_ITERATIONS):
+            cd_axial = self.drag_model.get_axial_drag_coefficient_batch(v_axial / speed_of_sound)
+            cd_normal = self.drag_model.get_normal_drag_coefficient_precomputed(
+                cd_normal_alpha_part, v_normal / speed_of_sound
+            )
+            v_axial_new = np.sqrt(weight_term / (drag_area * cd_axial))
+            v_normal_new = np.sqrt(weight_term / (drag_area * cd_normal))
+            v_axial_change = np.abs(v_axial_new - v_axial) >= TERMINAL_VELOCITY_TOLERANCE * v_axial
+            v_normal_change = np.abs(v_normal_new - v_normal) >= TERMINAL_VELOCITY_TOLERANCE * v_normal
+            v_axial = np.where(axial_active, v_axial_new, v_axial)
+            v_normal = np.where(normal_active, v_normal_new, v_normal)
+            axial_active &= v_axial_change
+            normal_active &= v_normal_change
+            if not (axial_active.any() or normal_active.any()):
+                break
+        
+        return np.where(has_drag, v_axial, np.inf), np.where(has_drag, v_normal, np.inf)
+
+
+@lru_cache(maxsize=None)
+def get_shared_aerodynamics() -> AerodynamicsModel:
+    """
+    Shared AerodynamicsModel (stateless, so one instance serves all sessions).
+    """
+    return AerodynamicsModel()
 
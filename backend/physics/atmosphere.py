@@ -1,5 +1,8 @@
 """Atmospheric model for density and pressure calculations."""
 
+import math
+from typing import Tuple
+
 import numpy as np
 from .constants import (
     SEA_LEVEL_PRESSURE,
@@ -9,15 +12,51 @@ from .constants import (
     MOLAR_MASS_AIR,
     GAS_CONSTANT,
     GRAVITY,
+    TROPOPAUSE_TEMPERATURE,
 )
+from .jit import njit
+
+# Barometric exponent g*M / (R*L) of the troposphere pressure law
+PRESSURE_EXPONENT = GRAVITY * MOLAR_MASS_AIR / (GAS_CONSTANT * TEMPERATURE_LAPSE_RATE)
+
+# Pressure at the tropopause (11 km), the base of the exponential layer above
+TROPOPAUSE_PRESSURE = SEA_LEVEL_PRESSURE * (
+    (SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * 11000) / SEA_LEVEL_TEMPERATURE
+) ** PRESSURE_EXPONENT
+
+# Factors of the exponential layer's exponent -g*M*(h - 11000) / (R*T)
+_NEG_GM = -GRAVITY * MOLAR_MASS_AIR
+_RT_TROPOPAUSE = GAS_CONSTANT * TROPOPAUSE_TEMPERATURE
+
+
+@njit("float64(float64)", cache=True)
+def speed_of_sound(altitude):
+    """
+    ISA speed of sound (m/s), compiled so other kernels can inline it.
+    
+    Linear temperature lapse up to 11 km, constant above. Built without
+    fast-math, so it returns the same doubles as the interpreted model.
+    """
+    if altitude < 0:
+        altitude = 0.0
+    if altitude > 11000:
+        temperature = TROPOPAUSE_TEMPERATURE
+    else:
+        temperature = SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * altitude
+    
+    # a = sqrt(γRT/M) where γ = 1.4 for air
+    return math.sqrt(1.4 * GAS_CONSTANT * temperature / MOLAR_MASS_AIR)
 
 
 class Atmosphere:
     """
     International Standard Atmosphere (ISA) model.
     Valid for altitudes up to ~11km (troposphere).
+    
+    The scalar getters also accept NumPy arrays of altitudes, in which case
+    they return arrays (via the *_array forms).
     """
-
+    
     @staticmethod
     def get_temperature(altitude: float) -> float:
         """
@@ -25,17 +64,19 @@ class Atmosphere:
         
         Args:
             altitude: Height above sea level in meters
-            
+        
         Returns:
             Temperature in Kelvin
         """
+        if isinstance(altitude, np.ndarray):
+            return Atmosphere.get_temperature_array(altitude)
         if altitude < 0:
             altitude = 0
         if altitude > 11000:
             # Tropopause - constant temperature
-            return 216.65
+            return TROPOPAUSE_TEMPERATURE
         return SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * altitude
-
+    
     @staticmethod
     def get_pressure(altitude: float) -> float:
         """
@@ -43,21 +84,21 @@ class Atmosphere:
         
         Args:
             altitude: Height above sea level in meters
-            
+        
         Returns:
             Pressure in Pascals
         """
+        if isinstance(altitude, np.ndarray):
+            return Atmosphere.get_pressure_array(altitude)
         if altitude < 0:
             altitude = 0
         if altitude > 11000:
             # Above troposphere - use exponential decay
-            p_tropopause = Atmosphere.get_pressure(11000)
-            return p_tropopause * np.exp(-GRAVITY * MOLAR_MASS_AIR * (altitude - 11000) / (GAS_CONSTANT * 216.65))
+            return TROPOPAUSE_PRESSURE * math.exp(_NEG_GM * (altitude - 11000) / _RT_TROPOPAUSE)
         
         temperature = Atmosphere.get_temperature(altitude)
-        exponent = GRAVITY * MOLAR_MASS_AIR / (GAS_CONSTANT * TEMPERATURE_LAPSE_RATE)
-        return SEA_LEVEL_PRESSURE * (temperature / SEA_LEVEL_TEMPERATURE) ** exponent
-
+        return SEA_LEVEL_PRESSURE * (temperature / SEA_LEVEL_TEMPERATURE) ** PRESSURE_EXPONENT
+    
     @staticmethod
     def get_density(altitude: float) -> float:
         """
@@ -65,10 +106,12 @@ class Atmosphere:
         
         Args:
             altitude: Height above sea level in meters
-            
+        
         Returns:
             Density in kg/m³
         """
+        if isinstance(altitude, np.ndarray):
+            return Atmosphere.get_density_array(altitude)
         if altitude < 0:
             altitude = 0
         if altitude > 80000:
@@ -80,7 +123,7 @@ class Atmosphere:
         
         # Ideal gas law: ρ = pM / RT
         return pressure * MOLAR_MASS_AIR / (GAS_CONSTANT * temperature)
-
+    
     @staticmethod
     def get_speed_of_sound(altitude: float) -> float:
         """
@@ -88,11 +131,109 @@ class Atmosphere:
         
         Args:
             altitude: Height above sea level in meters
-            
+        
+        Returns:
+            Speed of sound in m/s (Python float, so it can be passed straight
+            into compiled kernels)
+        """
+        if isinstance(altitude, np.ndarray):
+            return Atmosphere.get_speed_of_sound_array(altitude)
+        return speed_of_sound(altitude)
+    
+    @staticmethod
+    def get_density_and_speed_of_sound(altitude: float) -> Tuple[float, float]:
+        """
+        Get density and speed of sound together (one temperature evaluation).
+        
+        Same values as get_density and get_speed_of_sound, for callers that
+        need both for the same altitude in a time step.
+        
+        Args:
+            altitude: Height above sea level in meters
+        
         Returns:
-            Speed of sound in m/s
+            Tuple of (density in kg/m³, speed of sound in m/s)
         """
+        if altitude < 0:
+            altitude = 0
         temperature = Atmosphere.get_temperature(altitude)
-        # a = sqrt(γRT/M) where γ = 1.4 for air
+        speed_of_sound = math.sqrt(1.4 * GAS_CONSTANT * temperature / MOLAR_MASS_AIR)
+        
+        if altitude > 80000:
+            # Effectively vacuum
+            return 0.0, speed_of_sound
+        if altitude > 11000:
+            pressure = Atmosphere.get_pressure(altitude)
+        else:
+            pressure = SEA_LEVEL_PRESSURE * (temperature / SEA_LEVEL_TEMPERATURE) ** PRESSURE_EXPONENT
+        
+        return pressure * MOLAR_MASS_AIR / (GAS_CONSTANT * temperature), speed_of_sound
+    
+    @staticmethod
+    def get_temperature_array(altitude: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_temperature over an array of altitudes.
+        
+        Args:
+            altitude: Heights above sea level in meters
+        
+        Returns:
+            Temperatures in Kelvin
+        """
+        altitude = np.maximum(np.asarray(altitude, dtype=np.float64), 0.0)
+        return np.where(
+            altitude > 11000,
+            TROPOPAUSE_TEMPERATURE,  # Tropopause - constant temperature
+            SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * altitude
+        )
+    
+    @staticmethod
+    def get_pressure_array(altitude: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_pressure over an array of altitudes.
+        
+        Args:
+            altitude: Heights above sea level in meters
+        
+        Returns:
+            Pressures in Pascals
+        """
+        altitude = np.maximum(np.asarray(altitude, dtype=np.float64), 0.0)
+        troposphere = SEA_LEVEL_PRESSURE * (
+            Atmosphere.get_temperature_array(altitude) / SEA_LEVEL_TEMPERATURE
+        ) ** PRESSURE_EXPONENT
+        # Above troposphere - use exponential decay
+        above = TROPOPAUSE_PRESSURE * np.exp(_NEG_GM * (altitude - 11000) / _RT_TROPOPAUSE)
+        return np.where(altitude > 11000, above, troposphere)
+    
+    @staticmethod
+    def get_density_array(altitude: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_density over an array of altitudes.
+        
+        Args:
+            altitude: Heights above sea level in meters
+        
+        Returns:
+            Densities in kg/m³ (0 above 80 km)
+        """
+        altitude = np.maximum(np.asarray(altitude, dtype=np.float64), 0.0)
+        pressure = Atmosphere.get_pressure_array(altitude)
+        temperature = Atmosphere.get_temperature_array(altitude)
+        
+        # Ideal gas law: ρ = pM / RT
+        return np.where(altitude > 80000, 0.0, pressure * MOLAR_MASS_AIR / (GAS_CONSTANT * temperature))
+    
+    @staticmethod
+    def get_speed_of_sound_array(altitude: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_speed_of_sound over an array of altitudes.
+        
+        Args:
+            altitude: Heights above sea level in meters
+        
+        Returns:
+            Speeds of sound in m/s
+        """
+        temperature = Atmosphere.get_temperature_array(altitude)
         return np.sqrt(1.4 * GAS_CONSTANT * temperature / MOLAR_MASS_AIR)
-
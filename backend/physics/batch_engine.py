@@ -0,0 +1,263 @@
+"""
+Batched physics for many independent rockets (Monte-Carlo dispersions,
+RL rollouts, MPC trajectory sampling).
+
+State is kept as one flat state vector per rocket (engine_kernels layout)
+in an (N, STATE_SIZE) array, and every step is a single parallel call of
+the compiled 6-DOF kernel over all still-flying rows. Landing checks run
+as array operations on the same buffer.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .constants import (
+    ENGINE_THROTTLE_MIN,
+    ENGINE_GIMBAL_RANGE,
+    MAX_LANDING_ANGLE,
+    LANDING_PAD_RADIUS,
+    INITIAL_ALTITUDE,
+)
+from .geometry import RocketGeometry, get_shared_geometry
+from .aerodynamics import get_shared_aerodynamics
+from .engine import PhysicsEngine, LANDING_CRITERIA
+from .engine_kernels import (
+    STATE_SIZE,
+    PARAM_SIZE,
+    S_POS,
+    S_VEL,
+    S_QUAT,
+    S_OMEGA,
+    S_FUEL,
+    S_THROTTLE,
+    S_GIMBAL,
+    P_COM_HEIGHT,
+    step_6dof_batch,
+    rollout_6dof_batch,
+)
+
+
+class BatchPhysicsEngine:
+    """
+    Steps N rockets of one geometry with the 6-DOF model.
+    
+    Every rocket starts from the state a PhysicsEngine would start from;
+    dispersions are applied by writing into the position / velocity /
+    orientation / fuel views before stepping. Rockets that land or crash
+    are frozen (no longer stepped) and flagged in `landed` / `crashed`.
+    
+    The state buffer stays float64 because it is passed to the compiled
+    kernel as-is. dt_multiplier and vertical_rk4 are as for PhysicsEngine
+    (longer steps with RK4 on the vertical axis, for cheaper rollouts).
+    """
+    
+    def __init__(self, n: int, geometry: RocketGeometry = None, difficulty: str = "medium",
+                 initial_altitude: float = INITIAL_ALTITUDE, dt_multiplier: float = 1.0,
+                 vertical_rk4: bool = False):
+        if geometry is None:
+            geometry = get_shared_geometry("falcon9_block5_landing")
+        self.n = n
+        self.geometry = geometry
+        self.difficulty = difficulty
+        
+        # Initial conditions and parameters from a single-rocket engine, so
+        # the batch starts exactly where PhysicsEngine would
+        template = PhysicsEngine(difficulty=difficulty, initial_altitude=initial_altitude,
+                                 geometry=geometry, aerodynamics=get_shared_aerodynamics(),
+                                 dt_multiplier=dt_multiplier, vertical_rk4=vertical_rk4)
+        self.dt = template.dt
+        self._initial = np.zeros(STATE_SIZE)
+        template.pack_state(self._initial)
+        
+        self.states = np.empty((n, STATE_SIZE))
+        self.params = np.empty((n, PARAM_SIZE))
+        self.params[:] = template.kernel_params
+        self.wind = np.zeros((n, 2))
+        
+        self.landed = np.zeros(n, dtype=bool)
+        self.crashed = np.zeros(n, dtype=bool)
+        self.touchdown_velocity = np.zeros(n)
+        # Simulated time at which each rocket landed or crashed (NaN while flying)
+        self.finish_time = np.full(n, np.nan)
+        self.reset()
+    
+    def reset(self):
+        """Reset every rocket to the initial state."""
+        self.states[:] = self._initial
+        self.wind[:] = 0.0
+        self.landed[:] = False
+        self.crashed[:] = False
+        self.touchdown_velocity[:] = 0.0
+        self.finish_time[:] = np.nan
+        self.time = 0.0
+    
+    # Views into the state buffer (writes go straight to the rockets)
+    
+    @property
+    def position(self) -> np.ndarray:
+        """(N, 3) positions (m)."""
+        return self.states[:, S_POS:S_POS + 3]
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        """(N, 3) velocities (m/s)."""
+        return self.states[:, S_VEL:S_VEL + 3]
+    
+    @property
+    def orientation(self) -> np.ndarray:
+        """(N, 4) orientation quaternions [w, x, y, z]."""
+        return self.states[:, S_QUAT:S_QUAT + 4]
+    
+    @property
+    def angular_velocity(self) -> np.ndarray:
+        """(N, 3) angular velocities (rad/s)."""
+        return self.states[:, S_OMEGA:S_OMEGA + 3]
+    
+    @property
+    def fuel(self) -> np.ndarray:
+        """(N,) remaining fuel (kg)."""
+        return self.states[:, S_FUEL]
+    
+    @property
+    def active(self) -> np.ndarray:
+        """(N,) mask of rockets still flying."""
+        return ~(self.landed | self.crashed)
+    
+    def set_input(self, throttle=None, gimbal=None):
+        """
+        Set control inputs for all rockets (same rules as PhysicsEngine.set_input).
+        
+        Args:
+            throttle: Throttle per rocket (N,) or one value for all; values
+                above 0 are clamped to [ENGINE_THROTTLE_MIN, 1], others are off
+            gimbal: Gimbal (pitch, yaw) in degrees per rocket (N, 2) or one
+                pair for all
+        """
+        if throttle is not None:
+            throttle = np.asarray(throttle, dtype=np.float64)
+            self.states[:, S_THROTTLE] = _clamp_throttle(throttle)
+        if gimbal is not None:
+            self.states[:, S_GIMBAL:S_GIMBAL + 2] = _clamp_gimbal(gimbal)
+    
+    def step(self, wind: Optional[np.ndarray] = None):
+        """
+        Advance every flying rocket by one time step.
+        
+        The clock only advances while some rocket is flying.
+        
+        Args:
+            wind: Optional (N, 2) wind velocity x, z at each rocket (m/s);
+                no wind when None
+        """
+        if wind is None:
+            wind = self.wind
+        
+        active = self.active
+        if active.all():
+            step_6dof_batch(self.states, self.params, wind, self.dt)
+            rows = slice(None)
+        else:
+            rows = np.flatnonzero(active)
+            if rows.size == 0:
+                return
+            states = self.states[rows]
+            step_6dof_batch(states, self.params[rows], np.ascontiguousarray(wind[rows]), self.dt)
+            self.states[rows] = states
+        
+        self._check_landing(rows, 1)
+        self.time += self.dt
+    
+    def rollout(self, throttle: np.ndarray, gimbal: np.ndarray,
+                wind: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Advance every flying rocket through T ticks of open-loop controls.
+        
+        Equivalent to T rounds of set_input() and step(), but run as one
+        compiled call: each rocket's whole rollout stays in one thread, with
+        no Python round trip per tick. A rocket stops on the tick it touches
+        down and is then landed or crashed as in step(). As there, the clock
+        only advances while some rocket is flying (by the most ticks any
+        rocket was advanced).
+        
+        Args:
+            throttle: (T, N) throttle per tick and rocket (clamped as in
+                set_input)
+            gimbal: (T, N, 2) gimbal pitch, yaw per tick and rocket (degrees)
+            wind: Optional (N, 2) wind velocity x, z at each rocket (m/s),
+                held for the whole rollout; no wind when None
+        
+        Returns:
+            (N,) number of ticks each rocket was advanced
+        """
+        throttle = np.asarray(throttle, dtype=np.float64)
+        steps = throttle.shape[0]
+        
+        # Rocket-major copy of the controls for the kernel
+        controls = np.empty((self.n, steps, 3))
+        controls[..., 0] = _clamp_throttle(throttle).T
+        controls[..., 1:] = _clamp_gimbal(gimbal).transpose(1, 0, 2)
+        wind = self.wind if wind is None else np.ascontiguousarray(wind, dtype=np.float64)
+        
+        active = self.active
+        ticks = np.zeros(self.n, dtype=np.int64)
+        rollout_6dof_batch(self.states, self.params, wind, controls, active, self.dt, ticks)
+        
+        rows = np.flatnonzero(active)
+        if rows.size:
+            self._check_landing(rows, ticks[rows])
+        self.time += ticks.max(initial=0) * self.dt
+        return ticks
+    
+    def _check_landing(self, rows, ticks):
+        """
+        Vectorized PhysicsEngine.check_landing over the rows just stepped.
+        
+        Args:
+            rows: Rows (index array or slice) that were advanced
+            ticks: Ticks each of those rows was advanced (finish time offset)
+        """
+        states = self.states[rows]
+        x = states[:, S_QUAT + 1]
+        z = states[:, S_QUAT + 3]
+        
+        # Bottom of the rocket: COM plus the rotated body down axis [0, -1, 0]
+        # (only its world y-component, -1 + 2(x² + z²), is needed)
+        com_to_bottom = self.params[rows, P_COM_HEIGHT]
+        bottom_altitude = states[:, S_POS + 1] + (-1.0 + 2.0 * (x*x + z*z)) * com_to_bottom
+        touched = bottom_altitude <= 0
+        if not touched.any():
+            return
+        
+        velocity = states[:, S_VEL:S_VEL + 3]
+        total_speed = np.sqrt(np.einsum('ij,ij->i', velocity, velocity))
+        horizontal_distance = np.hypot(states[:, S_POS], states[:, S_POS + 2])
+        tilt_angle = np.degrees(np.arccos(np.clip(1.0 - 2.0 * (x*x + z*z), -1.0, 1.0)))
+        
+        max_altitude, max_velocity = LANDING_CRITERIA.get(self.difficulty, LANDING_CRITERIA["medium"])
+        success = ((np.abs(bottom_altitude) <= max_altitude)
+                   & (total_speed <= max_velocity)
+                   & (tilt_angle <= MAX_LANDING_ANGLE)
+                   & (horizontal_distance <= LANDING_PAD_RADIUS))
+        
+        # Row indices (into the full batch) of the rockets that touched down
+        index = np.arange(self.n)[rows][touched]
+        self.landed[index] = success[touched]
+        self.crashed[index] = ~success[touched]
+        self.touchdown_velocity[index] = total_speed[touched]
+        self.finish_time[index] = self.time + np.broadcast_to(ticks, touched.shape)[touched] * self.dt
+        
+        # Stop at ground level (COM at com_to_bottom) with no motion
+        self.states[index, S_POS + 1] = com_to_bottom[touched]
+        self.states[index, S_VEL:S_VEL + 3] = 0.0
+        self.states[index, S_OMEGA:S_OMEGA + 3] = 0.0
+
+
+def _clamp_throttle(throttle: np.ndarray) -> np.ndarray:
+    """Throttle rule of PhysicsEngine.set_input: off, or within [ENGINE_THROTTLE_MIN, 1]."""
+    return np.where(throttle > 0, np.clip(throttle, ENGINE_THROTTLE_MIN, 1.0), 0.0)
+
+
+def _clamp_gimbal(gimbal: np.ndarray) -> np.ndarray:
+    """Gimbal angles limited to ±ENGINE_GIMBAL_RANGE degrees."""
+    return np.clip(gimbal, -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE)
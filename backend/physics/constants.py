@@ -73,6 +73,7 @@ ROCKET_COM_HEIGHT = 20.0  # meters from engine
 ENGINE_THRUST_SEA_LEVEL = 845_000  # N (190,000 lbf)
 ENGINE_THRUST_VACUUM = 914_000  # N (205,500 lbf)
 ENGINE_THRUST_MAX = ENGINE_THRUST_SEA_LEVEL  # Use sea level for landing sim
+INV_ENGINE_THRUST_MAX = 1.0 / ENGINE_THRUST_MAX  # reciprocal for hot-path multiplies
 
 # Throttle capability
 ENGINE_THROTTLE_MIN = 0.40  # 40% minimum (can't go lower)
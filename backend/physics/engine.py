@@ -3,6 +3,7 @@
 import numpy as np
 import math
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Tuple
 from .constants import (
     GRAVITY,
@@ -26,11 +27,36 @@ from .constants import (
 )
 from .atmosphere import Atmosphere
 from .geometry import RocketGeometry, RocketConfig
-from .rigid_body import RigidBodyDynamics, RigidBodyState
+from .rigid_body import RigidBodyDynamics
 from .wind import WindModel, WindConfig
 from .aerodynamics import AerodynamicsModel
 from .torques import TorqueCalculator
-from .transformations import world_to_body, body_to_world
+from .transformations import tilt_from_quaternion
+from .engine_kernels import (
+    STATE_SIZE, S_FUEL, S_THROTTLE, make_params, step_6dof_kernel, step_simple_kernel,
+)
+
+
+# Touchdown limits per difficulty: (max bottom altitude (m), max speed (m/s))
+LANDING_CRITERIA = {
+    "easy": (10.0, 20.0),
+    "medium": (5.0, 10.0),
+    "professional": (1.0, 5.0),
+}
+
+
+@lru_cache(maxsize=4096)
+def _terminal_velocity_lookup(aerodynamics_model, mass_bucket: int, area: float,
+                              altitude_bucket: int) -> Tuple[float, float]:
+    """
+    Terminal velocity range for HUD display, memoized on 1 kg / 1 m buckets.
+    
+    Rockets differ only through mass and area, both in the key, so entries
+    are shared by every session using the same aerodynamics model.
+    """
+    return aerodynamics_model.calculate_terminal_velocity_range(
+        float(mass_bucket), area, float(altitude_bucket)
+    )
 
 
 @dataclass
@@ -78,30 +104,39 @@ class RocketState:
     touchdown_vertical_speed: float = 0.0  # m/s (vertical speed at touchdown)
     touchdown_horizontal_speed: float = 0.0  # m/s (horizontal speed at touchdown)
     
-    def to_dict(self, geometry: RocketGeometry = None, aerodynamics_model = None) -> dict:
-        """Convert state to dictionary for JSON serialization."""
+    # Derived kinematics, refreshed once per physics step (read by the flight
+    # recorder and to_dict)
+    horizontal_speed: float = 0.0  # m/s
+    total_speed: float = 0.0  # m/s
+    tilt_angle: float = 0.0  # degrees from vertical
+    
+    def to_dict(self, geometry: RocketGeometry = None, aerodynamics_model = None,
+                geometry_data: dict = None) -> dict:
+        """
+        Convert state to dictionary for JSON serialization.
+        
+        Args:
+            geometry: Rocket geometry (bottom altitude, mass, terminal velocity)
+            aerodynamics_model: Aerodynamics model for terminal velocity
+            geometry_data: Precomputed static geometry dict, used as-is for
+                the "geometry" field instead of rebuilding it from geometry
+        """
         # Calculate bottom altitude (what matters for landing)
         # This ensures HUD altitude matches the landing detection logic
         if geometry:
-            # Down vector in body frame (opposite of up)
-            down_body = np.array([0.0, -1.0, 0.0])
-            
-            # Rotate to world frame using quaternion
-            # Using same logic as check_landing() for consistency
-            qw, qx, qy, qz = self.orientation
-            # Quaternion rotation formula
-            t = 2.0 * np.cross(np.array([qx, qy, qz]), down_body)
-            down_world = down_body + qw * t + np.cross(np.array([qx, qy, qz]), t)
+            # Rotate the body down vector [0, -1, 0] to world frame (same as
+            # check_landing); only its y-component, -1 + 2(x² + z²), is needed
+            qx, qz = float(self.orientation[1]), float(self.orientation[3])
+            down_world_y = -1.0 + 2.0 * (qx*qx + qz*qz)
             
             # Distance from COM to bottom of rocket
             com_to_bottom = geometry.config.com_height
             
-            # Calculate bottom position
-            bottom_position = self.position + down_world * com_to_bottom
-            altitude = bottom_position[1]
+            # Bottom position
+            altitude = float(self.position[1]) + down_world_y * com_to_bottom
         else:
             # Fallback to COM altitude if no geometry provided
-            altitude = self.position[1]
+            altitude = float(self.position[1])
         
         result = {
             "position": self.position.tolist(),
@@ -119,15 +154,17 @@ class RocketState:
             "touchdown_velocity": self.touchdown_velocity,
             "touchdown_vertical_speed": self.touchdown_vertical_speed,
             "touchdown_horizontal_speed": self.touchdown_horizontal_speed,
-            "altitude": float(altitude),  # Bottom altitude (matches landing detection)
-            "speed": float(np.linalg.norm(self.velocity)),
+            "altitude": altitude,  # Bottom altitude (matches landing detection)
+            "speed": self.total_speed,
             "vertical_speed": self.velocity[1],
-            "horizontal_speed": float(np.sqrt(self.velocity[0]**2 + self.velocity[2]**2)),
+            "horizontal_speed": self.horizontal_speed,
             "mass": ROCKET_DRY_MASS + self.fuel,
         }
         
         # Add geometry information if available
-        if geometry:
+        if geometry_data is not None:
+            result["geometry"] = geometry_data
+        elif geometry:
             result["geometry"] = {
                 "height": geometry.config.height,
                 "diameter": geometry.config.diameter,
@@ -142,11 +179,11 @@ class RocketState:
         # Add terminal velocity information
         if aerodynamics_model and geometry:
             try:
-                mass = geometry.get_mass(self.fuel)
-                area = geometry.cross_sectional_area
-                altitude = self.position[1]
-                v_term_axial, v_term_normal = aerodynamics_model.calculate_terminal_velocity_range(
-                    mass, area, altitude
+                v_term_axial, v_term_normal = _terminal_velocity_lookup(
+                    aerodynamics_model,
+                    int(geometry.get_mass(self.fuel)),
+                    geometry.cross_sectional_area,
+                    int(self.position[1])
                 )
                 result["terminal_velocity"] = {
                     "axial": v_term_axial,
@@ -162,32 +199,35 @@ class RocketState:
 class PhysicsEngine:
     """Main physics simulation engine."""
     
-    def __init__(self, rocket_config: RocketConfig = None, wind_config: WindConfig = None, use_6dof: bool = True, flight_recorder=None, difficulty: str = "medium"):
-        self.dt = 1.0 / PHYSICS_TICK_RATE
+    def __init__(self, rocket_config: RocketConfig = None, wind_config: WindConfig = None, use_6dof: bool = True, flight_recorder=None, difficulty: str = "medium",
+                 initial_altitude: float = INITIAL_ALTITUDE, geometry: RocketGeometry = None,
+                 aerodynamics: AerodynamicsModel = None, dt_multiplier: float = 1.0,
+                 vertical_rk4: bool = False):
+        # dt_multiplier > 1 takes longer steps (fewer ticks per simulated second,
+        # e.g. for RL rollouts); vertical_rk4 keeps the vertical axis accurate
+        # at those step sizes (6-DOF path only, see step_6dof_kernel)
+        self.dt = dt_multiplier / PHYSICS_TICK_RATE
         self.atmosphere = Atmosphere()
-        self.geometry = RocketGeometry(config=rocket_config)
+        # Geometry and aerodynamics may be shared read-only objects (see
+        # geometry.get_shared_geometry); only the rocket state is per engine
+        self.geometry = geometry if geometry is not None else RocketGeometry(config=rocket_config)
         self.wind = WindModel(config=wind_config)
-        self.aerodynamics = AerodynamicsModel()
+        self.aerodynamics = aerodynamics if aerodynamics is not None else AerodynamicsModel()
         self.dynamics = RigidBodyDynamics(geometry=self.geometry)
         self.torque_calculator = TorqueCalculator(geometry=self.geometry)
         self.difficulty = difficulty  # Store difficulty level
         
-        # Calculate initial velocity based on terminal velocity at STARTING altitude
-        # At terminal velocity, drag = weight, so rocket maintains constant speed
-        # As rocket descends into denser air, it will naturally decelerate
-        # (because terminal velocity decreases with altitude)
-        initial_mass = self.geometry.config.dry_mass + self.geometry.config.fuel_mass
-        initial_velocity = self._calculate_terminal_velocity(initial_mass, INITIAL_ALTITUDE)
-        
         # Initialize state with fuel from rocket config and terminal velocity
-        self.state = RocketState(
-            position=np.array([0.0, INITIAL_ALTITUDE, 0.0]),
-            velocity=np.array([0.0, -initial_velocity, 0.0]),  # Negative for downward
-            fuel=self.geometry.config.fuel_mass
-        )
+        # (the wind model is freshly built, so unlike reset() it is not reset)
+        self.state = RocketState()
+        self._reset_state(initial_altitude)
         self.time = 0.0
         self.use_6dof = use_6dof  # Flag to enable/disable 6-DOF solver
         self.flight_recorder = flight_recorder  # Optional flight data recorder
+        
+        # Flat parameter/state vectors for the compiled 6-DOF step
+        self.kernel_params = make_params(self.geometry, vertical_rk4=vertical_rk4)
+        self._state_vec = np.empty(STATE_SIZE, dtype=np.float64)
     
     def get_terminal_velocity(self, orientation: str = "axial") -> float:
         """
@@ -240,23 +280,59 @@ class PhysicsEngine:
         """
         Reset simulation to initial conditions.
         
+        The existing rocket state is refilled in place (no new state object
+        or arrays), so one engine can be reused across episodes.
+        
         Args:
             altitude: Initial altitude in meters
             velocity: Initial velocity in m/s (if None, uses terminal velocity at that altitude)
         """
-        # Calculate terminal velocity at starting altitude if not provided
+        self._reset_state(altitude, velocity)
+        self.time = 0.0
+        self.wind.reset()
+    
+    def _reset_state(self, altitude: float, velocity: float = None):
+        """
+        Put the rocket state back to its initial conditions at a given altitude.
+        
+        Args:
+            altitude: Initial altitude in meters
+            velocity: Initial velocity in m/s (if None, uses terminal velocity at that altitude)
+        """
+        # Calculate initial velocity based on terminal velocity at STARTING altitude
+        # At terminal velocity, drag = weight, so rocket maintains constant speed
+        # As rocket descends into denser air, it will naturally decelerate
+        # (because terminal velocity decreases with altitude)
         if velocity is None:
             initial_mass = self.geometry.config.dry_mass + self.geometry.config.fuel_mass
             terminal_velocity = self._calculate_terminal_velocity(initial_mass, altitude)
             velocity = -terminal_velocity  # Negative for downward
         
-        self.state = RocketState(
-            position=np.array([0.0, altitude, 0.0]),
-            velocity=np.array([0.0, velocity, 0.0]),
-            fuel=self.geometry.config.fuel_mass,  # Use fuel from rocket config
-        )
-        self.time = 0.0
-        self.wind.reset()
+        state = self.state
+        state.position[0] = 0.0
+        state.position[1] = altitude
+        state.position[2] = 0.0
+        state.velocity[0] = 0.0
+        state.velocity[1] = velocity
+        state.velocity[2] = 0.0
+        state.acceleration[:] = 0.0
+        state.orientation[0] = 1.0
+        state.orientation[1:] = 0.0
+        state.angular_velocity[:] = 0.0
+        state.fuel = self.geometry.config.fuel_mass  # Use fuel from rocket config
+        state.throttle = 0.0
+        state.gimbal[:] = 0.0
+        state.grid_fins[:] = 0.0
+        state.legs_deployed = False
+        state.phase = "descent"
+        state.landed = False
+        state.crashed = False
+        state.touchdown_velocity = 0.0
+        state.touchdown_vertical_speed = 0.0
+        state.touchdown_horizontal_speed = 0.0
+        state.horizontal_speed = 0.0
+        state.total_speed = abs(velocity)
+        state.tilt_angle = 0.0
     
     def get_mass(self) -> float:
         """Get current total mass of rocket."""
@@ -410,51 +486,39 @@ class PhysicsEngine:
         self.state.angular_velocity *= damping
     
     def check_landing(self):
-        """Check if rocket has landed or crashed."""
-        # Calculate the position of the rocket's bottom (engine end)
-        # The rocket's center is at position[1], we need to find the bottom
-        # Down vector in body frame is [0, -1, 0] (opposite of up)
-        # Distance from center to bottom depends on COM location
-        down_body = np.array([0.0, -1.0, 0.0])
-        down_world = self.rotate_vector_by_quaternion(down_body, self.state.orientation)
-        
-        # Distance from COM to bottom of rocket
-        com_to_bottom = self.geometry.config.com_height
+        """
+        Check if rocket has landed or crashed.
+        
+        Works on plain floats read once from the state arrays, and reuses the
+        speeds and tilt cached by update_derived_state() for this step.
+        """
+        state = self.state
+        px, py, pz = state.position.tolist()
+        _, qx, _, qz = state.orientation.tolist()
         
-        # Position of the bottom of the rocket
-        bottom_position = self.state.position + down_world * com_to_bottom
-        bottom_altitude = bottom_position[1]
+        # Position of the rocket's bottom (engine end): the COM plus the body
+        # down vector [0, -1, 0] rotated to world frame, of which only the
+        # y-component, -1 + 2(x² + z²), is needed
+        com_to_bottom = self.geometry.config.com_height
+        bottom_altitude = py + (-1.0 + 2.0 * (qx*qx + qz*qz)) * com_to_bottom
         
         if bottom_altitude <= 0:
-            # Calculate touchdown velocity BEFORE zeroing it
-            vertical_speed = abs(self.state.velocity[1])
-            horizontal_speed = np.sqrt(self.state.velocity[0]**2 + self.state.velocity[2]**2)
-            total_speed = np.linalg.norm(self.state.velocity)  # Total velocity magnitude
-            horizontal_distance = np.sqrt(self.state.position[0]**2 + self.state.position[2]**2)
+            # Touchdown velocity BEFORE zeroing it
+            total_speed = state.total_speed
+            horizontal_distance = math.sqrt(px**2 + pz**2)
             
             # Save touchdown velocities for stats
-            self.state.touchdown_velocity = total_speed
-            self.state.touchdown_vertical_speed = vertical_speed
-            self.state.touchdown_horizontal_speed = horizontal_speed
+            state.touchdown_velocity = total_speed
+            state.touchdown_vertical_speed = abs(float(state.velocity[1]))
+            state.touchdown_horizontal_speed = state.horizontal_speed
             
-            # Calculate tilt angle from vertical
-            # Up vector in body frame is [0, 1, 0]
-            up_world = self.rotate_vector_by_quaternion(np.array([0.0, 1.0, 0.0]), self.state.orientation)
-            tilt_angle = np.degrees(np.arccos(np.clip(up_world[1], -1, 1)))
+            tilt_angle = state.tilt_angle
             
             # Get difficulty-based landing criteria
             # Easy: altitude 0-10m, velocity 0-20 m/s
             # Medium: altitude 0-5m, velocity 0-10 m/s
             # Professional: altitude 0-1m, velocity 0-5 m/s
-            if self.difficulty == "easy":
-                max_altitude = 10.0
-                max_velocity = 20.0
-            elif self.difficulty == "professional":
-                max_altitude = 1.0
-                max_velocity = 5.0
-            else:  # medium (default)
-                max_altitude = 5.0
-                max_velocity = 10.0
+            max_altitude, max_velocity = LANDING_CRITERIA.get(self.difficulty, LANDING_CRITERIA["medium"])
             
             # Check landing conditions with difficulty-based criteria
             # Note: We're checking if the rocket JUST touched down (bottom_altitude <= 0)
@@ -465,25 +529,36 @@ class PhysicsEngine:
             position_ok = horizontal_distance <= LANDING_PAD_RADIUS
             
             if altitude_ok and velocity_ok and angle_ok and position_ok:
-                self.state.landed = True
-                self.state.phase = "landed"
+                state.landed = True
+                state.phase = "landed"
             else:
-                self.state.crashed = True
-                self.state.phase = "crashed"
+                state.crashed = True
+                state.phase = "crashed"
             
             # IMPORTANT: Record final frame WITH velocity before zeroing it
             if self.flight_recorder:
-                self.flight_recorder.record_frame(self.state, self.time, self.geometry)
-                self.flight_recorder.add_touchdown_event(self.state, self.time)
+                self.flight_recorder.record_frame(state, self.time, self.geometry)
+                self.flight_recorder.add_touchdown_event(state, self.time)
             
             # Stop the rocket at ground level (adjust COM position so bottom is at y=0)
-            self.state.position[1] = com_to_bottom  # COM is at height = com_to_bottom when bottom touches ground
-            self.state.velocity = np.array([0.0, 0.0, 0.0])
-            self.state.angular_velocity = np.array([0.0, 0.0, 0.0])
+            state.position[1] = com_to_bottom  # COM is at height = com_to_bottom when bottom touches ground
+            state.velocity[:] = 0.0
+            state.angular_velocity[:] = 0.0
+            state.horizontal_speed = 0.0
+            state.total_speed = 0.0
+    
+    def update_derived_state(self):
+        """Refresh speed and tilt cached on the state for this step."""
+        state = self.state
+        vx, vy, vz = state.velocity.tolist()
+        horizontal_sq = vx*vx + vz*vz
+        state.horizontal_speed = math.sqrt(horizontal_sq)
+        state.total_speed = math.sqrt(horizontal_sq + vy*vy)
+        state.tilt_angle = tilt_from_quaternion(*state.orientation.tolist())
     
     def update_phase(self):
         """Update the current flight phase."""
-        altitude = self.state.position[1]
+        altitude = float(self.state.position[1])
         
         if self.state.landed or self.state.crashed:
             return
@@ -506,149 +581,92 @@ class PhysicsEngine:
             return self.step_simple()
     
     def step_simple(self) -> RocketState:
-        """Simple physics step (original implementation)."""
+        """
+        Simple physics step (original implementation).
+        
+        The force, torque, orientation and fuel updates of get_thrust_vector,
+        get_drag_force, get_gravity_force, apply_control_torques,
+        update_orientation and consume_fuel run in one compiled kernel
+        (engine_kernels.step_simple_kernel) on a flat state vector.
+        """
         if self.state.landed or self.state.crashed:
             return self.state
         
-        mass = self.get_mass()
-        
-        # Calculate forces
-        gravity = self.get_gravity_force()
-        thrust = self.get_thrust_vector()
-        drag = self.get_drag_force()
-        
-        # Total force and acceleration
-        total_force = gravity + thrust + drag
-        acceleration = total_force / mass
-        
-        # Store acceleration in state for recording
-        self.state.acceleration = acceleration
+        # Pack state, run the compiled step, unpack
+        vec = self._state_vec
+        self.pack_state(vec)
+        step_simple_kernel(vec, self.kernel_params, self.dt)
+        self.unpack_state(vec)
         
-        # Update velocity and position (semi-implicit Euler)
-        self.state.velocity += acceleration * self.dt
-        self.state.position += self.state.velocity * self.dt
-        
-        # Update orientation
-        self.apply_control_torques()
-        self.update_orientation()
-        
-        # Consume fuel
-        self.consume_fuel()
-        
-        # Update phase
-        self.update_phase()
-        
-        # Check for landing/crash (this will record final frame with velocity before zeroing)
-        self.check_landing()
-        
-        self.time += self.dt
-        
-        # Record flight data (skip if just landed/crashed - already recorded in check_landing)
-        if self.flight_recorder and not self.state.landed and not self.state.crashed:
-            self.flight_recorder.record_frame(self.state, self.time, self.geometry)
-        
-        return self.state
+        return self.finish_step()
     
     def step_6dof(self) -> RocketState:
-        """6-DOF physics step using RigidBodyDynamics solver."""
+        """
+        6-DOF physics step.
+        
+        Forces, torques, rigid-body integration and fuel burn run in one
+        compiled kernel (engine_kernels.step_6dof_kernel) on a flat state vector.
+        """
         if self.state.landed or self.state.crashed:
             return self.state
         
-        # Update wind model time
-        self.wind.update_time(self.dt)
-        
-        # Create rigid body state
-        rb_state = RigidBodyState(
-            position=self.state.position.copy(),
-            velocity=self.state.velocity.copy(),
-            orientation=self.state.orientation.copy(),
-            angular_velocity=self.state.angular_velocity.copy(),
-        )
-        
-        # Calculate forces in world frame
-        gravity = self.get_gravity_force()
-        thrust_world = self.get_thrust_vector()
+        wind_x, wind_z = self.sample_wind()
         
-        # Calculate aerodynamic forces in body frame
-        # Get relative velocity (rocket - wind)
-        relative_velocity_world = self.wind.get_relative_velocity(
-            self.state.velocity,
-            self.state.position[1]
-        )
-        
-        # Transform to body frame
-        relative_velocity_body = world_to_body(relative_velocity_world, self.state.orientation)
+        # Pack state, run the compiled step, unpack
+        vec = self._state_vec
+        self.pack_state(vec)
+        step_6dof_kernel(vec, self.kernel_params, wind_x, wind_z, self.dt)
+        self.unpack_state(vec)
         
-        # Compute aerodynamic forces in body frame
-        aero_force_body = self.aerodynamics.compute_aerodynamic_forces(
-            relative_velocity_body,
-            self.state.position[1],
-            self.geometry.cross_sectional_area
-        )
-        
-        # Transform aerodynamic forces to world frame
-        aero_force_world = body_to_world(aero_force_body, self.state.orientation)
-        
-        # When falling straight down with no horizontal velocity, ensure drag is purely vertical
-        # to prevent numerical errors from creating horizontal forces
-        horizontal_velocity_mag = np.sqrt(self.state.velocity[0]**2 + self.state.velocity[2]**2)
-        if horizontal_velocity_mag < 0.1:  # Less than 0.1 m/s horizontal velocity
-            # Force drag to be purely vertical (y-direction only)
-            aero_force_world = np.array([0.0, aero_force_world[1], 0.0])
-        
-        # Total forces in world frame
-        total_force_world = gravity + thrust_world + aero_force_world
-        
-        # Calculate and store acceleration for recording
-        mass = self.get_mass()
-        self.state.acceleration = total_force_world / mass
-        
-        # Calculate torques in body frame
-        # Thrust vector in body frame (for torque calculation)
-        if self.state.throttle > 0 and self.state.fuel > 0:
-            # Use thrust from rocket config (throttle already has minimum enforced)
-            thrust_magnitude = self.geometry.config.thrust * self.state.throttle
-            gimbal_pitch = np.radians(np.clip(self.state.gimbal[0], -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE))
-            gimbal_yaw = np.radians(np.clip(self.state.gimbal[1], -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE))
-            # Thrust vector in body frame (same as in get_thrust_vector)
-            # Body frame: x=forward, y=right, z=up
-            thrust_body = np.array([
-                thrust_magnitude * np.sin(gimbal_pitch),  # x: forward/backward
-                thrust_magnitude * np.sin(gimbal_yaw),     # y: left/right
-                thrust_magnitude * np.cos(gimbal_pitch) * np.cos(gimbal_yaw),  # z: upward
-            ])
-        else:
-            thrust_body = np.zeros(3)
-        
-        # Compute total torque
-        total_torque_body = self.torque_calculator.compute_total_torque(
-            thrust_body=thrust_body,
-            aero_force_body=aero_force_body,
-            angular_velocity_body=self.state.angular_velocity,
-            fuel_remaining=self.state.fuel,
-            include_damping=True
-        )
-        
-        # Integrate using 6-DOF solver
-        new_rb_state = self.dynamics.integrate(
-            state=rb_state,
-            forces_world=total_force_world,
-            torques_body=total_torque_body,
-            fuel_remaining=self.state.fuel,
-            dt=self.dt
-        )
+        return self.finish_step()
+    
+    def sample_wind(self) -> Tuple[float, float]:
+        """
+        Advance the wind model and sample it at the current altitude.
         
-        # Update rocket state
-        self.state.position = new_rb_state.position
-        self.state.velocity = new_rb_state.velocity
-        self.state.orientation = new_rb_state.orientation
-        self.state.angular_velocity = new_rb_state.angular_velocity
+        Sampled in Python because the wind model owns its random number
+        generator; the compiled step takes the result as two scalars.
         
-        # Consume fuel
-        self.consume_fuel()
+        Returns:
+            Wind velocity (x, z) in m/s
+        """
+        self.wind.update_time(self.dt)
+        if self.wind.config.enabled:
+            wind = self.wind.get_wind_velocity(self.state.position[1])
+            return wind[0], wind[2]
+        return 0.0, 0.0
+    
+    def pack_state(self, vec: np.ndarray):
+        """Write the integrated part of the state into a flat state vector."""
+        state = self.state
+        vec[0:3] = state.position
+        vec[3:6] = state.velocity
+        vec[6:10] = state.orientation
+        vec[10:13] = state.angular_velocity
+        vec[S_FUEL] = state.fuel
+        vec[S_THROTTLE] = state.throttle
+        vec[15:17] = state.gimbal
+    
+    def unpack_state(self, vec: np.ndarray):
+        """
+        Read an advanced flat state vector back into the rocket state.
         
-        # Update phase
+        The state's vector fields are float64 arrays owned by the state, so
+        they are overwritten in place rather than replaced every tick.
+        """
+        state = self.state
+        state.position[:] = vec[0:3]
+        state.velocity[:] = vec[3:6]
+        state.orientation[:] = vec[6:10]
+        state.angular_velocity[:] = vec[10:13]
+        state.acceleration[:] = vec[17:20]
+        state.fuel = float(vec[S_FUEL])
+    
+    def finish_step(self) -> RocketState:
+        """Post-integration bookkeeping: phase, landing checks, time, recording."""
+        # Update phase and per-step derived kinematics
         self.update_phase()
+        self.update_derived_state()
         
         # Check for landing/crash (this will record final frame with velocity before zeroing)
         self.check_landing()
@@ -663,19 +681,23 @@ class PhysicsEngine:
     
     def set_input(self, throttle: float = None, gimbal: Tuple[float, float] = None, 
                   grid_fins: Tuple[float, float, float, float] = None):
-        """Set control inputs."""
+        """
+        Set control inputs.
+        
+        Scalar clamps and an in-place gimbal update: this runs every tick, so
+        it avoids NumPy scalar calls and a new gimbal array per call.
+        """
         if throttle is not None:
             # Enforce minimum throttle: either 0 (off) or >= 40% (on)
             if throttle > 0:
-                self.state.throttle = np.clip(max(throttle, ENGINE_THROTTLE_MIN), 0.0, 1.0)
+                self.state.throttle = min(max(throttle, ENGINE_THROTTLE_MIN), 1.0)
             else:
                 self.state.throttle = 0.0
         
         if gimbal is not None:
-            self.state.gimbal = np.array([
-                np.clip(gimbal[0], -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE),
-                np.clip(gimbal[1], -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE),
-            ])
+            state_gimbal = self.state.gimbal
+            state_gimbal[0] = min(max(gimbal[0], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE)
+            state_gimbal[1] = min(max(gimbal[1], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE)
         
         if grid_fins is not None:
             self.state.grid_fins = np.array(grid_fins)
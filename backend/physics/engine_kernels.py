@@ -0,0 +1,604 @@
+"""
+Compiled physics kernels for the 6-DOF simulation step.
+
+The kernels work on a flat float64 state vector and a flat parameter vector
+(layouts below) instead of Python objects, so one step is a single native
+call and the same kernel can be applied row-by-row over a batch of rockets.
+They reproduce PhysicsEngine.step_6dof's force, torque and integration
+pipeline (see aerodynamics.py, torques.py and rigid_body.py) with the
+quaternion and matrix algebra inlined as scalar arithmetic.
+"""
+
+import math
+import numpy as np
+
+# Derived ISA constants are shared with the atmosphere model (Numba freezes
+# imported globals as literals, same as local ones)
+from .atmosphere import PRESSURE_EXPONENT, TROPOPAUSE_PRESSURE, _NEG_GM, _RT_TROPOPAUSE
+from .constants import (
+    GRAVITY,
+    ENGINE_GIMBAL_RANGE,
+    ROCKET_COM_HEIGHT,
+    ROCKET_MOI_PITCH,
+    DRAG_COEFFICIENT_AXIAL,
+    SEA_LEVEL_PRESSURE,
+    SEA_LEVEL_TEMPERATURE,
+    TEMPERATURE_LAPSE_RATE,
+    TROPOPAUSE_TEMPERATURE,
+    MOLAR_MASS_AIR,
+    GAS_CONSTANT,
+)
+from .jit import njit, prange
+
+
+# State vector layout (float64)
+S_POS = 0  # position x, y, z (m)
+S_VEL = 3  # velocity x, y, z (m/s)
+S_QUAT = 6  # orientation w, x, y, z
+S_OMEGA = 10  # angular velocity x, y, z (rad/s, body frame)
+S_FUEL = 13  # fuel remaining (kg)
+S_THROTTLE = 14  # throttle (0-1)
+S_GIMBAL = 15  # gimbal pitch, yaw (degrees)
+S_ACCEL = 17  # acceleration x, y, z (m/s², output only)
+STATE_SIZE = 20
+
+# Parameter vector layout (float64), built once per rocket by make_params()
+P_DRY_MASS = 0  # kg
+P_FUEL_CAPACITY = 1  # kg
+P_HEIGHT = 2  # m
+P_RADIUS = 3  # m
+P_AREA = 4  # cross-sectional area (m²)
+P_COM_HEIGHT = 5  # dry mass COM from bottom (m)
+P_FUEL_COM_HEIGHT = 6  # fuel COM from bottom (m)
+P_THRUST = 7  # max thrust (N)
+P_MASS_FLOW = 8  # mass flow at full throttle (kg/s)
+P_VERTICAL_RK4 = 9  # 1.0: RK4 for the vertical axis in step_6dof_kernel, 0.0: Euler
+PARAM_SIZE = 10
+
+# Simplified aerodynamic coefficients (see AerodynamicsModel.compute_aerodynamic_forces)
+AERO_CD_AXIAL = 0.5
+AERO_CD_NORMAL = 1.8
+
+# Rotational model constants (see TorqueCalculator / RigidBodyDynamics)
+AERO_TORQUE_SCALE = 0.1
+DAMPING_COEFFICIENT = 2.0
+MAX_ANGULAR_VELOCITY = 0.52  # rad/s
+
+# Fast-math flags for the physics kernels: the finite-math flags (nnan, ninf)
+# are left out so the non-finite orientation guard is not optimized away
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+def make_params(geometry, vertical_rk4: bool = False) -> np.ndarray:
+    """
+    Build the kernel parameter vector for a rocket.
+    
+    Args:
+        geometry: RocketGeometry object
+        vertical_rk4: Integrate vertical velocity with RK4 instead of
+            semi-implicit Euler (see step_6dof_kernel)
+    
+    Returns:
+        float64 array of length PARAM_SIZE
+    """
+    config = geometry.config
+    params = np.empty(PARAM_SIZE, dtype=np.float64)
+    params[P_DRY_MASS] = config.dry_mass
+    params[P_FUEL_CAPACITY] = config.fuel_mass
+    params[P_HEIGHT] = config.height
+    params[P_RADIUS] = geometry.radius
+    params[P_AREA] = geometry.cross_sectional_area
+    params[P_COM_HEIGHT] = config.com_height
+    params[P_FUEL_COM_HEIGHT] = config.fuel_com_height
+    params[P_THRUST] = config.thrust
+    params[P_MASS_FLOW] = config.thrust / (config.isp * GRAVITY)
+    params[P_VERTICAL_RK4] = 1.0 if vertical_rk4 else 0.0
+    return params
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def air_density(altitude):
+    """ISA air density (kg/m³), same model as Atmosphere.get_density."""
+    if altitude < 0:
+        altitude = 0.0
+    if altitude > 80000:
+        return 0.0
+    if altitude > 11000:
+        pressure = TROPOPAUSE_PRESSURE * math.exp(_NEG_GM * (altitude - 11000) / _RT_TROPOPAUSE)
+        temperature = TROPOPAUSE_TEMPERATURE
+    else:
+        temperature = SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * altitude
+        pressure = SEA_LEVEL_PRESSURE * (temperature / SEA_LEVEL_TEMPERATURE) ** PRESSURE_EXPONENT
+    
+    # Ideal gas law: ρ = pM / RT
+    return pressure * MOLAR_MASS_AIR / (GAS_CONSTANT * temperature)
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _aero_force_body(bu, bv, bw, altitude, area):
+    """
+    Aerodynamic force in body frame (constant coefficients, per-axis drag).
+    
+    Args:
+        bu, bv, bw: Air-relative velocity in body frame (m/s)
+        altitude: Altitude for the air density (m)
+        area: Cross-sectional area (m²)
+    
+    Returns:
+        Force components (N) along the body axes
+    """
+    ax_b = 0.0
+    ay_b = 0.0
+    az_b = 0.0
+    speed = math.sqrt(bu*bu + bv*bv + bw*bw)
+    if speed >= 0.1:
+        # q*A is shared by the three components; normal drag by the two lateral ones
+        q_area = 0.5 * air_density(altitude) * speed * speed * area
+        if abs(bu) > 0.01:
+            ax_b = -math.copysign(q_area * AERO_CD_AXIAL, bu)
+        normal_drag = q_area * AERO_CD_NORMAL
+        if abs(bv) > 0.01:
+            ay_b = -math.copysign(normal_drag, bv)
+        if abs(bw) > 0.01:
+            az_b = -math.copysign(normal_drag, bw)
+    return ax_b, ay_b, az_b
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def _vertical_aero_force(bu, bv, bw, r10, r11, r12, dvy, altitude, area):
+    """
+    World vertical aerodynamic force after the vertical velocity changes by dvy.
+    
+    A world-frame change [0, dvy, 0] shifts the body-frame air-relative
+    velocity by dvy times the middle row of the rotation matrix.
+    """
+    ax_b, ay_b, az_b = _aero_force_body(bu + r10*dvy, bv + r11*dvy, bw + r12*dvy, altitude, area)
+    return r10*ax_b + r11*ay_b + r12*az_b
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def step_6dof_kernel(s, p, wind_x, wind_z, dt):
+    """
+    Advance one rocket state vector by one 6-DOF step, in place.
+    
+    Covers forces (gravity, gimbaled thrust, aerodynamics), torques (thrust,
+    aerodynamic, damping), semi-implicit Euler integration of translation
+    and rotation (RK4 for the vertical axis when P_VERTICAL_RK4 is set), and
+    fuel consumption.
+    
+    Args:
+        s: State vector (STATE_SIZE), updated in place
+        p: Parameter vector (PARAM_SIZE)
+        wind_x: Wind velocity x-component at the rocket's altitude (m/s)
+        wind_z: Wind velocity z-component at the rocket's altitude (m/s)
+        dt: Time step (seconds)
+    """
+    px, py, pz = s[0], s[1], s[2]
+    vx, vy, vz = s[3], s[4], s[5]
+    qw, qx, qy, qz = s[6], s[7], s[8], s[9]
+    wx, wy, wz = s[10], s[11], s[12]
+    fuel = s[S_FUEL]
+    throttle = s[S_THROTTLE]
+    
+    # Mass properties at current fuel level
+    fuel_c = max(0.0, min(fuel, p[P_FUEL_CAPACITY]))
+    dry_mass = p[P_DRY_MASS]
+    mass = dry_mass + fuel_c
+    com_z = (dry_mass * p[P_COM_HEIGHT] + fuel_c * p[P_FUEL_COM_HEIGHT]) / mass
+    
+    # Thrust in body frame (x=forward, y=right, z=up) and world frame
+    tbx = 0.0
+    tby = 0.0
+    tbz = 0.0
+    fx = 0.0
+    fy = 0.0
+    fz = 0.0
+    if throttle > 0 and fuel > 0:
+        thrust = p[P_THRUST] * throttle
+        gimbal_pitch = math.radians(min(max(s[15], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE))
+        gimbal_yaw = math.radians(min(max(s[16], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE))
+        tbx = thrust * math.sin(gimbal_pitch)
+        tby = thrust * math.sin(gimbal_yaw)
+        tbz = thrust * math.cos(gimbal_pitch) * math.cos(gimbal_yaw)
+        
+        # Rotate by orientation: v + w*t + q×t, with t = 2 q×v
+        tx = 2.0 * (qy*tbz - qz*tby)
+        ty = 2.0 * (qz*tbx - qx*tbz)
+        tz = 2.0 * (qx*tby - qy*tbx)
+        rx = tbx + qw*tx + (qy*tz - qz*ty)
+        ry = tby + qw*ty + (qz*tx - qx*tz)
+        rz = tbz + qw*tz + (qx*ty - qy*tx)
+        
+        # Body z (up) maps to world y (vertical): swap y and z after rotation
+        fx = rx
+        fy = rz
+        fz = ry
+    
+    # Rotation matrix (body -> world) from normalized quaternion
+    norm = math.sqrt(qw*qw + qx*qx + qy*qy + qz*qz)
+    if norm > 0:
+        nw, nx, ny, nz = qw/norm, qx/norm, qy/norm, qz/norm
+    else:
+        nw, nx, ny, nz = qw, qx, qy, qz
+    r00 = 1 - 2*(ny*ny + nz*nz)
+    r01 = 2*(nx*ny - nw*nz)
+    r02 = 2*(nx*nz + nw*ny)
+    r10 = 2*(nx*ny + nw*nz)
+    r11 = 1 - 2*(nx*nx + nz*nz)
+    r12 = 2*(ny*nz - nw*nx)
+    r20 = 2*(nx*nz - nw*ny)
+    r21 = 2*(ny*nz + nw*nx)
+    r22 = 1 - 2*(nx*nx + ny*ny)
+    
+    # Air-relative velocity (world), then body frame: R^T v
+    ux = vx - wind_x
+    uy = vy
+    uz = vz - wind_z
+    bu = r00*ux + r10*uy + r20*uz
+    bv = r01*ux + r11*uy + r21*uz
+    bw = r02*ux + r12*uy + r22*uz
+    
+    # Aerodynamic force in body frame
+    ax_b, ay_b, az_b = _aero_force_body(bu, bv, bw, py, p[P_AREA])
+    
+    # Aerodynamic force in world frame: R f
+    aw_x = r00*ax_b + r01*ay_b + r02*az_b
+    aw_y = r10*ax_b + r11*ay_b + r12*az_b
+    aw_z = r20*ax_b + r21*ay_b + r22*az_b
+    
+    # Falling straight down: keep drag purely vertical (no numerical side force)
+    if math.sqrt(vx*vx + vz*vz) < 0.1:
+        aw_x = 0.0
+        aw_z = 0.0
+    
+    # Total force and translational acceleration (world frame)
+    acc_x = (fx + aw_x) / mass
+    acc_y = (-GRAVITY * mass + fy + aw_y) / mass
+    acc_z = (fz + aw_z) / mass
+    
+    # Thrust torque: r_com_to_engine × F_thrust, r = [0, 0, -com_z]
+    tau_x = com_z * tby
+    tau_y = -com_z * tbx
+    tau_z = 0.0
+    
+    # Aerodynamic torque about COM from the centre of pressure (scaled for stability).
+    # Pure side force (vertical drag when upright) acts through the COM: no torque.
+    force_mag = math.sqrt(ax_b*ax_b + ay_b*ay_b + az_b*az_b)
+    side_only = False
+    if force_mag > 0.1:
+        side_only = (abs(ay_b / force_mag) > 0.99 and abs(ax_b / force_mag) < 0.01
+                     and abs(az_b / force_mag) < 0.01)
+    if not side_only:
+        arm = p[P_HEIGHT] * 0.5 - com_z
+        tau_x += -arm * ay_b * AERO_TORQUE_SCALE
+        tau_y += arm * ax_b * AERO_TORQUE_SCALE
+    
+    # Rotational damping
+    tau_x -= DAMPING_COEFFICIENT * wx
+    tau_y -= DAMPING_COEFFICIENT * wy
+    tau_z -= DAMPING_COEFFICIENT * wz
+    
+    # Inertia tensor (diagonal) about combined COM, parallel axis theorem
+    r = p[P_RADIUS]
+    h = p[P_HEIGHT]
+    dry_offset = com_z - p[P_COM_HEIGHT]
+    ixx = (1/12) * dry_mass * (3*r**2 + h**2) + dry_mass * dry_offset**2
+    iyy = (1/2) * dry_mass * r**2
+    if fuel_c > 0:
+        fuel_offset = com_z - p[P_FUEL_COM_HEIGHT]
+        ixx += (1/12) * fuel_c * (3*r**2 + h**2) + fuel_c * fuel_offset**2
+        iyy += (1/2) * fuel_c * r**2
+    izz = ixx
+    
+    # Euler's equations: ω̇ = I⁻¹(τ - ω × Iω)
+    lx = ixx * wx
+    ly = iyy * wy
+    lz = izz * wz
+    alpha_x = (1.0 / ixx) * (tau_x - (wy*lz - wz*ly))
+    alpha_y = (1.0 / iyy) * (tau_y - (wz*lx - wx*lz))
+    alpha_z = (1.0 / izz) * (tau_z - (wx*ly - wy*lx))
+    
+    # Semi-implicit Euler: translation
+    vx += acc_x * dt
+    vz += acc_z * dt
+    px += vx * dt
+    pz += vz * dt
+    if p[P_VERTICAL_RK4] != 0.0:
+        # Classic RK4 over the tick for altitude and vertical velocity, where
+        # quadratic drag in thickening air makes a constant-acceleration step
+        # least accurate at larger dt. Drag is re-evaluated at the stage
+        # velocities and altitudes, and mass follows the fuel burn; attitude,
+        # thrust and horizontal velocity keep their start-of-tick values.
+        area = p[P_AREA]
+        half_dt = 0.5 * dt
+        burn_rate = 0.0
+        if throttle > 0 and fuel_c > 0:
+            burn_rate = p[P_MASS_FLOW] * throttle
+        mass_mid = dry_mass + max(0.0, fuel_c - burn_rate * half_dt)
+        mass_end = dry_mass + max(0.0, fuel_c - burn_rate * dt)
+        k1 = acc_y
+        v2 = half_dt * k1
+        k2 = (fy + _vertical_aero_force(bu, bv, bw, r10, r11, r12, v2, py + half_dt*vy, area)) / mass_mid - GRAVITY
+        v3 = half_dt * k2
+        k3 = (fy + _vertical_aero_force(bu, bv, bw, r10, r11, r12, v3, py + half_dt*(vy + v2), area)) / mass_mid - GRAVITY
+        v4 = dt * k3
+        k4 = (fy + _vertical_aero_force(bu, bv, bw, r10, r11, r12, v4, py + dt*(vy + v3), area)) / mass_end - GRAVITY
+        py += dt * (vy + (v2 + v3 + 0.5*v4) / 3.0)
+        acc_y = (k1 + 2.0*(k2 + k3) + k4) / 6.0
+        vy += acc_y * dt
+    else:
+        vy += acc_y * dt
+        py += vy * dt
+    
+    # Rotation, with angular rate limited for stability
+    wx += alpha_x * dt
+    wy += alpha_y * dt
+    wz += alpha_z * dt
+    omega_mag = math.sqrt(wx*wx + wy*wy + wz*wz)
+    if omega_mag > MAX_ANGULAR_VELOCITY:
+        scale = MAX_ANGULAR_VELOCITY / omega_mag
+        wx *= scale
+        wy *= scale
+        wz *= scale
+        omega_mag = math.sqrt(wx*wx + wy*wy + wz*wz)
+    
+    # Orientation increment dq from angular velocity (axis-angle), q_new = q * dq.
+    # Not rotating at all (the usual upright, undisturbed descent) makes dq the
+    # identity, whose product is q exactly, so it is skipped.
+    if omega_mag == 0.0:
+        nw, nx, ny, nz = qw, qx, qy, qz
+    else:
+        angle = omega_mag * dt
+        if angle > 1e-10:
+            half_angle = angle / 2.0
+            sin_half = math.sin(half_angle)
+            dw = math.cos(half_angle)
+            dx = (wx / omega_mag) * sin_half
+            dy = (wy / omega_mag) * sin_half
+            dz = (wz / omega_mag) * sin_half
+        else:
+            # Small angle approximation
+            dw = 1.0
+            dx = 0.5 * dt * wx
+            dy = 0.5 * dt * wy
+            dz = 0.5 * dt * wz
+        nw = qw*dw - qx*dx - qy*dy - qz*dz
+        nx = qw*dx + qx*dw + qy*dz - qz*dy
+        ny = qw*dy - qx*dz + qy*dw + qz*dx
+        nz = qw*dz + qx*dy - qy*dx + qz*dw
+    
+    # Normalize (identity if degenerate)
+    norm = math.sqrt(nw*nw + nx*nx + ny*ny + nz*nz)
+    if norm > 1e-10:
+        nw /= norm
+        nx /= norm
+        ny /= norm
+        nz /= norm
+    else:
+        nw, nx, ny, nz = 1.0, 0.0, 0.0, 0.0
+    
+    # Fall back to previous orientation if the update is not finite
+    if math.isfinite(nw) and math.isfinite(nx) and math.isfinite(ny) and math.isfinite(nz):
+        s[6] = nw
+        s[7] = nx
+        s[8] = ny
+        s[9] = nz
+    
+    s[0] = px
+    s[1] = py
+    s[2] = pz
+    s[3] = vx
+    s[4] = vy
+    s[5] = vz
+    s[10] = wx
+    s[11] = wy
+    s[12] = wz
+    s[17] = acc_x
+    s[18] = acc_y
+    s[19] = acc_z
+    
+    # Fuel consumption proportional to throttle
+    if throttle > 0 and fuel > 0:
+        s[S_FUEL] = max(0.0, fuel - p[P_MASS_FLOW] * throttle * dt)
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def step_simple_kernel(s, p, dt):
+    """
+    Advance one rocket state vector by one simplified step, in place.
+    
+    Same model as PhysicsEngine.step_simple's original per-force methods:
+    gimbaled thrust, drag along the velocity with the axial coefficient,
+    gimbal torque with fixed inertia and damping, and fuel consumption.
+    Wind and aerodynamic torque are not modelled.
+    
+    Args:
+        s: State vector (STATE_SIZE), updated in place
+        p: Parameter vector (PARAM_SIZE)
+        dt: Time step (seconds)
+    """
+    px, py, pz = s[0], s[1], s[2]
+    vx, vy, vz = s[3], s[4], s[5]
+    qw, qx, qy, qz = s[6], s[7], s[8], s[9]
+    wx, wy, wz = s[10], s[11], s[12]
+    fuel = s[S_FUEL]
+    throttle = s[S_THROTTLE]
+    burning = throttle > 0 and fuel > 0
+    
+    mass = p[P_DRY_MASS] + max(0.0, min(fuel, p[P_FUEL_CAPACITY]))
+    
+    # Thrust (see PhysicsEngine.get_thrust_vector)
+    fx = 0.0
+    fy = 0.0
+    fz = 0.0
+    if burning:
+        thrust = p[P_THRUST] * throttle
+        gimbal_pitch = math.radians(min(max(s[15], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE))
+        gimbal_yaw = math.radians(min(max(s[16], -ENGINE_GIMBAL_RANGE), ENGINE_GIMBAL_RANGE))
+        tbx = thrust * math.sin(gimbal_pitch)
+        tby = thrust * math.sin(gimbal_yaw)
+        tbz = thrust * math.cos(gimbal_pitch) * math.cos(gimbal_yaw)
+        
+        # Rotate by orientation: v + w*t + q×t, with t = 2 q×v
+        tx = 2.0 * (qy*tbz - qz*tby)
+        ty = 2.0 * (qz*tbx - qx*tbz)
+        tz = 2.0 * (qx*tby - qy*tbx)
+        
+        # Body z (up) maps to world y (vertical): swap y and z after rotation
+        fx = tbx + qw*tx + (qy*tz - qz*ty)
+        fy = tbz + qw*tz + (qx*ty - qy*tx)
+        fz = tby + qw*ty + (qz*tx - qx*tz)
+    
+    # Drag opposite to the velocity, q * A * Cd along -v / |v|, as k * v
+    # (see PhysicsEngine.get_drag_force)
+    speed_sq = vx*vx + vy*vy + vz*vz
+    if speed_sq >= 0.01:
+        k = 0.5 * air_density(py) * math.sqrt(speed_sq) * p[P_AREA] * DRAG_COEFFICIENT_AXIAL
+        fx -= k * vx
+        fy -= k * vy
+        fz -= k * vz
+    
+    # Gravity, acceleration and semi-implicit Euler
+    acc_x = fx / mass
+    acc_y = (fy - GRAVITY * mass) / mass
+    acc_z = fz / mass
+    vx += acc_x * dt
+    vy += acc_y * dt
+    vz += acc_z * dt
+    px += vx * dt
+    py += vy * dt
+    pz += vz * dt
+    
+    # Gimbal torque and damping (see PhysicsEngine.apply_control_torques)
+    if burning:
+        torque_scale = p[P_THRUST] * throttle * ROCKET_COM_HEIGHT * 0.001 / ROCKET_MOI_PITCH
+        wx += torque_scale * math.sin(math.radians(s[15])) * dt
+        wz += torque_scale * math.sin(math.radians(s[16])) * dt
+    wx *= 0.98
+    wy *= 0.98
+    wz *= 0.98
+    
+    # Orientation update q * dq, renormalized (see PhysicsEngine.update_orientation)
+    omega_mag = math.sqrt(wx*wx + wy*wy + wz*wz)
+    if omega_mag > 1e-10:
+        half_angle = omega_mag * dt / 2
+        sin_half = math.sin(half_angle) / omega_mag
+        dw = math.cos(half_angle)
+        dx = wx * sin_half
+        dy = wy * sin_half
+        dz = wz * sin_half
+        nw = qw*dw - qx*dx - qy*dy - qz*dz
+        nx = qw*dx + qx*dw + qy*dz - qz*dy
+        ny = qw*dy - qx*dz + qy*dw + qz*dx
+        nz = qw*dz + qx*dy - qy*dx + qz*dw
+        norm = math.sqrt(nw*nw + nx*nx + ny*ny + nz*nz)
+        s[6] = nw / norm
+        s[7] = nx / norm
+        s[8] = ny / norm
+        s[9] = nz / norm
+    
+    s[0] = px
+    s[1] = py
+    s[2] = pz
+    s[3] = vx
+    s[4] = vy
+    s[5] = vz
+    s[10] = wx
+    s[11] = wy
+    s[12] = wz
+    s[17] = acc_x
+    s[18] = acc_y
+    s[19] = acc_z
+    
+    # Fuel consumption proportional to throttle
+    if burning:
+        s[S_FUEL] = max(0.0, fuel - p[P_MASS_FLOW] * throttle * dt)
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS, parallel=True)
+def step_6dof_batch(states, params, wind, dt):
+    """
+    Advance many rocket state vectors by one 6-DOF step, in place.
+    
+    Args:
+        states: (N, STATE_SIZE) state vectors, one rocket per row
+        params: (N, PARAM_SIZE) parameter vectors
+        wind: (N, 2) wind velocity x, z at each rocket's altitude (m/s)
+        dt: Time step (seconds)
+    """
+    for i in prange(states.shape[0]):
+        step_6dof_kernel(states[i], params[i], wind[i, 0], wind[i, 1], dt)
+
+
+@njit(cache=True)
+def bottom_altitude(s, p):
+    """
+    Altitude of the rocket's bottom (engine end): the COM plus the world
+    y-component, -1 + 2(x² + z²), of the rotated body down axis [0, -1, 0].
+    
+    Compiled without fast-math so it matches the NumPy form of the same
+    expression bit for bit.
+    """
+    qx = s[S_QUAT + 1]
+    qz = s[S_QUAT + 3]
+    return s[S_POS + 1] + (-1.0 + 2.0 * (qx*qx + qz*qz)) * p[P_COM_HEIGHT]
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS, parallel=True)
+def rollout_6dof_batch(states, params, wind, controls, active, dt, ticks):
+    """
+    Advance many rockets through T ticks of open-loop controls, in place.
+    
+    Each rocket runs its whole rollout in one thread with the state kept
+    in its row, stopping after the tick on which its bottom reaches the
+    ground (landing evaluation is left to the caller).
+    
+    Args:
+        states: (N, STATE_SIZE) state vectors, one rocket per row
+        params: (N, PARAM_SIZE) parameter vectors
+        wind: (N, 2) wind velocity x, z for each rocket (m/s), held constant
+        controls: (N, T, 3) throttle, gimbal pitch, gimbal yaw (degrees) per
+            rocket and tick, already clamped (rocket-major, so each thread
+            reads its controls contiguously)
+        active: (N,) mask of rockets to advance
+        dt: Time step (seconds)
+        ticks: (N,) int output, number of ticks each rocket was advanced
+    """
+    for i in prange(states.shape[0]):
+        if not active[i]:
+            ticks[i] = 0
+            continue
+        s = states[i]
+        p = params[i]
+        wind_x = wind[i, 0]
+        wind_z = wind[i, 1]
+        n = 0
+        while n < controls.shape[1]:
+            s[S_THROTTLE] = controls[i, n, 0]
+            s[S_GIMBAL] = controls[i, n, 1]
+            s[S_GIMBAL + 1] = controls[i, n, 2]
+            step_6dof_kernel(s, p, wind_x, wind_z, dt)
+            n += 1
+            if bottom_altitude(s, p) <= 0:
+                break
+        ticks[i] = n
+
+
+def _warmup():
+    """Compile (or load from cache) the kernels at import time."""
+    state = np.zeros(STATE_SIZE)
+    state[S_POS + 1] = 1000.0
+    state[S_VEL + 1] = -100.0
+    state[S_QUAT] = 1.0
+    state[S_FUEL] = 1000.0
+    state[S_THROTTLE] = 0.5
+    params = np.ones(PARAM_SIZE)
+    step_6dof_kernel(state, params, 0.0, 0.0, 0.01)
+    step_simple_kernel(state, params, 0.01)
+    step_6dof_batch(state.reshape(1, STATE_SIZE), params.reshape(1, PARAM_SIZE),
+                    np.zeros((1, 2)), 0.01)
+    rollout_6dof_batch(state.reshape(1, STATE_SIZE), params.reshape(1, PARAM_SIZE),
+                       np.zeros((1, 2)), np.zeros((1, 1, 3)), np.ones(1, dtype=np.bool_),
+                       0.01, np.zeros(1, dtype=np.int64))
+
+
+_warmup()
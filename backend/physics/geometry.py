@@ -7,6 +7,7 @@ Models the rocket as a configurable cylinder with variable mass distribution.
 import numpy as np
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from .constants import (
@@ -15,6 +16,11 @@ from .constants import (
     ROCKET_DRY_MASS,
     ROCKET_FUEL_MASS,
     ROCKET_COM_HEIGHT,
+    GRAVITY,
+    SEA_LEVEL_DENSITY,
+    SEA_LEVEL_TEMPERATURE,
+    TEMPERATURE_LAPSE_RATE,
+    INITIAL_ALTITUDE,
 )
 
 
@@ -254,15 +260,11 @@ def calculate_terminal_velocity(total_mass: float, diameter: float, altitude: fl
     Returns:
         Terminal velocity in m/s (negative for downward)
     """
-    GRAVITY = 9.80665  # m/s²
-    SEA_LEVEL_DENSITY = 1.225  # kg/m³
-    SEA_LEVEL_TEMP = 288.15  # K
-    TEMP_LAPSE = 0.0065  # K/m
     Cd = 0.6  # Drag coefficient (axial, subsonic, cylindrical body)
     
     # Atmospheric density at altitude (simplified ISA model)
-    temp_at_alt = SEA_LEVEL_TEMP - TEMP_LAPSE * altitude
-    density = SEA_LEVEL_DENSITY * (temp_at_alt / SEA_LEVEL_TEMP) ** 4.256
+    temp_at_alt = SEA_LEVEL_TEMPERATURE - TEMPERATURE_LAPSE_RATE * altitude
+    density = SEA_LEVEL_DENSITY * (temp_at_alt / SEA_LEVEL_TEMPERATURE) ** 4.256
     
     # Cross-sectional area
     area = math.pi * (diameter / 2) ** 2
@@ -293,9 +295,6 @@ def calculate_landing_fuel(dry_mass: float, thrust_kn: float, isp: float, diamet
     Returns:
         Optimal landing fuel in kg (rounded to nearest 100 kg)
     """
-    GRAVITY = 9.80665  # m/s²
-    INITIAL_ALTITUDE = 5000.0  # meters
-    
     # Convert thrust to Newtons
     thrust_n = thrust_kn * 1000
     
@@ -646,3 +645,18 @@ def create_rocket_from_preset(preset_name: str) -> RocketGeometry:
     """
     config = RocketPresets.get_preset(preset_name)
     return RocketGeometry(config=config)
+
+
+@lru_cache(maxsize=32)
+def get_shared_geometry(preset_name: str) -> RocketGeometry:
+    """
+    Shared RocketGeometry for a preset, built once per process.
+    
+    Geometry is never modified after construction, so every session flying
+    the same preset can use one instance. Treat the result (and its config)
+    as read-only.
+    
+    Raises:
+        ValueError: If the preset name is unknown
+    """
+    return create_rocket_from_preset(preset_name)
@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support.
+
+Hot-path kernels are written as plain scalar Python so they run unchanged
+when Numba is not installed. With Numba available they are compiled to
+native code on first call and cached on disk.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -4,6 +4,7 @@
 Implements Euler's equations for translational and rotational motion.
 """
 
+import math
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional
@@ -161,7 +162,8 @@ class RigidBodyDynamics:
         # Limit angular velocity to prevent excessive rotation
         # Max angular velocity: ~30 deg/s (0.52 rad/s) for stability
         max_angular_velocity = 0.52  # rad/s
-        angular_velocity_mag = np.linalg.norm(new_angular_velocity)
+        wx, wy, wz = float(new_angular_velocity[0]), float(new_angular_velocity[1]), float(new_angular_velocity[2])
+        angular_velocity_mag = math.sqrt(wx*wx + wy*wy + wz*wz)
         if angular_velocity_mag > max_angular_velocity:
             new_angular_velocity = new_angular_velocity * (max_angular_velocity / angular_velocity_mag)
         
@@ -177,7 +179,8 @@ class RigidBodyDynamics:
             new_orientation = state.orientation.copy()
         
         # Ensure quaternion magnitude is reasonable
-        q_mag = np.linalg.norm(new_orientation)
+        qw, qx, qy, qz = (float(c) for c in new_orientation)
+        q_mag = math.sqrt(qw*qw + qx*qx + qy*qy + qz*qz)
         if q_mag < 0.5 or q_mag > 2.0:
             # Renormalize if magnitude is way off
             new_orientation = new_orientation / q_mag if q_mag > 0 else np.array([1.0, 0.0, 0.0, 0.0])
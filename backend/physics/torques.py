@@ -7,6 +7,7 @@ Calculates all torques acting on the rocket:
 - Other torques (damping, etc.)
 """
 
+import math
 import numpy as np
 from typing import Optional
 
@@ -84,7 +85,8 @@ class TorqueCalculator:
         # Check if force is purely vertical drag (side force only, no axial/normal)
         # When falling straight down, drag is in y-direction (body frame)
         # and should act through COM, not CP, to avoid unwanted torque
-        force_mag = np.linalg.norm(aero_force_body)
+        fx, fy, fz = float(aero_force_body[0]), float(aero_force_body[1]), float(aero_force_body[2])
+        force_mag = math.sqrt(fx*fx + fy*fy + fz*fz)
         if force_mag > 0.1:
             # Check if force is primarily in y-direction (side/vertical drag)
             force_normalized = aero_force_body / force_mag
@@ -5,8 +5,11 @@ Provides utilities for converting between body frame and world frame
 using quaternion-based rotation matrices.
 """
 
+import math
 import numpy as np
 
+from .jit import njit
+
 
 def quaternion_to_rotation_matrix(q: np.ndarray) -> np.ndarray:
     """
@@ -24,7 +27,7 @@ def quaternion_to_rotation_matrix(q: np.ndarray) -> np.ndarray:
     w, x, y, z = q
     
     # Normalize quaternion
-    norm = np.sqrt(w*w + x*x + y*y + z*z)
+    norm = math.sqrt(w*w + x*x + y*y + z*z)
     if norm > 0:
         w, x, y, z = w/norm, x/norm, y/norm, z/norm
     
@@ -96,6 +99,86 @@ def quaternion_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
     ])
 
 
+@njit(cache=True)
+def _quaternion_multiply_rows(q1, q2, out):
+    """Row-wise Hamilton product kernel (see quaternion_multiply_batch)."""
+    for i in range(q1.shape[0]):
+        # Load both rows first so out may alias q1 or q2
+        w1, x1, y1, z1 = q1[i, 0], q1[i, 1], q1[i, 2], q1[i, 3]
+        w2, x2, y2, z2 = q2[i, 0], q2[i, 1], q2[i, 2], q2[i, 3]
+        out[i, 0] = w1*w2 - x1*x2 - y1*y2 - z1*z2
+        out[i, 1] = w1*x2 + x1*w2 + y1*z2 - z1*y2
+        out[i, 2] = w1*y2 - x1*z2 + y1*w2 + z1*x2
+        out[i, 3] = w1*z2 + x1*y2 - y1*x2 + z1*w2
+
+
+def quaternion_multiply_batch(q1: np.ndarray, q2: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Multiply N pairs of quaternions: out[i] = q1[i] * q2[i]
+    
+    One compiled loop over the rows (the per-row products are independent,
+    so the compiler can vectorize across rockets). Same arithmetic as
+    quaternion_multiply, so results match it exactly.
+    
+    Args:
+        q1: First quaternions, shape (N, 4), rows [w, x, y, z]
+        q2: Second quaternions, shape (N, 4)
+        out: Optional (N, 4) array for the result; may be q1 or q2 for an
+            in-place update
+    
+    Returns:
+        Product quaternions, shape (N, 4) (`out` when given)
+    """
+    dtype = np.result_type(q1, q2)
+    q1 = np.asarray(q1, dtype=dtype)
+    q2 = np.asarray(q2, dtype=dtype)
+    if out is None:
+        out = np.empty(q1.shape, dtype=dtype)
+    _quaternion_multiply_rows(q1, q2, out)
+    return out
+
+
+@njit(cache=True)
+def _quaternion_multiply_columns(q1, q2, out):
+    """Component-wise (SoA) Hamilton product kernel (see quaternion_multiply_soa)."""
+    for i in range(q1.shape[1]):
+        # Load both columns first so out may alias q1 or q2
+        w1, x1, y1, z1 = q1[0, i], q1[1, i], q1[2, i], q1[3, i]
+        w2, x2, y2, z2 = q2[0, i], q2[1, i], q2[2, i], q2[3, i]
+        out[0, i] = w1*w2 - x1*x2 - y1*y2 - z1*z2
+        out[1, i] = w1*x2 + x1*w2 + y1*z2 - z1*y2
+        out[2, i] = w1*y2 - x1*z2 + y1*w2 + z1*x2
+        out[3, i] = w1*z2 + x1*y2 - y1*x2 + z1*w2
+
+
+def quaternion_multiply_soa(q1: np.ndarray, q2: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Multiply N pairs of quaternions stored component-wise: out[:, i] = q1[:, i] * q2[:, i]
+    
+    Structure-of-arrays counterpart of quaternion_multiply_batch: each
+    component is one contiguous row, so every load and store in the loop
+    is unit-stride and the compiler packs several rockets into each SIMD
+    instruction (float32 input packs twice as many). Same arithmetic as
+    quaternion_multiply.
+    
+    Args:
+        q1: First quaternions, shape (4, N), rows w, x, y, z
+        q2: Second quaternions, shape (4, N)
+        out: Optional (4, N) array for the result; may be q1 or q2 for an
+            in-place update
+    
+    Returns:
+        Product quaternions, shape (4, N) (`out` when given)
+    """
+    dtype = np.result_type(q1, q2)
+    q1 = np.ascontiguousarray(q1, dtype=dtype)
+    q2 = np.ascontiguousarray(q2, dtype=dtype)
+    if out is None:
+        out = np.empty(q1.shape, dtype=dtype)
+    _quaternion_multiply_columns(q1, q2, out)
+    return out
+
+
 def quaternion_normalize(q: np.ndarray) -> np.ndarray:
     """
     Normalize quaternion to unit length.
@@ -106,7 +189,8 @@ def quaternion_normalize(q: np.ndarray) -> np.ndarray:
     Returns:
         Normalized quaternion [w, x, y, z]
     """
-    norm = np.linalg.norm(q)
+    w, x, y, z = float(q[0]), float(q[1]), float(q[2]), float(q[3])
+    norm = math.sqrt(w*w + x*x + y*y + z*z)
     if norm > 1e-10:
         return q / norm
     return np.array([1.0, 0.0, 0.0, 0.0])  # Default to identity
@@ -134,9 +218,11 @@ def quaternion_from_angular_velocity(omega: np.ndarray, dt: float) -> np.ndarray
     
     # Convert to proper quaternion format [w, x, y, z]
     # For small rotations: q ≈ [1, 0.5*ωx*dt, 0.5*ωy*dt, 0.5*ωz*dt]
-    angle = np.linalg.norm(omega) * dt
+    wx, wy, wz = float(omega[0]), float(omega[1]), float(omega[2])
+    omega_mag = math.sqrt(wx*wx + wy*wy + wz*wz)
+    angle = omega_mag * dt
     if angle > 1e-10:
-        axis = omega / np.linalg.norm(omega)
+        axis = omega / omega_mag
         half_angle = angle / 2.0
         return np.array([
             np.cos(half_angle),
@@ -161,6 +247,10 @@ def integrate_quaternion(q: np.ndarray, omega: np.ndarray, dt: float) -> np.ndar
     Returns:
         Updated quaternion [w, x, y, z] (normalized)
     """
+    # No rotation: the increment is the identity and q * dq is q itself
+    if omega[0] == 0.0 and omega[1] == 0.0 and omega[2] == 0.0:
+        return quaternion_normalize(q)
+    
     # Get quaternion increment
     dq = quaternion_from_angular_velocity(omega, dt)
     
@@ -170,3 +260,28 @@ def integrate_quaternion(q: np.ndarray, omega: np.ndarray, dt: float) -> np.ndar
     # Normalize to prevent drift
     return quaternion_normalize(q_new)
 
+
+@njit(cache=True, fastmath=True)
+def tilt_from_quaternion(w: float, x: float, y: float, z: float) -> float:
+    """
+    Tilt angle of the body up axis from world vertical.
+    
+    Only the y-component of the rotated up vector is needed:
+    up_world[1] = 1 - 2(x² + z²).
+    
+    Args:
+        w, x, y, z: Orientation quaternion components
+        
+    Returns:
+        Tilt angle in degrees (0 = upright)
+    """
+    uy = 1.0 - 2.0 * (x*x + z*z)
+    if uy > 1.0:
+        uy = 1.0
+    elif uy < -1.0:
+        uy = -1.0
+    return math.degrees(math.acos(uy))
+
+
+# Warm up (compile or load from cache) at import time
+tilt_from_quaternion(1.0, 0.0, 0.0, 0.0)
@@ -209,8 +209,8 @@ class WindModel:
         Returns:
             Wind speed magnitude (m/s)
         """
-        wind_velocity = self.get_wind_velocity(altitude)
-        return np.linalg.norm(wind_velocity)
+        wx, wy, wz = self.get_wind_velocity(altitude)
+        return math.sqrt(wx*wx + wy*wy + wz*wz)
     
     def get_wind_direction(self, altitude: float = 0.0) -> float:
         """
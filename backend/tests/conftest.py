@@ -0,0 +1,6 @@
+"""Test setup: make the backend packages importable as in main.py."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
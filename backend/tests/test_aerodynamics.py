@@ -0,0 +1,84 @@
+"""Aerodynamics model checks."""
+
+import math
+
+import numpy as np
+import pytest
+
+from physics.aerodynamics import (
+    AerodynamicsModel,
+    DragModel,
+    TERMINAL_VELOCITY_TOLERANCE,
+)
+from physics.atmosphere import Atmosphere
+from physics.constants import GAS_CONSTANT, GRAVITY, MOLAR_MASS_AIR, ROCKET_CROSS_SECTION
+
+
+def _fixed_point_residual(model, mass, altitude, orientation, v_term):
+    """Relative change one more fixed-point step would make to v_term."""
+    drag_model = model.drag_model
+    density, speed_of_sound = drag_model.atmosphere.get_density_and_speed_of_sound(altitude)
+    mach = v_term / speed_of_sound
+    if orientation == "axial":
+        cd = drag_model.get_axial_drag_coefficient(mach)
+    else:
+        cd = drag_model.get_normal_drag_coefficient(0.0, mach)
+    v_next = math.sqrt(2 * mass * GRAVITY / (density * ROCKET_CROSS_SECTION * cd))
+    return abs(v_next - v_term) / v_term
+
+
+@pytest.mark.parametrize("orientation", ["axial", "normal"])
+def test_terminal_velocity_reaches_tolerance(orientation):
+    model = AerodynamicsModel()
+    for mass in np.linspace(1_000, 500_000, 25):
+        for altitude in np.linspace(0, 40_000, 41):
+            v_term = model.calculate_terminal_velocity(
+                mass, ROCKET_CROSS_SECTION, altitude, orientation
+            )
+            residual = _fixed_point_residual(model, mass, altitude, orientation, v_term)
+            assert residual < TERMINAL_VELOCITY_TOLERANCE, (mass, altitude, v_term)
+
+
+def test_terminal_velocity_supersonic_axial():
+    # Cd ~ 1/M above Mach 1.2, so the fixed point is v = 2mg / (ρ A 0.892 a)
+    model = AerodynamicsModel()
+    density, speed_of_sound = model.drag_model.atmosphere.get_density_and_speed_of_sound(12_000)
+    expected = 2 * 30_000 * GRAVITY / (density * ROCKET_CROSS_SECTION * 0.892 * speed_of_sound)
+    assert expected > 1.2 * speed_of_sound
+
+    v_term = model.calculate_terminal_velocity(30_000, ROCKET_CROSS_SECTION, 12_000)
+    assert v_term == pytest.approx(expected, rel=2 * TERMINAL_VELOCITY_TOLERANCE)
+
+
+def test_terminal_velocity_profile_matches_scalar():
+    model = AerodynamicsModel()
+    altitudes = np.linspace(0, 30_000, 31)
+    v_axial, v_normal = model.calculate_terminal_velocity_profile(30_000, ROCKET_CROSS_SECTION, altitudes)
+    for altitude, axial, normal in zip(altitudes, v_axial, v_normal):
+        expected = model.calculate_terminal_velocity_range(30_000, ROCKET_CROSS_SECTION, altitude)
+        assert (axial, normal) == pytest.approx(expected, rel=1e-12)
+
+
+class _HotAtmosphere(Atmosphere):
+    """Standard atmosphere 30 K warmer (custom model for DragModel)."""
+    
+    @staticmethod
+    def get_speed_of_sound(altitude):
+        return math.sqrt(1.4 * GAS_CONSTANT * (Atmosphere.get_temperature(altitude) + 30.0) / MOLAR_MASS_AIR)
+    
+    @staticmethod
+    def get_speed_of_sound_array(altitude):
+        return np.sqrt(1.4 * GAS_CONSTANT * (Atmosphere.get_temperature_array(altitude) + 30.0) / MOLAR_MASS_AIR)
+
+
+@pytest.mark.parametrize("atmosphere", [None, _HotAtmosphere()])
+def test_scalar_mach_matches_batch(atmosphere):
+    drag_model = DragModel(atmosphere)
+    velocities = np.linspace(0.0, 900.0, 19)
+    altitudes = np.linspace(-100.0, 30_000.0, 19)
+    batch = drag_model.get_mach_number_batch(velocities, altitudes)
+    for velocity, altitude, expected in zip(velocities, altitudes, batch):
+        assert drag_model.get_mach_number(velocity, altitude) == pytest.approx(expected, rel=1e-12)
+        assert drag_model.get_drag_coefficient_axial(velocity, altitude) == pytest.approx(
+            drag_model.get_axial_drag_coefficient(expected), rel=1e-12
+        )
@@ -0,0 +1,89 @@
+"""BatchPhysicsEngine against per-rocket PhysicsEngine runs."""
+
+import numpy as np
+import pytest
+
+from physics.aerodynamics import get_shared_aerodynamics
+from physics.batch_engine import BatchPhysicsEngine
+from physics.engine import PhysicsEngine
+from physics.geometry import get_shared_geometry
+from physics.wind import WindConfig
+
+
+N = 8
+
+
+def _throttle(altitude, vertical_velocity, row):
+    """Per-rocket landing-burn schedule (staggered start altitudes)."""
+    return np.where((altitude < 1900 + 60 * row) & (vertical_velocity < -3), 1.0,
+                    np.where(vertical_velocity < -1, 0.45, 0.0))
+
+
+@pytest.fixture
+def dispersed():
+    """A batch and matching single engines with dispersed x position and velocity."""
+    geometry = get_shared_geometry("falcon9_block5_landing")
+    rng = np.random.default_rng(0)
+    dv = rng.normal(0.0, 3.0, N)
+    dx = rng.normal(0.0, 8.0, N)
+    
+    batch = BatchPhysicsEngine(N, geometry=geometry, difficulty="easy")
+    batch.velocity[:, 0] += dv
+    batch.position[:, 0] += dx
+    
+    engines = [
+        PhysicsEngine(wind_config=WindConfig(enabled=False), difficulty="easy", geometry=geometry,
+                      aerodynamics=get_shared_aerodynamics())
+        for _ in range(N)
+    ]
+    for i, engine in enumerate(engines):
+        engine.state.velocity[0] += dv[i]
+        engine.state.position[0] += dx[i]
+    return batch, engines
+
+
+def test_batch_step_matches_engines(dispersed):
+    batch, engines = dispersed
+    rows = np.arange(N)
+    for _ in range(5000):
+        batch.set_input(_throttle(batch.position[:, 1], batch.velocity[:, 1], rows), (0.3, -0.2))
+        batch.step()
+        for i, engine in enumerate(engines):
+            if engine.state.landed or engine.state.crashed:
+                continue
+            state = engine.state
+            engine.set_input(throttle=float(_throttle(state.position[1], state.velocity[1], i)),
+                             gimbal=(0.3, -0.2))
+            engine.step()
+        if not batch.active.any():
+            break
+    
+    assert not batch.active.any()
+    np.testing.assert_array_equal(batch.position, [engine.state.position for engine in engines])
+    np.testing.assert_array_equal(batch.velocity, [engine.state.velocity for engine in engines])
+    np.testing.assert_array_equal(batch.fuel, [engine.state.fuel for engine in engines])
+    np.testing.assert_array_equal(batch.landed, [engine.state.landed for engine in engines])
+    np.testing.assert_array_equal(batch.crashed, [engine.state.crashed for engine in engines])
+    np.testing.assert_allclose(batch.finish_time, [engine.time for engine in engines], rtol=1e-12)
+    np.testing.assert_array_equal(batch.touchdown_velocity,
+                                  [engine.state.touchdown_velocity for engine in engines])
+
+
+def test_rollout_matches_step(dispersed):
+    stepped, _ = dispersed
+    rolled = BatchPhysicsEngine(N, geometry=stepped.geometry, difficulty="easy")
+    rolled.states[:] = stepped.states
+    
+    ticks = 3000
+    throttle = np.where(np.arange(ticks)[:, None] % 90 < 30, 0.8, 0.0) * np.ones((ticks, N))
+    gimbal = np.zeros((ticks, N, 2))
+    for t in range(ticks):
+        stepped.set_input(throttle[t], gimbal[t])
+        stepped.step()
+    rolled.rollout(throttle, gimbal)
+    
+    np.testing.assert_array_equal(rolled.states, stepped.states)
+    np.testing.assert_array_equal(rolled.crashed, stepped.crashed)
+    np.testing.assert_array_equal(rolled.landed, stepped.landed)
+    np.testing.assert_allclose(rolled.finish_time, stepped.finish_time, rtol=1e-12)
+    assert rolled.time == pytest.approx(stepped.time, rel=1e-12)
@@ -0,0 +1,132 @@
+"""Compiled 6-DOF kernel against the reference dynamics classes."""
+
+import numpy as np
+import pytest
+
+from physics.aerodynamics import get_shared_aerodynamics
+from physics.constants import ENGINE_GIMBAL_RANGE
+from physics.engine import PhysicsEngine
+from physics.engine_kernels import (
+    STATE_SIZE,
+    S_FUEL,
+    S_THROTTLE,
+    S_GIMBAL,
+    S_ACCEL,
+    step_6dof_kernel,
+)
+from physics.geometry import get_shared_geometry
+from physics.rigid_body import RigidBodyDynamics, RigidBodyState
+from physics.torques import TorqueCalculator
+from physics.transformations import body_to_world, world_to_body
+from physics.wind import WindConfig
+
+
+def _reference_step(engine, vec, wind_x, wind_z):
+    """
+    One 6-DOF step through RigidBodyDynamics / TorqueCalculator, as the
+    engine did before the compiled kernel (same state vector layout).
+    """
+    state = engine.state
+    state.position = vec[0:3].copy()
+    state.velocity = vec[3:6].copy()
+    state.orientation = vec[6:10].copy()
+    state.angular_velocity = vec[10:13].copy()
+    state.fuel = float(vec[S_FUEL])
+    state.throttle = float(vec[S_THROTTLE])
+    state.gimbal = vec[S_GIMBAL:S_GIMBAL + 2].copy()
+    geometry = engine.geometry
+    
+    # Forces in world frame
+    gravity = engine.get_gravity_force()
+    thrust_world = engine.get_thrust_vector()
+    relative_velocity_world = state.velocity - np.array([wind_x, 0.0, wind_z])
+    relative_velocity_body = world_to_body(relative_velocity_world, state.orientation)
+    aero_force_body = engine.aerodynamics.compute_aerodynamic_forces(
+        relative_velocity_body, state.position[1], geometry.cross_sectional_area
+    )
+    aero_force_world = body_to_world(aero_force_body, state.orientation)
+    if np.hypot(state.velocity[0], state.velocity[2]) < 0.1:
+        aero_force_world = np.array([0.0, aero_force_world[1], 0.0])
+    total_force_world = gravity + thrust_world + aero_force_world
+    
+    # Torques in body frame
+    if state.throttle > 0 and state.fuel > 0:
+        thrust_magnitude = geometry.config.thrust * state.throttle
+        gimbal_pitch, gimbal_yaw = np.radians(np.clip(state.gimbal, -ENGINE_GIMBAL_RANGE, ENGINE_GIMBAL_RANGE))
+        thrust_body = thrust_magnitude * np.array([
+            np.sin(gimbal_pitch),
+            np.sin(gimbal_yaw),
+            np.cos(gimbal_pitch) * np.cos(gimbal_yaw),
+        ])
+    else:
+        thrust_body = np.zeros(3)
+    total_torque_body = TorqueCalculator(geometry).compute_total_torque(
+        thrust_body=thrust_body,
+        aero_force_body=aero_force_body,
+        angular_velocity_body=state.angular_velocity,
+        fuel_remaining=state.fuel,
+    )
+    
+    new_state = RigidBodyDynamics(geometry).integrate(
+        state=RigidBodyState(state.position, state.velocity, state.orientation, state.angular_velocity),
+        forces_world=total_force_world,
+        torques_body=total_torque_body,
+        fuel_remaining=state.fuel,
+        dt=engine.dt,
+    )
+    engine.consume_fuel()
+    
+    out = vec.copy()
+    out[0:3] = new_state.position
+    out[3:6] = new_state.velocity
+    out[6:10] = new_state.orientation
+    out[10:13] = new_state.angular_velocity
+    out[S_FUEL] = state.fuel
+    out[S_ACCEL:S_ACCEL + 3] = total_force_world / geometry.get_mass(vec[S_FUEL])
+    return out
+
+
+def _random_states(rng, engine, n):
+    """Packed engine states with dispersed attitude, rates, controls and fuel."""
+    states = np.zeros((n, STATE_SIZE))
+    for i in range(n):
+        engine.pack_state(states[i])
+    states[:, 0] += rng.normal(0.0, 50.0, n)
+    states[:, 1] = rng.uniform(50.0, 15_000.0, n)
+    states[:, 3:6] += rng.normal(0.0, 30.0, (n, 3))
+    attitude = np.column_stack([np.ones(n), rng.normal(0.0, 0.1, (n, 3))])
+    states[:, 6:10] = attitude / np.linalg.norm(attitude, axis=1, keepdims=True)
+    states[:, 10:13] = rng.normal(0.0, 0.05, (n, 3))
+    states[:, S_FUEL] = rng.uniform(0.0, 1.2, n) * engine.geometry.config.fuel_mass
+    states[:, S_THROTTLE] = np.where(rng.random(n) < 0.3, 0.0, rng.uniform(0.4, 1.0, n))
+    states[:, S_GIMBAL:S_GIMBAL + 2] = rng.uniform(-7.0, 7.0, (n, 2))
+    return states
+
+
+@pytest.mark.parametrize("preset", ["falcon9_block5_landing", "starship_super_heavy"])
+def test_step_6dof_kernel_matches_reference(preset):
+    engine = PhysicsEngine(wind_config=WindConfig(enabled=False), geometry=get_shared_geometry(preset),
+                           aerodynamics=get_shared_aerodynamics())
+    rng = np.random.default_rng(1)
+    states = _random_states(rng, engine, 200)
+    winds = rng.normal(0.0, 8.0, (200, 2))
+    
+    for vec, (wind_x, wind_z) in zip(states, winds):
+        expected = _reference_step(engine, vec, wind_x, wind_z)
+        step_6dof_kernel(vec, engine.kernel_params, wind_x, wind_z, engine.dt)
+        np.testing.assert_allclose(vec, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_step_6dof_kernel_trajectory_matches_reference():
+    engine = PhysicsEngine(wind_config=WindConfig(enabled=False), aerodynamics=get_shared_aerodynamics())
+    vec = np.zeros(STATE_SIZE)
+    engine.pack_state(vec)
+    vec[3] = 4.0
+    vec[S_THROTTLE] = 0.6
+    vec[S_GIMBAL:S_GIMBAL + 2] = (1.5, -0.5)
+    reference = vec.copy()
+    
+    for _ in range(300):
+        reference = _reference_step(engine, reference, 3.0, -2.0)
+        step_6dof_kernel(vec, engine.kernel_params, 3.0, -2.0, engine.dt)
+    np.testing.assert_allclose(vec, reference, rtol=1e-8, atol=1e-8)
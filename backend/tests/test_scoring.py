@@ -0,0 +1,43 @@
+"""Batched scoring against the per-game score."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from game.scoring import calculate_score, calculate_scores_batch
+from physics.constants import LANDING_PAD_RADIUS, ROCKET_FUEL_MASS
+
+
+def _scores(crashed, landed, x, z, fuel, elapsed):
+    single = [
+        calculate_score(SimpleNamespace(crashed=c, landed=l, position=np.array([px, 0.0, pz]), fuel=f), t)
+        for c, l, px, pz, f, t in zip(crashed, landed, x, z, fuel, elapsed)
+    ]
+    return np.array(single), calculate_scores_batch(crashed, landed, x, z, fuel, elapsed)
+
+
+def test_batch_matches_single_over_integer_fuel():
+    fuel = np.arange(ROCKET_FUEL_MASS + 1, dtype=np.float64)
+    n = fuel.size
+    single, batch = _scores(np.zeros(n, bool), np.ones(n, bool), np.zeros(n), np.zeros(n), fuel, np.full(n, 60.0))
+    np.testing.assert_array_equal(batch, single)
+    # Fuel points are int(2000 * fuel / capacity), e.g. 34 for 51 kg
+    expected = [int(2000 * f / ROCKET_FUEL_MASS) for f in fuel]
+    np.testing.assert_array_equal(single - single[0], expected)
+    assert expected[51] == 34
+
+
+def test_batch_matches_single_over_sampled_states():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    distance = rng.uniform(0.0, 1.2 * LANDING_PAD_RADIUS, n)
+    angle = rng.uniform(0.0, 2 * np.pi, n)
+    single, batch = _scores(
+        rng.random(n) < 0.1,
+        rng.random(n) < 0.9,
+        distance * np.cos(angle),
+        distance * np.sin(angle),
+        rng.uniform(0.0, ROCKET_FUEL_MASS, n),
+        rng.uniform(10.0, 110.0, n),
+    )
+    np.testing.assert_array_equal(batch, single)
@@ -0,0 +1,80 @@
+"""Game session wire format and batched session stepping."""
+
+import orjson
+import pytest
+
+from game.pool import SessionPool
+from game.session import GameSession, GameConfig, GameMode, ORJSON_OPTIONS
+
+
+def _make_session(mode, preset="falcon9_block5_landing", now=0.0):
+    session = GameSession("test", GameConfig(mode=mode, rocket_preset=preset))
+    session.start(now)
+    return session
+
+
+def _manual_input(session, tick):
+    """Deterministic manual inputs: burn low down, occasional gimbal pulses."""
+    state = session.physics.state
+    burn = state.position[1] < 1500 and state.velocity[1] < -8
+    session.set_input(throttle=1.0 if burn else 0.0,
+                      gimbal=(0.5 if tick % 50 < 10 else 0.0, -0.3 if tick % 70 < 5 else 0.0))
+
+
+def _apply_frame(state, message):
+    """Client-side handling of a state or delta message."""
+    if message["type"] != "delta":
+        return message["data"]
+    data = dict(message["data"])
+    rocket = data.pop("rocket", {})
+    state.update(data)
+    state["rocket"].update(rocket)
+    return state
+
+
+@pytest.mark.parametrize("mode", [GameMode.AUTONOMOUS, GameMode.MANUAL])
+def test_delta_frames_rebuild_full_state(mode):
+    session = _make_session(mode)
+    client = _apply_frame(None, orjson.loads(
+        session.encode_state_message("connected", session.get_state(), session_id="test")
+    ))
+    
+    for tick in range(3000):
+        if mode == GameMode.MANUAL:
+            _manual_input(session, tick)
+        state = session.tick(now=tick / 30)
+        message = session.encode_state_update(state)
+        if message is not None:
+            client = _apply_frame(client, orjson.loads(message))
+        assert client == orjson.loads(orjson.dumps(state, option=ORJSON_OPTIONS))
+        if session.finished:
+            break
+    assert session.finished
+
+
+def test_pool_step_all_matches_tick():
+    scenarios = [
+        (GameMode.AUTONOMOUS, "falcon9_block5_landing"),
+        (GameMode.MANUAL, "falcon9_block5_landing"),
+        (GameMode.AUTONOMOUS, "starship_super_heavy"),
+        (GameMode.ASSISTED, "long_march5_core"),
+    ]
+    pooled = [_make_session(mode, preset) for mode, preset in scenarios]
+    single = [_make_session(mode, preset) for mode, preset in scenarios]
+    # One session on the simplified model, which the pool steps on its own
+    pooled[1].physics.use_6dof = single[1].physics.use_6dof = False
+    # and one on a longer time step, which the pool batches separately
+    pooled[2].physics.dt = single[2].physics.dt = 2 * single[2].physics.dt
+    pool = SessionPool(capacity=2)
+    
+    for tick in range(3000):
+        now = tick / 30
+        for session in pooled + single:
+            if session.config.mode == GameMode.MANUAL:
+                _manual_input(session, tick)
+        pooled_states = pool.step_all(pooled, now)
+        single_states = [session.tick(now) for session in single]
+        assert pooled_states == single_states
+        if all(session.finished for session in single):
+            break
+    assert all(session.finished for session in pooled)
@@ -3,6 +3,23 @@ import useGameStore from '../stores/gameStore'
 import useLanguageStore from '../stores/languageStore'
 import { useTranslation } from '../i18n/translations'
 
+// Flight review data points arrive column-wise ({ time: [...], altitude: [...] })
+// Rebuild per-sample objects for the chart and telemetry views
+function columnsToRows(columns) {
+  if (!columns) return []
+  const keys = Object.keys(columns)
+  const length = keys.length > 0 ? columns[keys[0]].length : 0
+  const rows = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const row = {}
+    for (const key of keys) {
+      row[key] = columns[key][i]
+    }
+    rows[i] = row
+  }
+  return rows
+}
+
 function FlightReview({ onClose, onTryAgain }) {
   const { gameState } = useGameStore()
   const { language } = useLanguageStore()
@@ -15,7 +32,8 @@ function FlightReview({ onClose, onTryAgain }) {
     return null
   }
   
-  const { statistics, events, data_points } = flightData
+  const { statistics, events } = flightData
+  const data_points = columnsToRows(flightData.data_points)
   
   // Handle try again - close modal and reset game
   const handleTryAgain = () => {
@@ -6,6 +6,9 @@ const INITIAL_ALTITUDE = 5000  // m
 const INITIAL_VELOCITY = -180  // m/s
 const DRY_MASS = 22200  // kg
 
+// Decoder for binary (UTF-8 JSON) state frames
+const textDecoder = new TextDecoder()
+
 const useGameStore = create((set, get) => ({
   // Connection state
   connected: false,
@@ -174,6 +177,7 @@ const useGameStore = create((set, get) => ({
     
     console.log('Connecting to WebSocket:', wsUrl)
     const ws = new WebSocket(wsUrl)
+    ws.binaryType = 'arraybuffer'
     
     // Enable reconnection when connecting
     set({ shouldReconnect: true })
@@ -185,9 +189,9 @@ const useGameStore = create((set, get) => ({
     
     ws.onmessage = (event) => {
       try {
-        console.log('[WS] Received message:', event.data.substring(0, 100) + '...')
-        const message = JSON.parse(event.data)
-        console.log('[WS] Message type:', message.type)
+        // Server messages arrive as binary (UTF-8 JSON) frames; text is still accepted
+        const text = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data)
+        const message = JSON.parse(text)
         
         if (message.type === 'state' || message.type === 'connected' || 
             message.type === 'started' || message.type === 'reset') {
@@ -197,8 +201,19 @@ const useGameStore = create((set, get) => ({
               gameState: message.data,
               prevVelocity: currentState.rocket.velocity
             })
-            console.log('[WS] State updated successfully')
           }
+        } else if (message.type === 'delta') {
+          // Only changed fields are sent; merge them into the current state
+          const currentState = get().gameState
+          const { rocket, ...changed } = message.data
+          set({
+            gameState: {
+              ...currentState,
+              ...changed,
+              rocket: rocket ? { ...currentState.rocket, ...rocket } : currentState.rocket,
+            },
+            prevVelocity: currentState.rocket.velocity
+          })
         }
       } catch (error) {
         console.error('[WS] Error processing message:', error)
@@ -247,7 +247,7 @@ Type=simple
 User=$USER
 WorkingDirectory=$BACKEND_DIR
 Environment="PATH=$BACKEND_DIR/venv/bin"
-ExecStart=$BACKEND_DIR/venv/bin/uvicorn main:app --host 0.0.0.0 --port 8001
+ExecStart=$BACKEND_DIR/venv/bin/uvicorn main:app --host 0.0.0.0 --port 8001 --loop auto --ws-per-message-deflate false
 Restart=always
 RestartSec=10
 
@@ -81,7 +81,7 @@ else
 fi
 
 # Start backend with 0.0.0.0 to allow external access
-nohup python -m uvicorn main:app --host 0.0.0.0 --port 8001 > /tmp/rocket-backend.log 2>&1 &
+nohup python -m uvicorn main:app --host 0.0.0.0 --port 8001 --loop auto --ws-per-message-deflate false > /tmp/rocket-backend.log 2>&1 &
 BACKEND_PID=$!
 echo -e "${GREEN}✓ Backend started (PID: $BACKEND_PID)${NC}"
 